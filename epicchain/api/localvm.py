@@ -0,0 +1,2172 @@
+"""
+A local, read-only EpicChain Virtual Machine interpreter.
+
+Executes scripts (e.g. those created by the wrappers in :mod:`epicchain.api.wrappers`) in process instead of sending
+them to a node via the `invokescript` RPC method. Contract state and storage are read from a :class:`Snapshot`.
+Storage writes are kept local to the :class:`ApplicationEngine` and discarded afterwards, i.e. the results match those
+of a test invocation.
+
+Example:
+    snapshot = localvm.MemorySnapshot()
+    snapshot.add_contract(contract_state)
+    snapshot.put_storage(contract_state.hash, b"\x01", b"\x02")
+
+    result = localvm.test_invoke(script, snapshot)
+    result.state  # "HALT"
+
+Notes:
+    - Native contracts have no script that can be interpreted. Supply their behaviour via `native_contracts`.
+    - Syscalls without a default handler fault the engine unless one is registered with
+      :meth:`ApplicationEngine.register_syscall`.
+    - Only `THROW` raises catchable exceptions, all other errors fault the engine.
+    - The stack size and contract permissions are not enforced.
+"""
+from __future__ import annotations
+import math
+import random
+import time
+from collections.abc import Sequence, Iterator, Callable
+from enum import IntEnum
+from typing import Optional, Any, Protocol
+from epicchain import vm, settings
+from epicchain.api import noderpc
+from epicchain.contracts import contract, callflags, abi, utils as contractutils
+from epicchain.core import types, hashing
+from epicchain.network.payloads import verification
+
+#: Default `xpp_limit`, matching the default `MaxGasInvoke` of a node's RPC server.
+DEFAULT_XPP_LIMIT = 20_00000000
+#: Default `exec_fee_factor`, the multiplier applied to all opcode and syscall prices.
+DEFAULT_EXEC_FEE_FACTOR = 30
+
+MAX_ITEM_SIZE = 1024 * 1024
+MAX_INVOCATION_STACK_SIZE = 1024
+MAX_TRY_NESTING_DEPTH = 16
+MAX_SHIFT = 256
+MAX_INTEGER_SIZE = 32
+
+#: Handler for a syscall. Pops its arguments from and pushes its results onto the engine's current evaluation stack.
+SyscallHandler = Callable[["ApplicationEngine"], None]
+#: Implementation of a (native) contract, called with the engine, the method name and the arguments. Returns the
+#: result as VM value, see :class:`ApplicationEngine`.
+NativeContract = Callable[["ApplicationEngine", str, list], Any]
+
+
+class VMFault(Exception):
+    """
+    Raised when the engine faults. Not catchable by the executing script.
+    """
+
+
+class _VMThrow(Exception):
+    pass
+
+
+class Struct(list):
+    """
+    VM `Struct`. Compared by value, copied when stored in another compound type.
+    """
+
+    def clone(self) -> Struct:
+        return Struct(item.clone() if type(item) is Struct else item for item in self)
+
+
+class Map:
+    """
+    VM `Map`. Keys are `bool`, `int` or `bytes` and retain their type, i.e. `True` and `1` are different keys.
+    """
+
+    def __init__(self):
+        self._items: dict[tuple[type, Any], tuple[Any, Any]] = {}
+
+    @staticmethod
+    def _key(key) -> tuple[type, Any]:
+        t = type(key)
+        if t not in (bool, int, bytes):
+            raise VMFault(f"Invalid map key type {_type_name(key)}")
+        return t, key
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, key):
+        return self._key(key) in self._items
+
+    def __getitem__(self, key):
+        try:
+            return self._items[self._key(key)][1]
+        except KeyError:
+            raise VMFault(f"Key {key!r} not found in Map") from None
+
+    def __setitem__(self, key, value):
+        self._items[self._key(key)] = (key, value)
+
+    def remove(self, key) -> None:
+        self._items.pop(self._key(key), None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def keys(self) -> list:
+        return [k for k, _ in self._items.values()]
+
+    def values(self) -> list:
+        return [v for _, v in self._items.values()]
+
+    def items(self) -> list[tuple[Any, Any]]:
+        return list(self._items.values())
+
+
+class Pointer:
+    """
+    VM `Pointer` to a position in a script.
+    """
+
+    __slots__ = ("script", "position")
+
+    def __init__(self, script: bytes, position: int):
+        self.script = script
+        self.position = position
+
+
+class StorageContext:
+    """
+    Storage context interop object, as returned by `System.Storage.GetContext`.
+    """
+
+    __slots__ = ("script_hash", "read_only")
+
+    def __init__(self, script_hash: types.UInt160, read_only: bool):
+        self.script_hash = script_hash
+        self.read_only = read_only
+
+
+class FindOptions(IntEnum):
+    """
+    Options for `System.Storage.Find`.
+    """
+
+    NONE = 0
+    KEYS_ONLY = 0x01
+    REMOVE_PREFIX = 0x02
+    VALUES_ONLY = 0x04
+    DESERIALIZE_VALUES = 0x08
+    PICK_FIELD0 = 0x10
+    PICK_FIELD1 = 0x20
+    BACKWARDS = 0x80
+
+
+class StorageIterator:
+    """
+    Iterator interop object, as returned by `System.Storage.Find`.
+    """
+
+    def __init__(
+        self, entries: list[tuple[bytes, bytes]], prefix_length: int, options: int
+    ):
+        self._entries = entries
+        self._position = -1
+        self._prefix_length = prefix_length
+        self._options = options
+
+    def next(self) -> bool:
+        if self._position < len(self._entries):
+            self._position += 1
+        return self._position < len(self._entries)
+
+    def value(self):
+        if not 0 <= self._position < len(self._entries):
+            raise VMFault("Iterator has no current value")
+        return self._convert(self._entries[self._position])
+
+    def remaining(self) -> list:
+        """
+        Return all values the iterator has not yet returned, without advancing it.
+        """
+        return [self._convert(entry) for entry in self._entries[self._position + 1 :]]
+
+    def _convert(self, entry: tuple[bytes, bytes]):
+        key, value = entry
+        if self._options & FindOptions.REMOVE_PREFIX:
+            key = key[self._prefix_length :]
+        if self._options & FindOptions.KEYS_ONLY:
+            return key
+        if self._options & FindOptions.VALUES_ONLY:
+            return value
+        return Struct([key, value])
+
+
+class Snapshot(Protocol):
+    """
+    Read access to the chain state the engine executes against.
+    """
+
+    def get_contract(
+        self, script_hash: types.UInt160
+    ) -> Optional[contract.ContractState]:
+        """
+        Return the contract with the given script hash or `None` if it does not exist.
+        """
+
+    def get_storage(self, script_hash: types.UInt160, key: bytes) -> Optional[bytes]:
+        """
+        Return the value stored under `key` by the given contract or `None` if it does not exist.
+        """
+
+    def find_storage(
+        self, script_hash: types.UInt160, prefix: bytes
+    ) -> Iterator[tuple[bytes, bytes]]:
+        """
+        Return all key/value pairs of the given contract of which the key starts with `prefix`, ordered by key.
+        """
+
+
+class MemorySnapshot:
+    """
+    A :class:`Snapshot` holding all state in memory, e.g. to cache results obtained from a node.
+    """
+
+    def __init__(self):
+        self._contracts: dict[types.UInt160, contract.ContractState] = {}
+        self._storage: dict[types.UInt160, dict[bytes, bytes]] = {}
+
+    def add_contract(self, contract_state: contract.ContractState) -> None:
+        self._contracts[contract_state.hash] = contract_state
+
+    def get_contract(
+        self, script_hash: types.UInt160
+    ) -> Optional[contract.ContractState]:
+        return self._contracts.get(script_hash, None)
+
+    def put_storage(self, script_hash: types.UInt160, key: bytes, value: bytes) -> None:
+        self._storage.setdefault(script_hash, {})[bytes(key)] = bytes(value)
+
+    def delete_storage(self, script_hash: types.UInt160, key: bytes) -> None:
+        self._storage.get(script_hash, {}).pop(bytes(key), None)
+
+    def get_storage(self, script_hash: types.UInt160, key: bytes) -> Optional[bytes]:
+        return self._storage.get(script_hash, {}).get(key, None)
+
+    def find_storage(
+        self, script_hash: types.UInt160, prefix: bytes
+    ) -> Iterator[tuple[bytes, bytes]]:
+        storage = self._storage.get(script_hash, {})
+        for key in sorted(storage):
+            if key.startswith(prefix):
+                yield key, storage[key]
+
+
+class _HandlerState(IntEnum):
+    TRY = 0
+    CATCH = 1
+    FINALLY = 2
+
+
+class _ExceptionHandler:
+    __slots__ = ("catch_ip", "finally_ip", "end_ip", "state")
+
+    def __init__(self, catch_ip: int, finally_ip: int):
+        self.catch_ip = catch_ip
+        self.finally_ip = finally_ip
+        self.end_ip = -1
+        self.state = _HandlerState.TRY
+
+
+class _SharedState:
+    # state shared between a context and the contexts it creates with CALL
+    __slots__ = (
+        "script",
+        "script_hash",
+        "evaluation_stack",
+        "static_fields",
+        "call_flags",
+        "calling_script_hash",
+        "tokens",
+    )
+
+    def __init__(
+        self,
+        script: bytes,
+        script_hash: Optional[types.UInt160],
+        call_flags: callflags.CallFlags,
+    ):
+        self.script = script
+        self.script_hash = script_hash
+        self.evaluation_stack: list = []
+        self.static_fields: Optional[list] = None
+        self.call_flags = call_flags
+        self.calling_script_hash: Optional[types.UInt160] = None
+        self.tokens: Sequence = []
+
+
+class ExecutionContext:
+    """
+    A script being executed, with its own instruction pointer, slots and exception handlers.
+    """
+
+    __slots__ = (
+        "shared",
+        "ip",
+        "local_variables",
+        "arguments",
+        "try_stack",
+        "rvcount",
+        "dynamic_call",
+    )
+
+    def __init__(self, shared: _SharedState, ip: int = 0, rvcount: int = -1):
+        self.shared = shared
+        self.ip = ip
+        self.local_variables: Optional[list] = None
+        self.arguments: Optional[list] = None
+        self.try_stack: list[_ExceptionHandler] = []
+        self.rvcount = rvcount
+        self.dynamic_call = False
+
+    @property
+    def script(self) -> bytes:
+        return self.shared.script
+
+    @property
+    def evaluation_stack(self) -> list:
+        return self.shared.evaluation_stack
+
+    @property
+    def script_hash(self) -> types.UInt160:
+        if self.shared.script_hash is None:
+            self.shared.script_hash = types.UInt160(hashing.hash160(self.shared.script))
+        return self.shared.script_hash
+
+    def clone(self, ip: int) -> ExecutionContext:
+        return ExecutionContext(self.shared, ip)
+
+
+def _type_name(item) -> str:
+    return _item_type(item).name
+
+
+def _item_type(item) -> vm.StackItemType:
+    t = type(item)
+    if item is None:
+        return vm.StackItemType.ANY
+    if t is bool:
+        return vm.StackItemType.BOOLEAN
+    if t is int:
+        return vm.StackItemType.INTEGER
+    if t is bytes:
+        return vm.StackItemType.BYTESTRING
+    if t is bytearray:
+        return vm.StackItemType.BUFFER
+    if t is Struct:
+        return vm.StackItemType.STRUCT
+    if t is list:
+        return vm.StackItemType.ARRAY
+    if t is Map:
+        return vm.StackItemType.MAP
+    if t is Pointer:
+        return vm.StackItemType.POINTER
+    return vm.StackItemType.INTEROPINTERFACE
+
+
+_VALID_TYPES = frozenset(vm.StackItemType)
+
+
+def _int_to_bytes(value: int) -> bytes:
+    if value == 0:
+        return b""
+    length = ((value if value > 0 else ~value).bit_length() + 8) // 8
+    return value.to_bytes(length, "little", signed=True)
+
+
+def _check_int(value: int) -> int:
+    if (value if value >= 0 else ~value).bit_length() >= MAX_INTEGER_SIZE * 8:
+        raise VMFault("Integer overflow, result exceeds 256 bits")
+    return value
+
+
+def _to_int(item) -> int:
+    t = type(item)
+    if t is int:
+        return item
+    if t is bool:
+        return int(item)
+    if t is bytes:
+        if len(item) > MAX_INTEGER_SIZE:
+            raise VMFault(f"Can not convert ByteString of {len(item)} bytes to Integer")
+        return int.from_bytes(item, "little", signed=True)
+    raise VMFault(f"Can not convert {_type_name(item)} to Integer")
+
+
+def _to_bool(item) -> bool:
+    t = type(item)
+    if t is bool:
+        return item
+    if item is None:
+        return False
+    if t is int:
+        return item != 0
+    if t is bytes:
+        if len(item) > MAX_INTEGER_SIZE:
+            raise VMFault(f"Can not convert ByteString of {len(item)} bytes to Boolean")
+        return any(item)
+    return True
+
+
+def _to_bytes(item) -> bytes:
+    t = type(item)
+    if t is bytes:
+        return item
+    if t is bytearray:
+        return bytes(item)
+    if t is int:
+        return _int_to_bytes(item)
+    if t is bool:
+        return b"\x01" if item else b"\x00"
+    raise VMFault(f"Can not convert {_type_name(item)} to ByteString")
+
+
+def _to_primitive(item):
+    if type(item) not in (bool, int, bytes):
+        raise VMFault(f"Expected a primitive type, got {_type_name(item)}")
+    return item
+
+
+def _equals(a, b) -> bool:
+    if a is b:
+        return True
+    ta = type(a)
+    if ta is not type(b):
+        return False
+    if ta in (bytes, int, bool):
+        return a == b
+    if ta is Struct:
+        return len(a) == len(b) and all(map(_equals, a, b))
+    return False
+
+
+def _div(a: int, b: int) -> int:
+    # BigInteger division truncates towards zero
+    q = abs(a) // abs(b)
+    return q if (a < 0) == (b < 0) else -q
+
+
+def _mod(a: int, b: int) -> int:
+    # the remainder takes the sign of the dividend
+    r = abs(a) % abs(b)
+    return r if a >= 0 else -r
+
+
+def _convert(item, target: int):
+    if item is None:
+        return None
+    if _item_type(item) == target:
+        return item
+    if target == vm.StackItemType.BOOLEAN:
+        return _to_bool(item)
+    if target == vm.StackItemType.INTEGER:
+        if type(item) is bytearray:
+            item = bytes(item)
+        return _to_int(item)
+    if target == vm.StackItemType.BYTESTRING:
+        return _to_bytes(item)
+    if target == vm.StackItemType.BUFFER:
+        return bytearray(_to_bytes(item))
+    if target == vm.StackItemType.ARRAY and type(item) is Struct:
+        return list(item)
+    if target == vm.StackItemType.STRUCT and type(item) is list:
+        return Struct(item)
+    raise VMFault(
+        f"Can not convert {_type_name(item)} to {vm.StackItemType(target).name}"
+    )
+
+
+def _opcode_prices() -> list[int]:
+    op = vm.OpCode
+    prices = [0] * 256
+    groups = {
+        1
+        << 0: [
+            *range(op.PUSHINT8, op.PUSHINT64 + 1),
+            op.PUSHT,
+            op.PUSHF,
+            op.PUSHNULL,
+            *range(op.PUSHM1, op.PUSH16 + 1),
+            op.NOP,
+            op.ASSERT,
+        ],
+        1
+        << 1: [
+            *range(op.JMP, op.JMPLE_L + 1),
+            op.DEPTH,
+            op.DROP,
+            op.NIP,
+            op.DUP,
+            op.OVER,
+            op.PICK,
+            op.TUCK,
+            op.SWAP,
+            op.ROT,
+            op.REVERSE3,
+            op.REVERSE4,
+            *range(op.LDSFLD0, op.STARG + 1),
+            op.ISNULL,
+            op.ISTYPE,
+        ],
+        1
+        << 2: [
+            op.PUSHINT128,
+            op.PUSHINT256,
+            op.PUSHA,
+            *range(op.TRY, op.ENDFINALLY + 1),
+            op.INVERT,
+            op.SIGN,
+            op.ABS,
+            op.NEGATE,
+            op.INC,
+            op.DEC,
+            op.NOT,
+            op.NZ,
+            op.SIZE,
+        ],
+        1
+        << 3: [
+            op.PUSHDATA1,
+            op.AND,
+            op.OR,
+            op.XOR,
+            op.ADD,
+            op.SUB,
+            op.MUL,
+            op.DIV,
+            op.MOD,
+            op.SHL,
+            op.SHR,
+            op.BOOLAND,
+            op.BOOLOR,
+            *range(op.NUMEQUAL, op.WITHIN + 1),
+            op.NEWMAP,
+        ],
+        1
+        << 4: [
+            op.XDROP,
+            op.CLEAR,
+            op.ROLL,
+            op.REVERSEN,
+            op.INITSSLOT,
+            op.NEWARRAY0,
+            op.NEWSTRUCT0,
+            op.KEYS,
+            op.REMOVE,
+            op.CLEARITEMS,
+            op.POPITEM,
+        ],
+        1 << 5: [op.EQUAL, op.NOTEQUAL, op.MODMUL],
+        1 << 6: [op.INITSLOT, op.POW, op.SQRT, op.HASKEY, op.PICKITEM],
+        1 << 8: [op.NEWBUFFER],
+        1
+        << 9: [
+            op.PUSHDATA2,
+            op.CALL,
+            op.CALL_L,
+            op.CALLA,
+            op.THROW,
+            op.NEWARRAY,
+            op.NEWARRAY_T,
+            op.NEWSTRUCT,
+        ],
+        1
+        << 11: [
+            op.MEMCPY,
+            op.CAT,
+            op.SUBSTR,
+            op.LEFT,
+            op.RIGHT,
+            op.MODPOW,
+            op.PACKMAP,
+            op.PACKSTRUCT,
+            op.PACK,
+            op.UNPACK,
+        ],
+        1 << 12: [op.PUSHDATA4],
+        1 << 13: [op.VALUES, op.APPEND, op.SETITEM, op.REVERSEITEMS, op.CONVERT],
+        1 << 15: [op.CALLT],
+    }
+    for price, opcodes in groups.items():
+        for opcode in opcodes:
+            prices[opcode] = price
+    return prices
+
+
+_OPCODE_PRICES = _opcode_prices()
+
+_SYSCALL_PRICES = {
+    vm.Syscalls.SYSTEM_CONTRACT_CALL.number: 1 << 15,
+    vm.Syscalls.SYSTEM_CONTRACT_GET_CALL_FLAGS.number: 1 << 10,
+    vm.Syscalls.SYSTEM_CONTRACT_CREATE_STANDARD_ACCOUNT.number: 1 << 8,
+    vm.Syscalls.SYSTEM_CRYPTO_CHECK_STANDARD_ACCOUNT.number: 1 << 15,
+    vm.Syscalls.SYSTEM_ITERATOR_NEXT.number: 1 << 15,
+    vm.Syscalls.SYSTEM_ITERATOR_VALUE.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_PLATFORM.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_CURRENT_SIGNERS.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_NETWORK.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_ADDRESS_VERSION.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_TRIGGER.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_TIME.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_SCRIPT_CONTAINER.number: 1 << 3,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_EXECUTING_SCRIPT_HASH.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_CALLING_SCRIPT_HASH.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_ENTRY_SCRIPT_HASH.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_CHECK_WITNESS.number: 1 << 10,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_INVOCATION_COUNTER.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_LOG.number: 1 << 15,
+    vm.Syscalls.SYSTEM_RUNTIME_NOTIFY.number: 1 << 15,
+    vm.Syscalls.SYSTEM_RUNTIME_GET_NOTIFICATIONS.number: 1 << 12,
+    vm.Syscalls.SYSTEM_RUNTIME_EPICPULSE_LEFT.number: 1 << 4,
+    vm.Syscalls.SYSTEM_RUNTIME_BURN_EPICPULSE.number: 1 << 4,
+    vm.Syscalls.SYSTEM_STORAGE_GET_CONTEXT.number: 1 << 4,
+    vm.Syscalls.SYSTEM_STORAGE_GET_READ_ONLY_CONTEXT.number: 1 << 4,
+    vm.Syscalls.SYSTEM_STORAGE_AS_READ_ONLY.number: 1 << 4,
+    vm.Syscalls.SYSTEM_STORAGE_GET.number: 1 << 15,
+    vm.Syscalls.SYSTEM_STORAGE_FIND.number: 1 << 15,
+    vm.Syscalls.SYSTEM_STORAGE_PUT.number: 1 << 15,
+    vm.Syscalls.SYSTEM_STORAGE_DELETE.number: 1 << 15,
+}
+
+_TRIGGER_APPLICATION = 0x40
+
+
+class ApplicationEngine:
+    """
+    Executes a script against a :class:`Snapshot`.
+
+    VM values are represented by Python objects: `None` (Null), `bool`, `int`, `bytes` (ByteString), `bytearray`
+    (Buffer), `list` (Array), :class:`Struct`, :class:`Map`, :class:`Pointer`. Any other object is an interop
+    interface. Syscall handlers and native contracts consume and produce values of these types.
+    """
+
+    def __init__(
+        self,
+        script: bytes,
+        snapshot: Optional[Snapshot] = None,
+        signers: Optional[Sequence[verification.Signer]] = None,
+        native_contracts: Optional[dict[types.UInt160, NativeContract]] = None,
+        xpp_limit: int = DEFAULT_XPP_LIMIT,
+        exec_fee_factor: int = DEFAULT_EXEC_FEE_FACTOR,
+    ):
+        """
+        Args:
+            script: the script to execute.
+            snapshot: the chain state to read contracts and storage from.
+            signers: accounts that pass `System.Runtime.CheckWitness`.
+            native_contracts: implementations of contracts that have no interpretable script.
+            xpp_limit: the maximum xpp the execution may consume.
+            exec_fee_factor: the multiplier applied to all opcode and syscall prices.
+        """
+        self.script = bytes(script)
+        self.snapshot = snapshot
+        self.signers = [] if signers is None else list(signers)
+        self.native_contracts = (
+            {} if native_contracts is None else dict(native_contracts)
+        )
+        self.xpp_limit = xpp_limit
+        self.exec_fee_factor = exec_fee_factor
+        self.xpp_consumed = 0
+        self.state = vm.VMState.NONE
+        self.exception: Optional[str] = None
+        self.invocation_stack: list[ExecutionContext] = []
+        self.result_stack: list = []
+        self.notifications: list[tuple[types.UInt160, str, list]] = []
+        self.logs: list[tuple[types.UInt160, str]] = []
+        self._invocation_counter: dict[types.UInt160, int] = {}
+        self._storage_changes: dict[tuple[types.UInt160, bytes], Optional[bytes]] = {}
+        self._uncaught: Any = None
+        self._syscalls: dict[int, SyscallHandler] = dict(_DEFAULT_SYSCALLS)
+
+    def register_syscall(
+        self, syscall: vm.Syscall | int, handler: SyscallHandler
+    ) -> None:
+        """
+        Register (or replace) the handler of a syscall.
+
+        Args:
+            syscall: the syscall or its number.
+            handler: the function executing the syscall.
+        """
+        number = syscall.number if isinstance(syscall, vm.Syscall) else syscall
+        self._syscalls[number] = handler
+
+    @property
+    def current_context(self) -> ExecutionContext:
+        return self.invocation_stack[-1]
+
+    def push(self, item) -> None:
+        """
+        Push `item` onto the evaluation stack of the current context.
+        """
+        self.invocation_stack[-1].shared.evaluation_stack.append(item)
+
+    def pop(self):
+        """
+        Pop the top item of the evaluation stack of the current context.
+        """
+        try:
+            return self.invocation_stack[-1].shared.evaluation_stack.pop()
+        except IndexError:
+            raise VMFault("Evaluation stack is empty") from None
+
+    def pop_int(self) -> int:
+        return _to_int(self.pop())
+
+    def pop_bool(self) -> bool:
+        return _to_bool(self.pop())
+
+    def pop_bytes(self) -> bytes:
+        return _to_bytes(self.pop())
+
+    def pop_str(self) -> str:
+        return self.pop_bytes().decode("utf-8", "strict")
+
+    def add_xpp(self, amount: int) -> None:
+        """
+        Consume `amount` xpp. Faults the engine if the limit is exceeded.
+        """
+        self.xpp_consumed += amount
+        if self.xpp_consumed > self.xpp_limit:
+            raise VMFault("Insufficient XPP.")
+
+    def execute(self) -> noderpc.ExecutionResultResponse:
+        """
+        Execute the script and return the results in the same format as the `invokescript` RPC method.
+        """
+        if not self.invocation_stack and self.state == vm.VMState.NONE:
+            self._load(self.script, callflags.CallFlags.ALL)
+        try:
+            step = self._step
+            while self.invocation_stack:
+                step()
+            self.state = vm.VMState.HALT
+        except Exception as e:
+            self.state = vm.VMState.FAULT
+            self.exception = str(e) or e.__class__.__name__
+        return self._result()
+
+    def call_contract(
+        self,
+        script_hash: types.UInt160,
+        method: str,
+        flags: callflags.CallFlags,
+        args: list,
+    ) -> None:
+        """
+        Call `method` of the contract with `script_hash`, as done by `System.Contract.Call`.
+        """
+        if method.startswith("_"):
+            raise VMFault(f"Invalid method name: {method}")
+        native = self.native_contracts.get(script_hash, None)
+        if native is not None:
+            self._count_invocation(script_hash)
+            self.push(native(self, method, args))
+            return
+
+        contract_state = (
+            None if self.snapshot is None else self.snapshot.get_contract(script_hash)
+        )
+        if contract_state is None:
+            raise VMFault(f"Called Contract Does Not Exist: {script_hash}")
+        md = contract_state.manifest.abi.get_method(method, len(args))
+        if md is None:
+            raise VMFault(
+                f'Method "{method}" with {len(args)} parameter(s) doesn\'t exist in the contract {script_hash}.'
+            )
+        calling = self.invocation_stack[-1]
+        flags &= calling.shared.call_flags
+        if md.safe:
+            flags &= ~(
+                callflags.CallFlags.WRITE_STATES | callflags.CallFlags.ALLOW_NOTIFY
+            )
+
+        rvcount = 0 if md.return_type == abi.ContractParameterType.VOID else 1
+        context = self._load(
+            contract_state.script, flags, script_hash, md.offset, rvcount
+        )
+        context.dynamic_call = True
+        context.shared.calling_script_hash = calling.script_hash
+        context.shared.tokens = contract_state.xef.tokens
+        stack = context.shared.evaluation_stack
+        for arg in reversed(args):
+            stack.append(arg)
+
+        initialize = contract_state.manifest.abi.get_method("_initialize", 0)
+        if initialize is not None:
+            self.invocation_stack.append(context.clone(initialize.offset))
+
+    def _load(
+        self,
+        script: bytes,
+        flags: callflags.CallFlags,
+        script_hash: Optional[types.UInt160] = None,
+        ip: int = 0,
+        rvcount: int = -1,
+    ) -> ExecutionContext:
+        if len(self.invocation_stack) >= MAX_INVOCATION_STACK_SIZE:
+            raise VMFault("MaxInvocationStackSize exceed")
+        context = ExecutionContext(
+            _SharedState(script, script_hash, flags), ip, rvcount
+        )
+        self.invocation_stack.append(context)
+        self._count_invocation(context.script_hash)
+        return context
+
+    def _count_invocation(self, script_hash: types.UInt160) -> None:
+        self._invocation_counter[script_hash] = (
+            self._invocation_counter.get(script_hash, 0) + 1
+        )
+
+    def _step(self) -> None:
+        context = self.invocation_stack[-1]
+        script = context.shared.script
+        ip = context.ip
+        opcode: int
+        if ip >= len(script):
+            opcode = vm.OpCode.RET
+            operand = b""
+        else:
+            opcode = script[ip]
+            size = vm.OPERAND_SIZES[opcode]
+            start = ip + 1
+            if size < 0:
+                end = start - size
+                if end > len(script):
+                    raise VMFault(f"Operand of instruction at {ip} exceeds the script")
+                start = end
+                size = int.from_bytes(script[ip + 1 : end], "little")
+            end = start + size
+            if end > len(script):
+                raise VMFault(f"Operand of instruction at {ip} exceeds the script")
+            operand = script[start:end]
+            context.ip = end
+
+        self.xpp_consumed += _OPCODE_PRICES[opcode] * self.exec_fee_factor
+        if self.xpp_consumed > self.xpp_limit:
+            raise VMFault("Insufficient XPP.")
+        handler = _DISPATCH[opcode]
+        if handler is None:
+            raise VMFault(f"Invalid opcode {opcode:#04x} at {ip}")
+        try:
+            handler(self, context, opcode, operand, ip)
+        except IndexError:
+            raise VMFault(
+                f"Stack or index out of range executing {vm.OpCode(opcode).name} at {ip}"
+            ) from None
+        except _VMThrow:
+            self._handle_exception()
+
+    def _jump(self, context: ExecutionContext, position: int) -> None:
+        if not 0 <= position < len(context.shared.script):
+            raise VMFault(f"Jump out of range for position: {position}")
+        context.ip = position
+
+    def _throw(self, item) -> None:
+        self._uncaught = item
+        raise _VMThrow()
+
+    def _handle_exception(self) -> None:
+        stack = self.invocation_stack
+        pop = 0
+        for context in reversed(stack):
+            try_stack = context.try_stack
+            while try_stack:
+                handler = try_stack[-1]
+                if handler.state == _HandlerState.FINALLY or (
+                    handler.state == _HandlerState.CATCH and handler.finally_ip < 0
+                ):
+                    try_stack.pop()
+                    continue
+                del stack[len(stack) - pop :]
+                if handler.state == _HandlerState.TRY and handler.catch_ip >= 0:
+                    handler.state = _HandlerState.CATCH
+                    context.shared.evaluation_stack.append(self._uncaught)
+                    context.ip = handler.catch_ip
+                    self._uncaught = None
+                else:
+                    handler.state = _HandlerState.FINALLY
+                    context.ip = handler.finally_ip
+                return
+            pop += 1
+        uncaught = self._uncaught
+        message = (
+            uncaught.decode("utf-8", "replace")
+            if type(uncaught) is bytes
+            else _type_name(uncaught)
+        )
+        raise VMFault(f"An unhandled exception was thrown. {message}")
+
+    def _syscall(self, number: int) -> None:
+        syscall = vm.Syscalls.get_by_number(number)
+        handler = self._syscalls.get(number, None)
+        if handler is None:
+            name = number if syscall is None else syscall.name
+            raise VMFault(f"Syscall not supported: {name}")
+        if syscall is not None:
+            required = syscall.required_callflags
+            if self.invocation_stack[-1].shared.call_flags & required != required:
+                raise VMFault(
+                    f"Cannot call this SYSCALL with the flag {self.invocation_stack[-1].shared.call_flags!r}."
+                )
+        self.add_xpp(_SYSCALL_PRICES.get(number, 0) * self.exec_fee_factor)
+        handler(self)
+
+    def _get_storage(self, script_hash: types.UInt160, key: bytes) -> Optional[bytes]:
+        # a pending change of `None` is a deletion
+        change_key = (script_hash, key)
+        if change_key in self._storage_changes:
+            return self._storage_changes[change_key]
+        if self.snapshot is None:
+            return None
+        return self.snapshot.get_storage(script_hash, key)
+
+    def _find_storage(
+        self, script_hash: types.UInt160, prefix: bytes
+    ) -> list[tuple[bytes, bytes]]:
+        entries = (
+            {}
+            if self.snapshot is None
+            else dict(self.snapshot.find_storage(script_hash, prefix))
+        )
+        for (hash_, key), value in self._storage_changes.items():
+            if hash_ == script_hash and key.startswith(prefix):
+                if value is None:
+                    entries.pop(key, None)
+                else:
+                    entries[key] = value
+        return sorted(entries.items())
+
+    def _result(self) -> noderpc.ExecutionResultResponse:
+        try:
+            stack = list(map(_to_stack_item, self.result_stack))
+            exception = self.exception
+        except ValueError as e:
+            stack = []
+            exception = self.exception or str(e)
+        notifications = [
+            noderpc.Notification(script_hash, name, _to_stack_item(state))
+            for script_hash, name, state in self.notifications
+        ]
+        return noderpc.ExecutionResultResponse(
+            self.state.name,
+            self.xpp_consumed,
+            exception,
+            stack,
+            self.script,
+            notifications,
+        )
+
+
+def test_invoke(
+    script: bytes,
+    snapshot: Optional[Snapshot] = None,
+    signers: Optional[Sequence[verification.Signer]] = None,
+    native_contracts: Optional[dict[types.UInt160, NativeContract]] = None,
+) -> noderpc.ExecutionResultResponse:
+    """
+    Execute `script` locally. Equivalent to :meth:`~epicchain.api.noderpc.EpicRpcClient.invoke_script`.
+
+    Args:
+        script: the script to execute.
+        snapshot: the chain state to read contracts and storage from.
+        signers: accounts that pass `System.Runtime.CheckWitness`.
+        native_contracts: implementations of contracts that have no interpretable script.
+    """
+    return ApplicationEngine(script, snapshot, signers, native_contracts).execute()
+
+
+def _to_stack_item(item, _in_progress: Optional[set[int]] = None) -> noderpc.StackItem:
+    t = type(item)
+    if item is None:
+        return noderpc.StackItem(noderpc.StackItemType.ANY, None)
+    if t is bool:
+        return noderpc.StackItem(noderpc.StackItemType.BOOL, item)
+    if t is int:
+        return noderpc.StackItem(noderpc.StackItemType.INTEGER, item)
+    if t is bytes:
+        return noderpc.StackItem(noderpc.StackItemType.BYTE_STRING, item)
+    if t is bytearray:
+        return noderpc.StackItem(noderpc.StackItemType.BUFFER, bytes(item))
+    if t is Pointer:
+        return noderpc.StackItem(noderpc.StackItemType.POINTER, item.position)
+    if t is StorageIterator:
+        return noderpc.StackItem(
+            noderpc.StackItemType.INTEROP_INTERFACE,
+            [_to_stack_item(value) for value in item.remaining()],
+        )
+    if t not in (list, Struct, Map):
+        return noderpc.StackItem(noderpc.StackItemType.INTEROP_INTERFACE, None)
+
+    in_progress = set() if _in_progress is None else _in_progress
+    if id(item) in in_progress:
+        raise ValueError("Circular reference")
+    in_progress.add(id(item))
+    if t is Map:
+        pairs = [
+            (_to_stack_item(k, in_progress), _to_stack_item(v, in_progress))
+            for k, v in item.items()
+        ]
+        result: noderpc.StackItem = noderpc.MapStackItem(
+            noderpc.StackItemType.MAP, pairs
+        )
+    else:
+        type_ = (
+            noderpc.StackItemType.STRUCT if t is Struct else noderpc.StackItemType.ARRAY
+        )
+        result = noderpc.StackItem(
+            type_, [_to_stack_item(i, in_progress) for i in item]
+        )
+    in_progress.discard(id(item))
+    return result
+
+
+def _op_push_int(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(
+        int.from_bytes(operand, "little", signed=True)
+    )
+
+
+def _op_push_const(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(opcode - vm.OpCode.PUSH0)
+
+
+def _op_pusht(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(True)
+
+
+def _op_pushf(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(False)
+
+
+def _op_pusha(engine, context, opcode, operand, ip):
+    position = ip + int.from_bytes(operand, "little", signed=True)
+    if not 0 <= position <= len(context.shared.script):
+        raise VMFault(f"Bad pointer address: {position}")
+    context.shared.evaluation_stack.append(Pointer(context.shared.script, position))
+
+
+def _op_pushnull(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(None)
+
+
+def _op_pushdata(engine, context, opcode, operand, ip):
+    if len(operand) > MAX_ITEM_SIZE:
+        raise VMFault(f"MaxItemSize exceed: {len(operand)}")
+    context.shared.evaluation_stack.append(operand)
+
+
+def _op_nop(engine, context, opcode, operand, ip):
+    pass
+
+
+def _op_jmp(engine, context, opcode, operand, ip):
+    engine._jump(context, ip + int.from_bytes(operand, "little", signed=True))
+
+
+def _op_jmpif(engine, context, opcode, operand, ip):
+    condition = _to_bool(context.shared.evaluation_stack.pop())
+    if opcode >= vm.OpCode.JMPIFNOT:
+        condition = not condition
+    if condition:
+        engine._jump(context, ip + int.from_bytes(operand, "little", signed=True))
+
+
+def _op_jmp_compare(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = _to_int(stack.pop())
+    x1 = _to_int(stack.pop())
+    kind = (opcode - vm.OpCode.JMPEQ) // 2
+    if kind == 0:
+        condition = x1 == x2
+    elif kind == 1:
+        condition = x1 != x2
+    elif kind == 2:
+        condition = x1 > x2
+    elif kind == 3:
+        condition = x1 >= x2
+    elif kind == 4:
+        condition = x1 < x2
+    else:
+        condition = x1 <= x2
+    if condition:
+        engine._jump(context, ip + int.from_bytes(operand, "little", signed=True))
+
+
+def _call(engine, context, position):
+    if len(engine.invocation_stack) >= MAX_INVOCATION_STACK_SIZE:
+        raise VMFault("MaxInvocationStackSize exceed")
+    if not 0 <= position < len(context.shared.script):
+        raise VMFault(f"Jump out of range for position: {position}")
+    engine.invocation_stack.append(context.clone(position))
+
+
+def _op_call(engine, context, opcode, operand, ip):
+    _call(engine, context, ip + int.from_bytes(operand, "little", signed=True))
+
+
+def _op_calla(engine, context, opcode, operand, ip):
+    pointer = context.shared.evaluation_stack.pop()
+    if type(pointer) is not Pointer:
+        raise VMFault(f"Expected Pointer, got {_type_name(pointer)}")
+    if pointer.script != context.shared.script:
+        raise VMFault("Pointers can't be shared between scripts")
+    _call(engine, context, pointer.position)
+
+
+def _op_callt(engine, context, opcode, operand, ip):
+    index = int.from_bytes(operand, "little")
+    tokens = context.shared.tokens
+    if index >= len(tokens):
+        raise VMFault(f"Token index out of range: {index}")
+    token = tokens[index]
+    stack = context.shared.evaluation_stack
+    args = [stack.pop() for _ in range(token.parameters_count)]
+    engine.add_xpp(
+        _SYSCALL_PRICES[vm.Syscalls.SYSTEM_CONTRACT_CALL.number]
+        * engine.exec_fee_factor
+    )
+    engine.call_contract(
+        token.hash, token.method, callflags.CallFlags(token.call_flags), args
+    )
+
+
+def _op_abort(engine, context, opcode, operand, ip):
+    raise VMFault("ABORT is executed.")
+
+
+def _op_assert(engine, context, opcode, operand, ip):
+    if not _to_bool(context.shared.evaluation_stack.pop()):
+        raise VMFault("ASSERT is executed with false result.")
+
+
+def _op_throw(engine, context, opcode, operand, ip):
+    engine._throw(context.shared.evaluation_stack.pop())
+
+
+def _op_try(engine, context, opcode, operand, ip):
+    if len(context.try_stack) >= MAX_TRY_NESTING_DEPTH:
+        raise VMFault("MaxTryNestingDepth exceed.")
+    half = len(operand) // 2
+    catch_offset = int.from_bytes(operand[:half], "little", signed=True)
+    finally_offset = int.from_bytes(operand[half:], "little", signed=True)
+    if catch_offset == 0 and finally_offset == 0:
+        raise VMFault("Both catch and finally offsets can't be 0")
+    context.try_stack.append(
+        _ExceptionHandler(
+            ip + catch_offset if catch_offset else -1,
+            ip + finally_offset if finally_offset else -1,
+        )
+    )
+
+
+def _op_endtry(engine, context, opcode, operand, ip):
+    if not context.try_stack:
+        raise VMFault("The corresponding TRY block cannot be found.")
+    handler = context.try_stack[-1]
+    if handler.state == _HandlerState.FINALLY:
+        raise VMFault("The opcode ENDTRY can't be executed in a FINALLY block.")
+    end = ip + int.from_bytes(operand, "little", signed=True)
+    if handler.finally_ip >= 0:
+        handler.state = _HandlerState.FINALLY
+        handler.end_ip = end
+        context.ip = handler.finally_ip
+    else:
+        context.try_stack.pop()
+        engine._jump(context, end)
+
+
+def _op_endfinally(engine, context, opcode, operand, ip):
+    if not context.try_stack:
+        raise VMFault("The corresponding TRY block cannot be found.")
+    handler = context.try_stack.pop()
+    if engine._uncaught is None:
+        engine._jump(context, handler.end_ip)
+    else:
+        engine._handle_exception()
+
+
+def _op_ret(engine, context, opcode, operand, ip):
+    invocation_stack = engine.invocation_stack
+    invocation_stack.pop()
+    target = (
+        invocation_stack[-1].shared.evaluation_stack
+        if invocation_stack
+        else engine.result_stack
+    )
+    stack = context.shared.evaluation_stack
+    if stack is not target:
+        if context.rvcount >= 0 and len(stack) != context.rvcount:
+            raise VMFault("RVCount doesn't match with EvaluationStack")
+        target.extend(stack)
+        if context.dynamic_call and context.rvcount == 0:
+            target.append(None)
+
+
+def _op_syscall(engine, context, opcode, operand, ip):
+    engine._syscall(int.from_bytes(operand, "little"))
+
+
+def _op_depth(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(len(stack))
+
+
+def _op_drop(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.pop()
+
+
+def _op_nip(engine, context, opcode, operand, ip):
+    del context.shared.evaluation_stack[-2]
+
+
+def _pop_index(stack: list) -> int:
+    n = _to_int(stack.pop())
+    if n < 0:
+        raise VMFault(f"The negative value {n} is invalid for this instruction.")
+    return n
+
+
+def _op_xdrop(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    n = _pop_index(stack)
+    del stack[-1 - n]
+
+
+def _op_clear(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.clear()
+
+
+def _op_dup(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(stack[-1])
+
+
+def _op_over(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(stack[-2])
+
+
+def _op_pick(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    n = _pop_index(stack)
+    stack.append(stack[-1 - n])
+
+
+def _op_tuck(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    if len(stack) < 2:
+        raise IndexError
+    stack.insert(-2, stack[-1])
+
+
+def _op_swap(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack[-1], stack[-2] = stack[-2], stack[-1]
+
+
+def _op_rot(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(stack.pop(-3))
+
+
+def _op_roll(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    n = _pop_index(stack)
+    if n:
+        stack.append(stack.pop(-1 - n))
+
+
+def _reverse_top(stack: list, n: int) -> None:
+    if n > len(stack):
+        raise IndexError
+    if n > 1:
+        stack[-n:] = stack[: -n - 1 : -1]
+
+
+def _op_reverse3(engine, context, opcode, operand, ip):
+    _reverse_top(context.shared.evaluation_stack, 3)
+
+
+def _op_reverse4(engine, context, opcode, operand, ip):
+    _reverse_top(context.shared.evaluation_stack, 4)
+
+
+def _op_reversen(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    _reverse_top(stack, _pop_index(stack))
+
+
+def _op_initsslot(engine, context, opcode, operand, ip):
+    if context.shared.static_fields is not None:
+        raise VMFault("INITSSLOT cannot be executed twice.")
+    if operand[0] == 0:
+        raise VMFault("The operand 0 is invalid for INITSSLOT.")
+    context.shared.static_fields = [None] * operand[0]
+
+
+def _op_initslot(engine, context, opcode, operand, ip):
+    if context.local_variables is not None or context.arguments is not None:
+        raise VMFault("INITSLOT cannot be executed twice.")
+    if operand[0] == 0 and operand[1] == 0:
+        raise VMFault("The operands 0, 0 are invalid for INITSLOT.")
+    if operand[0]:
+        context.local_variables = [None] * operand[0]
+    if operand[1]:
+        stack = context.shared.evaluation_stack
+        context.arguments = [stack.pop() for _ in range(operand[1])]
+
+
+def _slot(context: ExecutionContext, opcode: int):
+    # LDSFLD0 - STARG are laid out in groups of 8 per slot type, the last opcode of a group has an index operand
+    group = (opcode - vm.OpCode.LDSFLD0) // 16
+    if group == 0:
+        slot = context.shared.static_fields
+    elif group == 1:
+        slot = context.local_variables
+    else:
+        slot = context.arguments
+    if slot is None:
+        raise VMFault(f"{vm.OpCode(opcode).name} requires an initialized slot.")
+    return slot
+
+
+def _slot_index(opcode: int, operand: bytes) -> int:
+    return operand[0] if operand else (opcode - vm.OpCode.LDSFLD0) % 8
+
+
+def _op_load(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(
+        _slot(context, opcode)[_slot_index(opcode, operand)]
+    )
+
+
+def _op_store(engine, context, opcode, operand, ip):
+    slot = _slot(context, opcode)
+    index = _slot_index(opcode, operand)
+    if index >= len(slot):
+        raise IndexError
+    slot[index] = context.shared.evaluation_stack.pop()
+
+
+def _op_newbuffer(engine, context, opcode, operand, ip):
+    length = _to_int(context.shared.evaluation_stack.pop())
+    if not 0 <= length <= MAX_ITEM_SIZE:
+        raise VMFault(f"MaxItemSize exceed: {length}")
+    context.shared.evaluation_stack.append(bytearray(length))
+
+
+def _op_memcpy(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    count = _pop_index(stack)
+    si = _pop_index(stack)
+    src = _to_bytes(stack.pop())
+    if si + count > len(src):
+        raise VMFault(f"The value {count} is out of range.")
+    di = _pop_index(stack)
+    dst = stack.pop()
+    if type(dst) is not bytearray:
+        raise VMFault(f"Expected Buffer, got {_type_name(dst)}")
+    if di + count > len(dst):
+        raise VMFault(f"The value {count} is out of range.")
+    dst[di : di + count] = src[si : si + count]
+
+
+def _op_cat(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = _to_bytes(stack.pop())
+    x1 = _to_bytes(stack.pop())
+    if len(x1) + len(x2) > MAX_ITEM_SIZE:
+        raise VMFault(f"MaxItemSize exceed: {len(x1) + len(x2)}")
+    stack.append(bytearray(x1 + x2))
+
+
+def _op_substr(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    count = _pop_index(stack)
+    index = _pop_index(stack)
+    x = _to_bytes(stack.pop())
+    if index + count > len(x):
+        raise VMFault(f"The value {count} is out of range.")
+    stack.append(bytearray(x[index : index + count]))
+
+
+def _op_left(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    count = _pop_index(stack)
+    x = _to_bytes(stack.pop())
+    if count > len(x):
+        raise VMFault(f"The value {count} is out of range.")
+    stack.append(bytearray(x[:count]))
+
+
+def _op_right(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    count = _pop_index(stack)
+    x = _to_bytes(stack.pop())
+    if count > len(x):
+        raise VMFault(f"The value {count} is out of range.")
+    stack.append(bytearray(x[len(x) - count :]))
+
+
+def _op_invert(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(~_to_int(stack.pop()))
+
+
+def _op_bitwise(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = _to_int(stack.pop())
+    x1 = _to_int(stack.pop())
+    if opcode == vm.OpCode.AND:
+        stack.append(x1 & x2)
+    elif opcode == vm.OpCode.OR:
+        stack.append(x1 | x2)
+    else:
+        stack.append(x1 ^ x2)
+
+
+def _op_equal(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = stack.pop()
+    x1 = stack.pop()
+    stack.append(_equals(x1, x2) == (opcode == vm.OpCode.EQUAL))
+
+
+def _op_unary(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x = _to_int(stack.pop())
+    op = vm.OpCode
+    if opcode == op.SIGN:
+        stack.append((x > 0) - (x < 0))
+    elif opcode == op.ABS:
+        stack.append(_check_int(abs(x)))
+    elif opcode == op.NEGATE:
+        stack.append(_check_int(-x))
+    elif opcode == op.INC:
+        stack.append(_check_int(x + 1))
+    elif opcode == op.DEC:
+        stack.append(_check_int(x - 1))
+    elif opcode == op.SQRT:
+        if x < 0:
+            raise VMFault("value can not be negative")
+        stack.append(math.isqrt(x))
+    elif opcode == op.NZ:
+        stack.append(x != 0)
+    else:
+        raise VMFault(f"Invalid opcode {opcode:#04x}")
+
+
+def _op_binary(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = _to_int(stack.pop())
+    x1 = _to_int(stack.pop())
+    op = vm.OpCode
+    if opcode == op.ADD:
+        result = x1 + x2
+    elif opcode == op.SUB:
+        result = x1 - x2
+    elif opcode == op.MUL:
+        result = x1 * x2
+    elif opcode == op.DIV:
+        if x2 == 0:
+            raise VMFault("Attempted to divide by zero.")
+        result = _div(x1, x2)
+    elif opcode == op.MOD:
+        if x2 == 0:
+            raise VMFault("Attempted to divide by zero.")
+        result = _mod(x1, x2)
+    elif opcode == op.POW:
+        if not 0 <= x2 <= MAX_SHIFT:
+            raise VMFault(f"Invalid exponent: {x2}")
+        result = x1**x2
+    elif opcode == op.SHL or opcode == op.SHR:
+        if not 0 <= x2 <= MAX_SHIFT:
+            raise VMFault(f"Invalid shift value: {x2}")
+        result = x1 << x2 if opcode == op.SHL else x1 >> x2
+    elif opcode == op.MIN:
+        result = min(x1, x2)
+    elif opcode == op.MAX:
+        result = max(x1, x2)
+    elif opcode == op.NUMEQUAL:
+        result = x1 == x2
+    elif opcode == op.NUMNOTEQUAL:
+        result = x1 != x2
+    else:
+        raise VMFault(f"Invalid opcode {opcode:#04x}")
+    stack.append(result if type(result) is bool else _check_int(result))
+
+
+def _op_modmul(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    modulus = _to_int(stack.pop())
+    x2 = _to_int(stack.pop())
+    x1 = _to_int(stack.pop())
+    if modulus == 0:
+        raise VMFault("Attempted to divide by zero.")
+    stack.append(_mod(x1 * x2, modulus))
+
+
+def _op_modpow(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    modulus = _to_int(stack.pop())
+    exponent = _to_int(stack.pop())
+    value = _to_int(stack.pop())
+    if exponent == -1:
+        if value < 0 or modulus < 2:
+            raise VMFault("Invalid value or modulus for modular inverse")
+        stack.append(pow(value, -1, modulus))
+        return
+    if exponent < 0 or modulus == 0:
+        raise VMFault("Invalid exponent or modulus")
+    result = pow(abs(value), exponent, abs(modulus))
+    stack.append(-result if value < 0 and exponent % 2 else result)
+
+
+def _op_not(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(not _to_bool(stack.pop()))
+
+
+def _op_bool_binary(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = _to_bool(stack.pop())
+    x1 = _to_bool(stack.pop())
+    stack.append(x1 and x2 if opcode == vm.OpCode.BOOLAND else x1 or x2)
+
+
+def _op_compare(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x2 = stack.pop()
+    x1 = stack.pop()
+    if x1 is None or x2 is None:
+        stack.append(False)
+        return
+    x2 = _to_int(x2)
+    x1 = _to_int(x1)
+    op = vm.OpCode
+    if opcode == op.LT:
+        stack.append(x1 < x2)
+    elif opcode == op.LE:
+        stack.append(x1 <= x2)
+    elif opcode == op.GT:
+        stack.append(x1 > x2)
+    else:
+        stack.append(x1 >= x2)
+
+
+def _op_within(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    b = _to_int(stack.pop())
+    a = _to_int(stack.pop())
+    x = _to_int(stack.pop())
+    stack.append(a <= x < b)
+
+
+def _op_packmap(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    size = _pop_index(stack)
+    if size * 2 > len(stack):
+        raise VMFault(f"The value {size} is out of range.")
+    map_ = Map()
+    for _ in range(size):
+        key = _to_primitive(stack.pop())
+        map_[key] = stack.pop()
+    stack.append(map_)
+
+
+def _op_pack(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    size = _pop_index(stack)
+    if size > len(stack):
+        raise VMFault(f"The value {size} is out of range.")
+    items = [stack.pop() for _ in range(size)]
+    stack.append(Struct(items) if opcode == vm.OpCode.PACKSTRUCT else items)
+
+
+def _op_unpack(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    compound = stack.pop()
+    t = type(compound)
+    if t is Map:
+        for key, value in reversed(compound.items()):
+            stack.append(value)
+            stack.append(key)
+    elif t is list or t is Struct:
+        stack.extend(reversed(compound))
+    else:
+        raise VMFault(f"Invalid type for UNPACK: {_type_name(compound)}")
+    stack.append(len(compound))
+
+
+def _op_newarray0(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(
+        Struct() if opcode == vm.OpCode.NEWSTRUCT0 else []
+    )
+
+
+def _op_newarray(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    n = _pop_index(stack)
+    if n > MAX_ITEM_SIZE:
+        raise VMFault(f"MaxStackSize exceed: {n}")
+    default: bool | int | bytes | None = None
+    if opcode == vm.OpCode.NEWARRAY_T:
+        type_ = operand[0]
+        if type_ not in _VALID_TYPES:
+            raise VMFault(f"Invalid type for NEWARRAY_T: {type_}")
+        if type_ == vm.StackItemType.BOOLEAN:
+            default = False
+        elif type_ == vm.StackItemType.INTEGER:
+            default = 0
+        elif type_ == vm.StackItemType.BYTESTRING:
+            default = b""
+    items = [default] * n
+    stack.append(Struct(items) if opcode == vm.OpCode.NEWSTRUCT else items)
+
+
+def _op_newmap(engine, context, opcode, operand, ip):
+    context.shared.evaluation_stack.append(Map())
+
+
+def _op_size(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x = stack.pop()
+    t = type(x)
+    if t in (list, Struct, Map, bytearray):
+        stack.append(len(x))
+    else:
+        stack.append(len(_to_bytes(x)))
+
+
+def _op_haskey(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    key = _to_primitive(stack.pop())
+    x = stack.pop()
+    t = type(x)
+    if t is Map:
+        stack.append(key in x)
+        return
+    index = _to_int(key)
+    if index < 0:
+        raise VMFault(f"The negative value {index} is invalid for HASKEY.")
+    if t in (list, Struct, bytearray, bytes):
+        stack.append(index < len(x))
+    else:
+        raise VMFault(f"Invalid type for HASKEY: {_type_name(x)}")
+
+
+def _op_keys(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x = stack.pop()
+    if type(x) is not Map:
+        raise VMFault(f"Expected Map, got {_type_name(x)}")
+    stack.append(x.keys())
+
+
+def _op_values(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x = stack.pop()
+    t = type(x)
+    if t is Map:
+        values = x.values()
+    elif t is list or t is Struct:
+        values = list(x)
+    else:
+        raise VMFault(f"Invalid type for VALUES: {_type_name(x)}")
+    stack.append([v.clone() if type(v) is Struct else v for v in values])
+
+
+def _op_pickitem(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    key = _to_primitive(stack.pop())
+    x = stack.pop()
+    t = type(x)
+    if t is Map:
+        stack.append(x[key])
+        return
+    index = _to_int(key)
+    if t is list or t is Struct:
+        if not 0 <= index < len(x):
+            raise VMFault(f"The value {index} is out of range.")
+        stack.append(x[index])
+    elif t is bytearray or t in (bytes, int, bool):
+        data = x if t is bytearray else _to_bytes(x)
+        if not 0 <= index < len(data):
+            raise VMFault(f"The value {index} is out of range.")
+        stack.append(data[index])
+    else:
+        raise VMFault(f"Invalid type for PICKITEM: {_type_name(x)}")
+
+
+def _op_append(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    item = stack.pop()
+    if type(item) is Struct:
+        item = item.clone()
+    array = stack.pop()
+    if type(array) not in (list, Struct):
+        raise VMFault(f"Invalid type for APPEND: {_type_name(array)}")
+    array.append(item)
+
+
+def _op_setitem(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    value = stack.pop()
+    if type(value) is Struct:
+        value = value.clone()
+    key = _to_primitive(stack.pop())
+    x = stack.pop()
+    t = type(x)
+    if t is Map:
+        x[key] = value
+        return
+    index = _to_int(key)
+    if t is list or t is Struct:
+        if not 0 <= index < len(x):
+            raise VMFault(f"The value {index} is out of range.")
+        x[index] = value
+    elif t is bytearray:
+        if not 0 <= index < len(x):
+            raise VMFault(f"The value {index} is out of range.")
+        b = _to_int(value)
+        if not -128 <= b <= 255:
+            raise VMFault(f"Overflow in SETITEM, {b} is not a valid byte.")
+        x[index] = b & 0xFF
+    else:
+        raise VMFault(f"Invalid type for SETITEM: {_type_name(x)}")
+
+
+def _op_reverseitems(engine, context, opcode, operand, ip):
+    x = context.shared.evaluation_stack.pop()
+    if type(x) not in (list, Struct, bytearray):
+        raise VMFault(f"Invalid type for REVERSEITEMS: {_type_name(x)}")
+    x.reverse()
+
+
+def _op_remove(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    key = _to_primitive(stack.pop())
+    x = stack.pop()
+    t = type(x)
+    if t is Map:
+        x.remove(key)
+        return
+    if t is not list and t is not Struct:
+        raise VMFault(f"Invalid type for REMOVE: {_type_name(x)}")
+    index = _to_int(key)
+    if not 0 <= index < len(x):
+        raise VMFault(f"The value {index} is out of range.")
+    del x[index]
+
+
+def _op_clearitems(engine, context, opcode, operand, ip):
+    x = context.shared.evaluation_stack.pop()
+    if type(x) not in (list, Struct, Map):
+        raise VMFault(f"Invalid type for CLEARITEMS: {_type_name(x)}")
+    x.clear()
+
+
+def _op_popitem(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    x = stack.pop()
+    if type(x) not in (list, Struct):
+        raise VMFault(f"Invalid type for POPITEM: {_type_name(x)}")
+    stack.append(x.pop())
+
+
+def _op_isnull(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    stack.append(stack.pop() is None)
+
+
+def _op_istype(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    type_ = operand[0]
+    if type_ == vm.StackItemType.ANY or type_ not in _VALID_TYPES:
+        raise VMFault(f"Invalid type: {type_}")
+    stack.append(_item_type(stack.pop()) == type_)
+
+
+def _op_convert(engine, context, opcode, operand, ip):
+    stack = context.shared.evaluation_stack
+    type_ = operand[0]
+    if type_ == vm.StackItemType.ANY or type_ not in _VALID_TYPES:
+        raise VMFault(f"Invalid type: {type_}")
+    stack.append(_convert(stack.pop(), type_))
+
+
+def _build_dispatch() -> list:
+    op = vm.OpCode
+    table: list = [None] * 256
+    for opcode in range(op.PUSHINT8, op.PUSHINT256 + 1):
+        table[opcode] = _op_push_int
+    for opcode in range(op.PUSHM1, op.PUSH16 + 1):
+        table[opcode] = _op_push_const
+    for opcode in range(op.JMPEQ, op.JMPLE_L + 1):
+        table[opcode] = _op_jmp_compare
+    for opcode in range(op.LDSFLD0, op.STARG + 1):
+        table[opcode] = _op_load if (opcode - op.LDSFLD0) % 16 < 8 else _op_store
+    for opcodes, handler in (
+        ((op.PUSHT,), _op_pusht),
+        ((op.PUSHF,), _op_pushf),
+        ((op.PUSHA,), _op_pusha),
+        ((op.PUSHNULL,), _op_pushnull),
+        ((op.PUSHDATA1, op.PUSHDATA2, op.PUSHDATA4), _op_pushdata),
+        ((op.NOP,), _op_nop),
+        ((op.JMP, op.JMP_L), _op_jmp),
+        ((op.JMPIF, op.JMPIF_L, op.JMPIFNOT, op.JMPIFNOT_L), _op_jmpif),
+        ((op.CALL, op.CALL_L), _op_call),
+        ((op.CALLA,), _op_calla),
+        ((op.CALLT,), _op_callt),
+        ((op.ABORT,), _op_abort),
+        ((op.ASSERT,), _op_assert),
+        ((op.THROW,), _op_throw),
+        ((op.TRY, op.TRY_L), _op_try),
+        ((op.ENDTRY, op.ENDTRY_L), _op_endtry),
+        ((op.ENDFINALLY,), _op_endfinally),
+        ((op.RET,), _op_ret),
+        ((op.SYSCALL,), _op_syscall),
+        ((op.DEPTH,), _op_depth),
+        ((op.DROP,), _op_drop),
+        ((op.NIP,), _op_nip),
+        ((op.XDROP,), _op_xdrop),
+        ((op.CLEAR,), _op_clear),
+        ((op.DUP,), _op_dup),
+        ((op.OVER,), _op_over),
+        ((op.PICK,), _op_pick),
+        ((op.TUCK,), _op_tuck),
+        ((op.SWAP,), _op_swap),
+        ((op.ROT,), _op_rot),
+        ((op.ROLL,), _op_roll),
+        ((op.REVERSE3,), _op_reverse3),
+        ((op.REVERSE4,), _op_reverse4),
+        ((op.REVERSEN,), _op_reversen),
+        ((op.INITSSLOT,), _op_initsslot),
+        ((op.INITSLOT,), _op_initslot),
+        ((op.NEWBUFFER,), _op_newbuffer),
+        ((op.MEMCPY,), _op_memcpy),
+        ((op.CAT,), _op_cat),
+        ((op.SUBSTR,), _op_substr),
+        ((op.LEFT,), _op_left),
+        ((op.RIGHT,), _op_right),
+        ((op.INVERT,), _op_invert),
+        ((op.AND, op.OR, op.XOR), _op_bitwise),
+        ((op.EQUAL, op.NOTEQUAL), _op_equal),
+        ((op.SIGN, op.ABS, op.NEGATE, op.INC, op.DEC, op.SQRT, op.NZ), _op_unary),
+        (
+            (
+                op.ADD,
+                op.SUB,
+                op.MUL,
+                op.DIV,
+                op.MOD,
+                op.POW,
+                op.SHL,
+                op.SHR,
+                op.MIN,
+                op.MAX,
+                op.NUMEQUAL,
+                op.NUMNOTEQUAL,
+            ),
+            _op_binary,
+        ),
+        ((op.MODMUL,), _op_modmul),
+        ((op.MODPOW,), _op_modpow),
+        ((op.NOT,), _op_not),
+        ((op.BOOLAND, op.BOOLOR), _op_bool_binary),
+        ((op.LT, op.LE, op.GT, op.GE), _op_compare),
+        ((op.WITHIN,), _op_within),
+        ((op.PACKMAP,), _op_packmap),
+        ((op.PACK, op.PACKSTRUCT), _op_pack),
+        ((op.UNPACK,), _op_unpack),
+        ((op.NEWARRAY0, op.NEWSTRUCT0), _op_newarray0),
+        ((op.NEWARRAY, op.NEWARRAY_T, op.NEWSTRUCT), _op_newarray),
+        ((op.NEWMAP,), _op_newmap),
+        ((op.SIZE,), _op_size),
+        ((op.HASKEY,), _op_haskey),
+        ((op.KEYS,), _op_keys),
+        ((op.VALUES,), _op_values),
+        ((op.PICKITEM,), _op_pickitem),
+        ((op.APPEND,), _op_append),
+        ((op.SETITEM,), _op_setitem),
+        ((op.REVERSEITEMS,), _op_reverseitems),
+        ((op.REMOVE,), _op_remove),
+        ((op.CLEARITEMS,), _op_clearitems),
+        ((op.POPITEM,), _op_popitem),
+        ((op.ISNULL,), _op_isnull),
+        ((op.ISTYPE,), _op_istype),
+        ((op.CONVERT,), _op_convert),
+    ):
+        for opcode in opcodes:
+            table[opcode] = handler
+    return table
+
+
+_DISPATCH = _build_dispatch()
+
+
+def _pop_script_hash(engine: ApplicationEngine) -> types.UInt160:
+    data = engine.pop_bytes()
+    if len(data) != 20:
+        raise VMFault(f"Invalid script hash length {len(data)}")
+    return types.UInt160(data)
+
+
+def _pop_storage_context(engine: ApplicationEngine) -> StorageContext:
+    context = engine.pop()
+    if type(context) is not StorageContext:
+        raise VMFault(f"Expected a storage context, got {_type_name(context)}")
+    return context
+
+
+def _pop_iterator(engine: ApplicationEngine) -> StorageIterator:
+    iterator = engine.pop()
+    if not isinstance(iterator, StorageIterator):
+        raise VMFault(f"Expected an iterator, got {_type_name(iterator)}")
+    return iterator
+
+
+def _contract_call(engine: ApplicationEngine) -> None:
+    script_hash = _pop_script_hash(engine)
+    method = engine.pop_str()
+    flags = engine.pop_int()
+    if flags & ~callflags.CallFlags.ALL:
+        raise VMFault(f"Invalid call flags {flags}")
+    args = engine.pop()
+    if type(args) not in (list, Struct):
+        raise VMFault(f"Expected Array of arguments, got {_type_name(args)}")
+    engine.call_contract(script_hash, method, callflags.CallFlags(flags), list(args))
+
+
+def _contract_get_call_flags(engine: ApplicationEngine) -> None:
+    engine.push(int(engine.current_context.shared.call_flags))
+
+
+def _contract_create_standard_account(engine: ApplicationEngine) -> None:
+    public_key = engine.pop_bytes()
+    script = contractutils.create_signature_redeemscript(public_key)
+    engine.push(hashing.hash160(script))
+
+
+def _iterator_next(engine: ApplicationEngine) -> None:
+    engine.push(_pop_iterator(engine).next())
+
+
+def _iterator_value(engine: ApplicationEngine) -> None:
+    engine.push(_pop_iterator(engine).value())
+
+
+def _runtime_platform(engine: ApplicationEngine) -> None:
+    engine.push(b"EpicChain")
+
+
+def _runtime_get_network(engine: ApplicationEngine) -> None:
+    engine.push(settings.settings.network.magic)
+
+
+def _runtime_get_address_version(engine: ApplicationEngine) -> None:
+    engine.push(settings.settings.network.account_version)
+
+
+def _runtime_get_trigger(engine: ApplicationEngine) -> None:
+    engine.push(_TRIGGER_APPLICATION)
+
+
+def _runtime_get_time(engine: ApplicationEngine) -> None:
+    engine.push(int(time.time() * 1000))
+
+
+def _runtime_get_executing_script_hash(engine: ApplicationEngine) -> None:
+    engine.push(engine.current_context.script_hash.to_array())
+
+
+def _runtime_get_calling_script_hash(engine: ApplicationEngine) -> None:
+    calling = engine.current_context.shared.calling_script_hash
+    engine.push(None if calling is None else calling.to_array())
+
+
+def _runtime_get_entry_script_hash(engine: ApplicationEngine) -> None:
+    engine.push(engine.invocation_stack[0].script_hash.to_array())
+
+
+def _runtime_check_witness(engine: ApplicationEngine) -> None:
+    data = engine.pop_bytes()
+    if len(data) == 20:
+        script_hash = types.UInt160(data)
+    elif len(data) == 33:
+        script_hash = types.UInt160(
+            hashing.hash160(contractutils.create_signature_redeemscript(data))
+        )
+    else:
+        raise VMFault(f"Invalid hashOrPubkey length {len(data)}")
+    engine.push(any(signer.account == script_hash for signer in engine.signers))
+
+
+def _runtime_get_invocation_counter(engine: ApplicationEngine) -> None:
+    script_hash = engine.current_context.script_hash
+    engine.push(engine._invocation_counter.get(script_hash, 1))
+
+
+def _runtime_get_random(engine: ApplicationEngine) -> None:
+    engine.push(random.getrandbits(128))
+
+
+def _runtime_log(engine: ApplicationEngine) -> None:
+    message = engine.pop_bytes()
+    if len(message) > 1024:
+        raise VMFault("Message is too long")
+    engine.logs.append(
+        (engine.current_context.script_hash, message.decode("utf-8", "strict"))
+    )
+
+
+def _runtime_notify(engine: ApplicationEngine) -> None:
+    name = engine.pop_bytes()
+    if len(name) > 32:
+        raise VMFault("Event name is too long")
+    state = engine.pop()
+    if type(state) not in (list, Struct):
+        raise VMFault(f"Expected Array as notification state, got {_type_name(state)}")
+    engine.notifications.append(
+        (engine.current_context.script_hash, name.decode("utf-8", "strict"), state)
+    )
+
+
+def _runtime_get_notifications(engine: ApplicationEngine) -> None:
+    data = engine.pop()
+    script_hash = None if data is None else types.UInt160(_to_bytes(data))
+    engine.push(
+        [
+            [hash_.to_array(), name.encode("utf-8"), state]
+            for hash_, name, state in engine.notifications
+            if script_hash is None or hash_ == script_hash
+        ]
+    )
+
+
+def _runtime_epicpulse_left(engine: ApplicationEngine) -> None:
+    engine.push(engine.xpp_limit - engine.xpp_consumed)
+
+
+def _runtime_burn_epicpulse(engine: ApplicationEngine) -> None:
+    amount = engine.pop_int()
+    if amount <= 0:
+        raise VMFault("EpicPulse must be positive.")
+    engine.add_xpp(amount)
+
+
+def _storage_get_context(engine: ApplicationEngine) -> None:
+    engine.push(StorageContext(engine.current_context.script_hash, False))
+
+
+def _storage_get_read_only_context(engine: ApplicationEngine) -> None:
+    engine.push(StorageContext(engine.current_context.script_hash, True))
+
+
+def _storage_as_read_only(engine: ApplicationEngine) -> None:
+    context = _pop_storage_context(engine)
+    engine.push(StorageContext(context.script_hash, True))
+
+
+def _storage_get(engine: ApplicationEngine) -> None:
+    context = _pop_storage_context(engine)
+    key = engine.pop_bytes()
+    engine.push(engine._get_storage(context.script_hash, key))
+
+
+def _storage_find(engine: ApplicationEngine) -> None:
+    context = _pop_storage_context(engine)
+    prefix = engine.pop_bytes()
+    options = engine.pop_int()
+    if options & ~0xFF or options & (
+        FindOptions.DESERIALIZE_VALUES
+        | FindOptions.PICK_FIELD0
+        | FindOptions.PICK_FIELD1
+    ):
+        raise VMFault(f"Unsupported find options {options}")
+    if options & FindOptions.KEYS_ONLY and options & FindOptions.VALUES_ONLY:
+        raise VMFault("KeysOnly and ValuesOnly can not be combined")
+    entries = engine._find_storage(context.script_hash, prefix)
+    if options & FindOptions.BACKWARDS:
+        entries.reverse()
+    engine.push(StorageIterator(entries, len(prefix), options))
+
+
+def _pop_writable_context(engine: ApplicationEngine) -> StorageContext:
+    context = _pop_storage_context(engine)
+    if context.read_only:
+        raise VMFault("StorageContext is readonly")
+    return context
+
+
+def _storage_put(engine: ApplicationEngine) -> None:
+    context = _pop_writable_context(engine)
+    key = engine.pop_bytes()
+    value = engine.pop_bytes()
+    if len(key) > 64 or len(value) > 0xFFFF:
+        raise VMFault("Key or value exceeds the maximum size")
+    engine._storage_changes[(context.script_hash, key)] = value
+
+
+def _storage_delete(engine: ApplicationEngine) -> None:
+    context = _pop_writable_context(engine)
+    key = engine.pop_bytes()
+    engine._storage_changes[(context.script_hash, key)] = None
+
+
+_DEFAULT_SYSCALLS: dict[int, SyscallHandler] = {
+    syscall.number: handler
+    for syscall, handler in (
+        (vm.Syscalls.SYSTEM_CONTRACT_CALL, _contract_call),
+        (vm.Syscalls.SYSTEM_CONTRACT_GET_CALL_FLAGS, _contract_get_call_flags),
+        (
+            vm.Syscalls.SYSTEM_CONTRACT_CREATE_STANDARD_ACCOUNT,
+            _contract_create_standard_account,
+        ),
+        (vm.Syscalls.SYSTEM_ITERATOR_NEXT, _iterator_next),
+        (vm.Syscalls.SYSTEM_ITERATOR_VALUE, _iterator_value),
+        (vm.Syscalls.SYSTEM_RUNTIME_PLATFORM, _runtime_platform),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_NETWORK, _runtime_get_network),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_ADDRESS_VERSION, _runtime_get_address_version),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_TRIGGER, _runtime_get_trigger),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_TIME, _runtime_get_time),
+        (
+            vm.Syscalls.SYSTEM_RUNTIME_GET_EXECUTING_SCRIPT_HASH,
+            _runtime_get_executing_script_hash,
+        ),
+        (
+            vm.Syscalls.SYSTEM_RUNTIME_GET_CALLING_SCRIPT_HASH,
+            _runtime_get_calling_script_hash,
+        ),
+        (
+            vm.Syscalls.SYSTEM_RUNTIME_GET_ENTRY_SCRIPT_HASH,
+            _runtime_get_entry_script_hash,
+        ),
+        (vm.Syscalls.SYSTEM_RUNTIME_CHECK_WITNESS, _runtime_check_witness),
+        (
+            vm.Syscalls.SYSTEM_RUNTIME_GET_INVOCATION_COUNTER,
+            _runtime_get_invocation_counter,
+        ),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_RANDOM, _runtime_get_random),
+        (vm.Syscalls.SYSTEM_RUNTIME_LOG, _runtime_log),
+        (vm.Syscalls.SYSTEM_RUNTIME_NOTIFY, _runtime_notify),
+        (vm.Syscalls.SYSTEM_RUNTIME_GET_NOTIFICATIONS, _runtime_get_notifications),
+        (vm.Syscalls.SYSTEM_RUNTIME_EPICPULSE_LEFT, _runtime_epicpulse_left),
+        (vm.Syscalls.SYSTEM_RUNTIME_BURN_EPICPULSE, _runtime_burn_epicpulse),
+        (vm.Syscalls.SYSTEM_STORAGE_GET_CONTEXT, _storage_get_context),
+        (
+            vm.Syscalls.SYSTEM_STORAGE_GET_READ_ONLY_CONTEXT,
+            _storage_get_read_only_context,
+        ),
+        (vm.Syscalls.SYSTEM_STORAGE_AS_READ_ONLY, _storage_as_read_only),
+        (vm.Syscalls.SYSTEM_STORAGE_GET, _storage_get),
+        (vm.Syscalls.SYSTEM_STORAGE_FIND, _storage_find),
+        (vm.Syscalls.SYSTEM_STORAGE_PUT, _storage_put),
+        (vm.Syscalls.SYSTEM_STORAGE_DELETE, _storage_delete),
+    )
+}
@@ -29,14 +29,14 @@ from collections.abc import Sequence
 import asyncio
 from enum import IntEnum
 from dataclasses import dataclass
-from epicchain.api import noderpc
+from epicchain.api import noderpc, localvm
 from epicchain.api.helpers import signing, txbuilder, unwrap
 from epicchain.network.payloads import verification
 from epicchain.wallet import utils as walletutils
 from epicchain.wallet.types import EpicChainAddress
-from epicchain.core import types, cryptography, utils as coreutils
+from epicchain.core import types, cryptography
 from epicchain import vm
-from epicchain.contracts import contract, callflags, utils as contractutils, xef, manifest
+from epicchain.contracts import contract, callflags, xef, manifest
 from copy import deepcopy
 
 # result stack index
@@ -138,12 +138,17 @@ class ChainFacade:
         rpc_host: str,
         receipt_retry_delay: Optional[float] = None,
         receipt_timeout: Optional[float] = None,
+        local_snapshot: Optional[localvm.Snapshot] = None,
+        native_contracts: Optional[dict[types.UInt160, localvm.NativeContract]] = None,
     ):
         """
         Args:
             rpc_host: EpicChain RPC node host address.
             receipt_retry_delay: time to wait in seconds between attempts to find the transaction on the chain.
             receipt_timeout: maximum time to wait in seconds to find the transaction on the chain.
+            local_snapshot: if set, `test_invoke()` and `estimate_xpp()` execute the script locally against this state
+             instead of calling the RPC node.
+            native_contracts: implementations of native contracts used when executing locally.
         """
         self.rpc_host = rpc_host
         self._signing_func = None
@@ -153,6 +158,8 @@ class ChainFacade:
         self._signing_funcs: list[signing.SigningFunction] = []
         self._receipt_retry_delay = receipt_retry_delay
         self._receipt_timeout = receipt_timeout
+        self.local_snapshot = local_snapshot
+        self.native_contracts = native_contracts
 
     async def test_invoke(
         self,
@@ -232,11 +239,20 @@ class ChainFacade:
             signers:
             return_raw: whether to post process the execution result or not.
         """
+        res = await self._invoke_script(f.script, signers)
+        if f.execution_processor is None or return_raw:
+            return res
+        return f.execution_processor(res, 0)
+
+    async def _invoke_script(
+        self, script: bytes, signers: Optional[Sequence[verification.Signer]]
+    ) -> noderpc.ExecutionResultResponse:
+        if self.local_snapshot is not None:
+            return localvm.test_invoke(
+                script, self.local_snapshot, signers, self.native_contracts
+            )
         async with noderpc.EpicRpcClient(self.rpc_host) as client:
-            res = await client.invoke_script(f.script, signers)
-            if f.execution_processor is None or return_raw:
-                return res
-            return f.execution_processor(res, 0)
+            return await client.invoke_script(script, signers)
 
     async def invoke(
         self,
@@ -601,9 +617,8 @@ class ChainFacade:
         """
         Estimate the xpp price for calling the contract method.
         """
-        async with noderpc.EpicRpcClient(self.rpc_host) as client:
-            res = await client.invoke_script(f.script, signers)
-            return res.xpp_consumed
+        res = await self._invoke_script(f.script, signers)
+        return res.xpp_consumed
 
     async def _get_receipt_time_values(self) -> tuple[float, float]:
         if self._receipt_retry_delay is None or self._receipt_timeout is None:
@@ -978,9 +993,7 @@ class Candidate:
         self.public_key = public_key
         #: number of votes the candidate has.
         self.votes = votes
-        shash = coreutils.to_script_hash(
-            contractutils.create_signature_redeemscript(self.public_key)
-        )
+        shash = walletutils.public_key_to_script_hash(self.public_key)
         #: EpicChain address of the candidate.
         self.address = walletutils.script_hash_to_address(shash)
 
@@ -6,6 +6,12 @@ from collections.abc import Sequence
 from epicchain.core import types, utils as coreutils, cryptography
 from epicchain import vm
 
+_SIGNATURE_SCRIPT_PREFIX = bytes([vm.OpCode.PUSHDATA1, 33])
+_SIGNATURE_SCRIPT_SUFFIX = (
+    bytes([vm.OpCode.SYSCALL])
+    + vm.Syscalls.SYSTEM_CRYPTO_CHECK_STANDARD_ACCOUNT.to_array()
+)
+
 
 def get_contract_hash(
     sender: types.UInt160, xef_checksum: int, contract_name: str
@@ -88,19 +94,28 @@ def create_multisig_redeemscript(
     return sb.to_array()
 
 
-def create_signature_redeemscript(public_key: cryptography.ECPoint) -> bytes:
+def create_signature_redeemscript(public_key: cryptography.ECPoint | bytes) -> bytes:
     """
     Create a single signature redeem script.
 
     This generated script is intended to be executed by the VM to indicate that the requested action is allowed.
 
     Args:
-        public_key: the public key to use during verification.
+        public_key: the public key to use during verification, or its compressed encoding.
+
+    Raises:
+        ValueError: if `public_key` is bytes that are not 33 bytes long.
     """
-    sb = vm.ScriptBuilder()
-    sb.emit_push(public_key.encode_point(True))
-    sb.emit_syscall(vm.Syscalls.SYSTEM_CRYPTO_CHECK_STANDARD_ACCOUNT)
-    return sb.to_array()
+    if isinstance(public_key, (bytes, bytearray)):
+        if len(public_key) != 33:
+            raise ValueError(
+                f"Expected a compressed public key of 33 bytes, got {len(public_key)}"
+            )
+        encoded = bytes(public_key)
+    else:
+        encoded = public_key.encode_point(True)
+    # the script always has the fixed layout PUSHDATA1 33 <key> SYSCALL <id>, no need for a ScriptBuilder
+    return _SIGNATURE_SCRIPT_PREFIX + encoded + _SIGNATURE_SCRIPT_SUFFIX
 
 
 def is_signature_contract(script: bytes) -> bool:
@@ -113,14 +128,11 @@ def is_signature_contract(script: bytes) -> bool:
     if len(script) != 40:
         return False
 
-    if (
-        script[0] != vm.OpCode.PUSHDATA1
-        or script[1] != 33
-        or script[35] != vm.OpCode.SYSCALL
-        or script[36:40] != vm.Syscalls.SYSTEM_CRYPTO_CHECK_STANDARD_ACCOUNT
-    ):
-        return False
-    return True
+    # fixed layout, comparing the bytes directly is cheaper than decoding the instructions
+    return (
+        script[:2] == _SIGNATURE_SCRIPT_PREFIX
+        and script[35:] == _SIGNATURE_SCRIPT_SUFFIX
+    )
 
 
 def is_multisig_contract(script: bytes) -> bool:
@@ -134,6 +146,16 @@ def is_multisig_contract(script: bytes) -> bool:
     return valid
 
 
+def _read_push_count(instruction: vm.Instruction) -> int:
+    # the unsigned value pushed by a PUSHINT8, PUSHINT16 or PUSH1-16 instruction. -1 for any other instruction
+    opcode = instruction.opcode
+    if opcode == vm.OpCode.PUSHINT8 or opcode == vm.OpCode.PUSHINT16:
+        return int.from_bytes(instruction.operand, "little", signed=False)
+    if vm.OpCode.PUSH1 <= opcode <= vm.OpCode.PUSH16:
+        return opcode - vm.OpCode.PUSH0
+    return -1
+
+
 def parse_as_multisig_contract(
     script: bytes,
 ) -> tuple[bool, int, list[cryptography.ECPoint]]:
@@ -148,74 +170,44 @@ def parse_as_multisig_contract(
         int: the signing threshold if validation passed. 0 otherwise.
         list[ECPoint]: the public keys in the script if valiation passed. An empty array otherwise.
     """
-    script = bytes(script)
     VALIDATION_FAILURE: tuple[bool, int, list[cryptography.ECPoint]] = (False, 0, [])
 
-    len_script = len(script)
-    if len_script < 42:
+    if len(script) < 42:
         return VALIDATION_FAILURE
 
-    # read signature length, which is encoded as variable_length
-    first_byte = script[0]
-    if first_byte == int(vm.OpCode.PUSHINT8):
-        signature_threshold = script[1]
-        i = 2
-    elif first_byte == int(vm.OpCode.PUSHINT16):
-        signature_threshold = int.from_bytes(script[1:3], "little", signed=False)
-        i = 3
-    elif int(vm.OpCode.PUSH1) <= first_byte <= int(vm.OpCode.PUSH16):
-        signature_threshold = first_byte - int(vm.OpCode.PUSH0)
-        i = 1
-    else:
+    try:
+        instructions = list(vm.iter_instructions(script))
+    except ValueError:
         return VALIDATION_FAILURE
 
-    if signature_threshold < 1 or signature_threshold > 1024:
+    # signing threshold, public keys, public key count, CheckMultisig syscall
+    if len(instructions) < 4:
         return VALIDATION_FAILURE
 
-    # try reading public keys and do a basic format validation
-    pushdata1 = int(vm.OpCode.PUSHDATA1)
-    public_keys = []
-    while script[i] == pushdata1:
-        if len_script <= i + 35:
-            return VALIDATION_FAILURE
-        if script[i + 1] != 33:
-            return VALIDATION_FAILURE
-        public_keys.append(
-            cryptography.ECPoint.deserialize_from_bytes(script[i + 2 : i + 2 + 33])
-        )
-        i += 35
+    signature_threshold = _read_push_count(instructions[0])
+    if signature_threshold < 1 or signature_threshold > 1024:
+        return VALIDATION_FAILURE
 
-    public_key_count = len(public_keys)
+    key_instructions = instructions[1:-2]
+    public_key_count = len(key_instructions)
     if public_key_count < signature_threshold or public_key_count > 1024:
         return VALIDATION_FAILURE
-
-    # validate that the number of collected public keys match the expected count
-    value = script[i]
-    if value == int(vm.OpCode.PUSHINT8):
-        if len_script <= i + 1 or public_key_count != script[i + 1]:
-            return VALIDATION_FAILURE
-        i += 2
-    elif value == int(vm.OpCode.PUSHINT16):
-        if len_script < i + 3 or public_key_count != int.from_bytes(
-            script[i + 1 : i + 3], "little", signed=False
-        ):
+    for instruction in key_instructions:
+        if instruction.opcode != vm.OpCode.PUSHDATA1 or len(instruction.operand) != 33:
             return VALIDATION_FAILURE
-        i += 3
-    elif int(vm.OpCode.PUSH1) <= value <= int(vm.OpCode.PUSH16):
-        if public_key_count != value - int(vm.OpCode.PUSH0):
-            return VALIDATION_FAILURE
-        i += 1
-    else:
-        return VALIDATION_FAILURE
 
-    if len_script != i + 5:
+    # validate that the number of collected public keys match the expected count
+    if _read_push_count(instructions[-2]) != public_key_count:
         return VALIDATION_FAILURE
 
-    if script[i] != int(vm.OpCode.SYSCALL):
+    if (
+        instructions[-1].syscall
+        != vm.Syscalls.SYSTEM_CRYPTO_CHECK_MULTI_SIGNATURE_ACCOUNT
+    ):
         return VALIDATION_FAILURE
-    i += 1
 
-    syscall_num = int.from_bytes(script[i : i + 4], "little")
-    if syscall_num != vm.Syscalls.SYSTEM_CRYPTO_CHECK_MULTI_SIGNATURE_ACCOUNT:
-        return VALIDATION_FAILURE
+    public_keys = [
+        cryptography.ECPoint.deserialize_from_bytes(bytes(instruction.operand))
+        for instruction in key_instructions
+    ]
     return True, signature_threshold, public_keys
@@ -3,9 +3,8 @@ EpicChain Executable Format.
 """
 from __future__ import annotations
 import base64
-import hashlib
 from collections.abc import Sequence
-from epicchain.core import serialization, types, Size as s, utils as coreutils, interfaces
+from epicchain.core import serialization, types, Size as s, utils as coreutils, interfaces, hashing
 from epicchain.contracts import callflags
 from typing import Optional
 
@@ -124,7 +123,7 @@ class XEF(serialization.ISerializable, interfaces.IJson):
         Compute the checksum of the XEF file.
         """
         return int.from_bytes(
-            hashlib.sha256(hashlib.sha256(self.to_array()[:-4]).digest()).digest()[:4],
+            hashing.hash256(self.to_array()[:-4])[:4],
             "little",
         )
 
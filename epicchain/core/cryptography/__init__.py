@@ -1,17 +1,27 @@
 from __future__ import annotations
-from .merkletree import MerkleTree
+from .merkletree import MerkleTree, MerkleProof, MerkleAccumulator, verify_proof
 from .bloomfilter import BloomFilter
 from .ecc import ECCCurve, ECPoint, KeyPair, ECCException, ecdsa_verify, ecdsa_sign
+import atexit
 import hashlib
+import os
+import threading
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
 __all__ = [
     "MerkleTree",
+    "MerkleProof",
+    "MerkleAccumulator",
+    "verify_proof",
     "BloomFilter",
     "ECCCurve",
     "ECPoint",
     "KeyPair",
     "sign",
     "verify_signature",
+    "verify_batch",
     "ECCException",
 ]
 
@@ -45,5 +55,77 @@ def verify_signature(
         ValueError: for the Secp256r1 curve if the public key has an invalid format
 
     """
-    pub_key = ECPoint(public_key, curve, True)
-    return ecdsa_verify(signature, message, pub_key, hash_func)
+    return ecdsa_verify(
+        signature, message, _parse_public_key(bytes(public_key), curve), hash_func
+    )
+
+
+#: Below this number of signatures :func:`verify_batch` verifies in the calling process.
+BATCH_POOL_THRESHOLD = 64
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _parse_public_key(public_key: bytes, curve: ECCCurve) -> ECPoint:
+    # compressed keys are served from the shared point cache, which keeps validated points
+    return ECPoint.deserialize_from_bytes(public_key, curve)
+
+
+def _verify_many(
+    items: Sequence[tuple[bytes, bytes, bytes]], curve: ECCCurve, hash_func
+) -> list[bool]:
+    results = []
+    for message, signature, public_key in items:
+        try:
+            pub_key = _parse_public_key(bytes(public_key), curve)
+        except (ValueError, ECCException):
+            results.append(False)
+            continue
+        results.append(ecdsa_verify(signature, message, pub_key, hash_func))
+    return results
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+            atexit.register(_pool.shutdown)
+        return _pool
+
+
+def verify_batch(
+    items: Sequence[tuple[bytes, bytes, bytes]],
+    curve: ECCCurve = ECCCurve.SECP256R1,
+    hash_func: Callable = hashlib.sha256,
+) -> list[bool]:
+    """
+    Test many signatures at once.
+
+    Compressed public keys are served from the :class:`ECPoint` cache, such that recurring keys are decompressed and
+    validated only once. Large batches are split over a process pool with a worker per CPU core. The pool is created
+    on first use.
+
+    Args:
+        items: `(message, signature, public_key)` tuples as accepted by :func:`verify_signature`.
+        curve: the ECC curve to use for verifying.
+        hash_func: the hash function the messages were signed with. Must be picklable, e.g. a `hashlib` constructor.
+
+    Returns:
+        per item `True` if its signature is valid, `False` if it is not or if its public key has an invalid format.
+    """
+    workers = os.cpu_count() or 1
+    if workers == 1 or len(items) < BATCH_POOL_THRESHOLD:
+        return _verify_many(items, curve, hash_func)
+
+    # a few chunks per worker balance uneven signature costs without paying the transfer overhead per item
+    chunk_size = -(-len(items) // (workers * 4))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    futures = [
+        _get_pool().submit(_verify_many, chunk, curve, hash_func) for chunk in chunks
+    ]
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -1,12 +1,18 @@
+from __future__ import annotations
+import math
 from bitarray import bitarray  # type: ignore
 from epicchaincrypto import mmh3_hash  # type: ignore
 from typing import Optional
+from collections.abc import Sequence
 
 
 class BloomFilter:
     """
     """
 
+    #: The maximum number of hash functions accepted by the network, see `FilterLoadPayload`.
+    MAX_HASH_FUNCTIONS = 50
+
     def __init__(self, m: int, k: int, ntweak: int, elements: Optional[bytes] = None):
         """
 
@@ -30,6 +36,35 @@ class BloomFilter:
             self.bits.setall(False)
         self.tweak = ntweak
 
+    @classmethod
+    def for_capacity(
+        cls, capacity: int, false_positive_rate: float, ntweak: int = 0
+    ) -> BloomFilter:
+        """
+        Create a filter with the optimal size and number of hash functions for the expected number of elements.
+
+        Args:
+            capacity: the expected number of elements.
+            false_positive_rate: the acceptable probability of :meth:`check` returning `True` for an element that
+                was not added, when the filter holds `capacity` elements.
+            ntweak: correction factor.
+
+        Raises:
+            ValueError: if `capacity` is not positive or `false_positive_rate` is not between 0 and 1.
+        """
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be positive, got {capacity}")
+        if not 0.0 < false_positive_rate < 1.0:
+            raise ValueError(
+                f"False positive rate must be between 0 and 1, got {false_positive_rate}"
+            )
+        m = math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2)
+        # the bits are transferred as whole bytes (see `get_bits`) and the receiver takes their number as `m`
+        m = -(-m // 8) * 8
+        k = round(m / capacity * math.log(2))
+        k = min(max(k, 1), cls.MAX_HASH_FUNCTIONS)
+        return cls(m, k, ntweak)
+
     def add(self, element: bytes) -> None:
         """
         Add an element to the filter.
@@ -37,9 +72,20 @@ class BloomFilter:
         Args:
             element: hex-escaped bytearray.
         """
+        bits = self.bits
+        m = len(bits)
         for s in self.seeds:
-            h = mmh3_hash(element, s, signed=False)
-            self.bits[h % len(self.bits)] = True
+            bits[mmh3_hash(element, s, signed=False) % m] = True
+
+    def add_many(self, elements: Sequence[bytes]) -> None:
+        """
+        Add multiple elements to the filter.
+
+        Args:
+            elements: hex-escaped bytearrays.
+        """
+        if elements:
+            self.bits[self._positions(elements)] = True
 
     def check(self, element: bytes) -> bool:
         """
@@ -50,12 +96,89 @@ class BloomFilter:
 
         Returns: True if present. False if not present.
         """
+        bits = self.bits
+        m = len(bits)
         for s in self.seeds:
-            h = mmh3_hash(element, s, signed=False)
-            if not self.bits[h % len(self.bits)]:
+            if not bits[mmh3_hash(element, s, signed=False) % m]:
                 return False
         return True
 
+    def check_many(self, elements: Sequence[bytes]) -> list[bool]:
+        """
+        Check for multiple elements if they are present.
+
+        Args:
+            elements: hex-escaped bytearrays.
+
+        Returns: per element True if present. False if not present.
+        """
+        # hashing dominates, stopping at the first unset bit beats computing all positions up front
+        check = self.check
+        return [check(element) for element in elements]
+
+    def _positions(self, elements: Sequence[bytes]) -> list[int]:
+        m = len(self.bits)
+        seeds = self.seeds
+        return [
+            mmh3_hash(element, s, signed=False) % m
+            for element in elements
+            for s in seeds
+        ]
+
+    def _ensure_compatible(self, other: BloomFilter) -> None:
+        if (
+            len(self.bits) != len(other.bits)
+            or self.K != other.K
+            or self.tweak != other.tweak
+        ):
+            raise ValueError(
+                "Cannot combine filters with different size, number of hash functions or tweak"
+            )
+
+    def _with_bits(self, bits: bitarray) -> BloomFilter:
+        bf = BloomFilter(0, self.K, self.tweak)
+        bf.bits = bits
+        return bf
+
+    def union(self, other: BloomFilter) -> BloomFilter:
+        """
+        Return a new filter that holds the elements of both filters.
+
+        Args:
+            other: a filter with the same size, number of hash functions and tweak.
+
+        Raises:
+            ValueError: if the filters are not compatible.
+        """
+        self._ensure_compatible(other)
+        return self._with_bits(self.bits | other.bits)
+
+    def intersection(self, other: BloomFilter) -> BloomFilter:
+        """
+        Return a new filter that holds the elements present in both filters.
+
+        Note:
+            The false positive rate of the result is at least that of a filter built from the common elements only.
+
+        Args:
+            other: a filter with the same size, number of hash functions and tweak.
+
+        Raises:
+            ValueError: if the filters are not compatible.
+        """
+        self._ensure_compatible(other)
+        return self._with_bits(self.bits & other.bits)
+
+    def __or__(self, other):
+        if not isinstance(other, BloomFilter):
+            return NotImplemented
+        return self.union(other)
+
+    def __and__(self, other):
+        if not isinstance(other, BloomFilter):
+            return NotImplemented
+        return self.intersection(other)
+
     def get_bits(self) -> bytes:
         """
         Return the filter bits.
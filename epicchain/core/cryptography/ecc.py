@@ -7,9 +7,11 @@ from epicchaincrypto import (  # type: ignore
     sign as ecdsa_sign,
     verify as ecdsa_verify,
 )
-from typing import Type, Any
+from typing import Type, Any, Optional
+from collections import OrderedDict
 import os
 import binascii
+import threading
 
 
 # mypy workaround
@@ -21,12 +23,71 @@ class SerializableECPointMeta(type_ECPoint, type_Serializable):
     pass
 
 
+class _ECPointCache:
+    """
+    Bounded LRU cache of shared points by compressed encoding and curve.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[
+            tuple[bytes, Any], tuple[ECPoint, bool]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[bytes, Any], validate: bool) -> Optional[ECPoint]:
+        with self._lock:
+            entry = self._entries.get(key)
+            # a point that was parsed without validation does not satisfy a validating lookup
+            if entry is None or (validate and not entry[1]):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple[bytes, Any], point: ECPoint, validated: bool) -> ECPoint:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry[1] or not validated):
+                # another thread stored it meanwhile, keep handing out a single instance
+                self._entries.move_to_end(key)
+                return entry[0]
+            self._entries[key] = (point, validated)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+            return point
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
 class ECPoint(
     _ECPointCpp, serialization.ISerializable, metaclass=SerializableECPointMeta
 ):
+    #: Shared instances returned by :meth:`deserialize_from_bytes` for compressed encodings.
+    _cache = _ECPointCache(max_size=1024)
+    #: Whether the instance is held by the cache and thus must not be modified.
+    _shared: bool = False
+
     def __init__(self, *args, **kwargs):
         super(ECPoint, self).__init__(*args, **kwargs)
 
+    def _ensure_not_shared(self) -> None:
+        if self._shared:
+            raise ValueError(
+                "Cannot modify a shared ECPoint, use deserialize_from_bytes(..., use_cache=False) for a private copy"
+            )
+
+    def from_bytes(self, *args, **kwargs):
+        self._ensure_not_shared()
+        super(ECPoint, self).from_bytes(*args, **kwargs)
+
     def __str__(self):
         return binascii.hexlify(self.encode_point(compressed=True)).decode("utf8")
 
@@ -37,7 +98,9 @@ class ECPoint(
         return hash(self.x + self.y)
 
     def __deepcopy__(self, memodict={}):
-        return ECPoint.deserialize_from_bytes(self.to_array(), self.curve, False)
+        return ECPoint.deserialize_from_bytes(
+            self.to_array(), self.curve, False, use_cache=False
+        )
 
     def is_zero(self):
         return self.x == 0 and self.y == 0
@@ -51,6 +114,7 @@ class ECPoint(
     def deserialize(
         self, reader: serialization.BinaryReader, curve=ECCCurve.SECP256R1
     ) -> None:
+        self._ensure_not_shared()
         try:
             f0 = reader.read_byte()
         except ValueError:
@@ -76,19 +140,82 @@ class ECPoint(
         data: bytes | bytearray,
         curve: ECCCurve = ECCCurve.SECP256R1,
         validate: bool = True,
+        use_cache: bool = True,
     ) -> serialization.ISerializable_T:
         """
         Parse data into an object instance.
 
+        Compressed (33 bytes) encodings are served from a bounded cache of shared instances. A point that was validated
+        before is returned without validating it again. Shared instances cannot be modified, they raise a
+        `ValueError` on :meth:`deserialize`.
+
         Args:
             data: ECPoint in hex escaped bytes format.
             curve: the curve type to decompress
             validate: validate if the point valid point on the specified curve
+            use_cache: set to `False` to always decompress (and validate) and return a new instance.
 
         Returns:
             a deserialized instance of the class.
         """
-        return cls(data, curve, validate)  # type: ignore
+        if not use_cache or len(data) != 33 or cls is not ECPoint:
+            return cls(data, curve, validate)  # type: ignore
+
+        key = (bytes(data), curve)
+        cached = ECPoint._cache.get(key, validate)
+        if cached is not None:
+            return cached  # type: ignore
+        point = ECPoint(data, curve, validate)
+        point._shared = True
+        return ECPoint._cache.put(key, point, validate)  # type: ignore
+
+    @classmethod
+    def read_cached(
+        cls, reader: serialization.BinaryReader, curve: ECCCurve = ECCCurve.SECP256R1
+    ) -> ECPoint:
+        """
+        Read a point from `reader` like ``reader.read_serializable(ECPoint)``, but serve compressed points from the
+        cache used by :meth:`deserialize_from_bytes`.
+
+        Args:
+            reader: instance.
+            curve: the curve type to decompress.
+
+        Raises:
+            ValueError: if the point encoding is not supported or invalid.
+        """
+        try:
+            prefix = reader.read_byte()
+        except ValueError:
+            # infinity, same as deserialize()
+            return cls(b"\x00", curve, True)
+
+        if prefix in (b"\x02", b"\x03"):
+            return cls.deserialize_from_bytes(prefix + reader.read_bytes(32), curve)
+        elif prefix == b"\x00":
+            return cls(b"\x00", curve, True)
+        else:
+            raise ValueError(f"Unsupported point encoding: {str(prefix)}")
+
+    @staticmethod
+    def cache_info() -> dict[str, int]:
+        """
+        Return the hit and miss counters and the current size of the point cache.
+        """
+        cache = ECPoint._cache
+        return {
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "size": len(cache._entries),
+            "max_size": cache.max_size,
+        }
+
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Empty the point cache and reset its counters.
+        """
+        ECPoint._cache.clear()
 
     @classmethod
     def _serializable_init(cls):
@@ -1,7 +1,9 @@
-import hashlib
-from epicchain.core import types
+from __future__ import annotations
+from epicchain.core import types, serialization, utils, hashing, Size as s
 from typing import Optional
-from collections.abc import Sequence
+from collections.abc import Sequence, Iterable
+
+_HASH_SIZE = 32
 
 
 class _MerkleTreeNode:
@@ -24,6 +26,79 @@ class _MerkleTreeNode:
         return self.parent is None
 
 
+class MerkleProof(serialization.ISerializable):
+    """
+    Proof that a leaf hash is included in a Merkle tree, see :func:`verify_proof`.
+    """
+
+    def __init__(self, index: int, hashes: Sequence[types.UInt256]):
+        """
+
+        Args:
+            index: position of the leaf in the list of hashes the tree is built from.
+            hashes: the sibling hash of every level from the leaf up to (excluding) the root.
+        """
+        self.index = index
+        self.hashes = hashes
+
+    def __len__(self):
+        return s.uint32 + utils.get_var_size(self.hashes)
+
+    def __eq__(self, other):
+        if type(self) != type(other):
+            return False
+        return self.index == other.index and list(self.hashes) == list(other.hashes)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} at {hex(id(self))}> index={self.index} depth={len(self.hashes)}"
+
+    def serialize(self, writer: serialization.BinaryWriter) -> None:
+        """
+        Serialize the object into a binary stream.
+
+        Args:
+            writer: instance.
+        """
+        writer.write_uint32(self.index)
+        writer.write_serializable_list(self.hashes)
+
+    def deserialize(self, reader: serialization.BinaryReader) -> None:
+        """
+        Deserialize the object from a binary stream.
+
+        Args:
+            reader: instance.
+        """
+        self.index = reader.read_uint32()
+        # a uint32 index cannot address a tree deeper than 32 levels
+        self.hashes = reader.read_serializable_list(types.UInt256, max=32)
+
+    @classmethod
+    def _serializable_init(cls):
+        return cls(0, [])
+
+
+def verify_proof(leaf: types.UInt256, proof: MerkleProof, root: types.UInt256) -> bool:
+    """
+    Test if `proof` proves that `leaf` is included in the Merkle tree with root hash `root`.
+
+    Args:
+        leaf: the hash to test, e.g. a transaction hash.
+        proof: the proof as created by :meth:`MerkleTree.proof` or :meth:`MerkleTree.build_proofs`.
+        root: the Merkle root, e.g. of a block header.
+    """
+    index = proof.index
+    digest = leaf.to_array()
+    for sibling in proof.hashes:
+        if index & 1:
+            digest = hashing.hash256(sibling.to_array() + digest)
+        else:
+            digest = hashing.hash256(digest + sibling.to_array())
+        index >>= 1
+    # any remaining index bits point outside the tree
+    return index == 0 and digest == root.to_array()
+
+
 class MerkleTree:
     def __init__(self, hashes: Sequence[types.UInt256]):
         """
@@ -40,7 +115,8 @@ class MerkleTree:
         else:
             self.has_root = True
 
-        self.root = self._build(leaves=[_MerkleTreeNode(h) for h in hashes])
+        self._leaves = [_MerkleTreeNode(h) for h in hashes]
+        self.root = self._build(leaves=self._leaves)
         _depth = 1
         i = self.root
         while i.left_child is not None:
@@ -48,6 +124,88 @@ class MerkleTree:
             i = i.left_child
         self.depth = _depth
 
+    def proof(self, index: int) -> MerkleProof:
+        """
+        Create the proof that the hash at `index` is included in the tree.
+
+        Args:
+            index: position of the hash in the list the tree is built from.
+
+        Raises:
+            ValueError: if `index` is out of range.
+        """
+        if not self.has_root or not 0 <= index < len(self._leaves):
+            raise ValueError(f"Invalid leaf index {index}")
+
+        hashes = []
+        node = self._leaves[index]
+        while node.parent is not None:
+            parent = node.parent
+            if parent.left_child is node:
+                hashes.append(parent.right_child.hash)  # type: ignore
+            else:
+                hashes.append(parent.left_child.hash)  # type: ignore
+            node = parent
+        return MerkleProof(index, hashes)
+
+    @staticmethod
+    def build_proofs(
+        hashes: Sequence[types.UInt256], indices: Iterable[int]
+    ) -> list[MerkleProof]:
+        """
+        Create the inclusion proofs for the hashes at `indices`.
+
+        All levels of the tree are computed once and shared between the proofs, without building the node tree.
+
+        Args:
+            hashes: the list of hashes the tree is built from.
+            indices: positions of the hashes to create a proof for.
+
+        Raises:
+            ValueError: if an index is out of range.
+        """
+        count = len(hashes)
+        indices = list(indices)
+        for index in indices:
+            if not 0 <= index < count:
+                raise ValueError(f"Invalid leaf index {index}")
+        if not indices:
+            return []
+
+        if isinstance(hashes, types.UInt256Array):
+            level = hashes.tobytes()
+        else:
+            level = b"".join([h.to_array() for h in hashes])
+        levels = [level]
+        while count > 1:
+            if count % 2:
+                level += level[-_HASH_SIZE:]
+                count += 1
+            level = b"".join(
+                [
+                    hashing.hash256(level[i : i + 2 * _HASH_SIZE])
+                    for i in range(0, count * _HASH_SIZE, 2 * _HASH_SIZE)
+                ]
+            )
+            levels.append(level)
+            count //= 2
+
+        # the last level holds the root, it is not part of a proof
+        levels.pop()
+        proofs = []
+        for index in indices:
+            siblings = []
+            position = index
+            for level in levels:
+                sibling = position ^ 1
+                if sibling * _HASH_SIZE >= len(level):
+                    sibling = position
+                start = sibling * _HASH_SIZE
+                siblings.append(types.UInt256(level[start : start + _HASH_SIZE]))
+                position >>= 1
+            proofs.append(MerkleProof(index, siblings))
+        return proofs
+
     def to_hash_array(self) -> list[types.UInt256]:
         """
         Create a list of hashes the Merkle tree is build up from.
@@ -73,42 +231,153 @@ class MerkleTree:
     def _build(leaves: Sequence[_MerkleTreeNode]) -> _MerkleTreeNode:
         if len(leaves) == 0:
             raise ValueError("Leaves must have length")
-        if len(leaves) == 1:
-            return leaves[0]
-
-        num_parents = int((len(leaves) + 1) / 2)
-        parents = [_MerkleTreeNode() for i in range(0, num_parents)]
-
-        for i in range(0, num_parents):
-            node = parents[i]
-            node.left_child = leaves[i * 2]
-            leaves[i * 2].parent = node
-            if i * 2 + 1 == len(leaves):
-                node.right_child = node.left_child
-            else:
-                node.right_child = leaves[i * 2 + 1]
-                leaves[i * 2 + 1].parent = node
 
-            data = node.left_child.hash.to_array() + node.right_child.hash.to_array()
-            hashed_data = hashlib.sha256(hashlib.sha256(data).digest()).digest()
-            node.hash = types.UInt256(data=hashed_data)
+        while len(leaves) > 1:
+            num_parents = (len(leaves) + 1) // 2
+            parents = [_MerkleTreeNode() for i in range(0, num_parents)]
 
-        return MerkleTree._build(parents)
+            for i in range(0, num_parents):
+                node = parents[i]
+                node.left_child = leaves[i * 2]
+                leaves[i * 2].parent = node
+                if i * 2 + 1 == len(leaves):
+                    node.right_child = node.left_child
+                else:
+                    node.right_child = leaves[i * 2 + 1]
+                    leaves[i * 2 + 1].parent = node
+
+                data = (
+                    node.left_child.hash.to_array() + node.right_child.hash.to_array()
+                )
+                node.hash = types.UInt256(data=hashing.hash256(data))
+
+            leaves = parents
+        return leaves[0]
 
     @staticmethod
     def compute_root(hashes: Sequence[types.UInt256]) -> types.UInt256:
         """
         Compute the Merkle root hash from a list of hashes.
 
+        The root is computed level by level in a single buffer of digests, without building the node tree. Use
+        :class:`MerkleTree` if the tree itself is needed.
+
         Args:
             hashes:
 
         Raises:
              ValueError: if the `hashes` list is empty.
         """
-        if len(hashes) == 0:
+        count = len(hashes)
+        if count == 0:
             return types.UInt256.zero()
-        if len(hashes) == 1:
+        if count == 1:
             return hashes[0]
-        tree = MerkleTree(hashes)
-        return tree.root.hash
+
+        # One digest per 32 bytes, with room for duplicating the last digest of a level with an odd count. Each level
+        # overwrites the front of the buffer, pair i is read from index 2i and 2i + 1 before index i is written.
+        if isinstance(hashes, types.UInt256Array):
+            leaves = hashes.tobytes()
+        else:
+            leaves = b"".join([h.to_array() for h in hashes])
+        buffer = bytearray(leaves)
+        buffer.extend(bytes(_HASH_SIZE))
+        view = memoryview(buffer)
+        hash256 = hashing.hash256
+
+        while count > 1:
+            if count % 2:
+                end = count * _HASH_SIZE
+                view[end : end + _HASH_SIZE] = view[end - _HASH_SIZE : end]
+                count += 1
+            count //= 2
+            for i in range(count):
+                pair = i * 2 * _HASH_SIZE
+                view[i * _HASH_SIZE : (i + 1) * _HASH_SIZE] = hash256(
+                    view[pair : pair + 2 * _HASH_SIZE]
+                )
+        return types.UInt256(data=bytes(view[:_HASH_SIZE]))
+
+
+class MerkleAccumulator:
+    """
+    Append-only Merkle root calculation.
+
+    Only the root of every complete subtree is kept, at most one per level. An append thus costs O(log n) hashes and
+    the root is available at any point. The root equals :meth:`MerkleTree.compute_root` over the appended hashes.
+    """
+
+    def __init__(self, hashes: Iterable[types.UInt256] = ()):
+        """
+
+        Args:
+            hashes: initial hashes to append.
+        """
+        self._count = 0
+        #: root of the complete subtree of 2^level leaves per level, only valid where the level bit of `_count` is set
+        self._peaks: list[bytes] = []
+        self.extend(hashes)
+
+    def __len__(self) -> int:
+        """Number of appended hashes."""
+        return self._count
+
+    def append(self, hash: types.UInt256) -> None:
+        """
+        Append a leaf hash.
+
+        Args:
+            hash: the hash to append, e.g. a transaction hash.
+        """
+        digest = hash.to_array()
+        count = self._count
+        peaks = self._peaks
+        level = 0
+        while count & (1 << level):
+            digest = hashing.hash256(peaks[level] + digest)
+            level += 1
+        if level == len(peaks):
+            peaks.append(digest)
+        else:
+            peaks[level] = digest
+        self._count = count + 1
+
+    def extend(self, hashes: Iterable[types.UInt256]) -> None:
+        """
+        Append multiple leaf hashes in order.
+
+        Args:
+            hashes: the hashes to append.
+        """
+        for h in hashes:
+            self.append(h)
+
+    def root(self) -> types.UInt256:
+        """
+        Return the Merkle root of all hashes appended so far, or a zero hash if none are.
+        """
+        count = self._count
+        if count == 0:
+            return types.UInt256.zero()
+
+        # start at the smallest complete subtree and fold it into the larger ones. A level without a subtree to the
+        # left means the node is the last one of an odd level, which is combined with itself.
+        level = 0
+        while not count & (1 << level):
+            level += 1
+        digest = self._peaks[level]
+        while count != 1 << level:
+            digest = hashing.hash256(digest + digest)
+            count += 1 << level
+            level += 1
+            while not count & (1 << level):
+                digest = hashing.hash256(self._peaks[level] + digest)
+                level += 1
+        return types.UInt256(data=digest)
+
+    def reset(self) -> None:
+        """
+        Remove all appended hashes.
+        """
+        self._count = 0
+        self._peaks.clear()
@@ -0,0 +1,230 @@
+"""
+Hash functions used throughout the EpicChain protocol.
+
+All hashing in the package goes through this module, such that there is a single place to benchmark and to replace
+the implementation with :func:`set_backend`. By default `hashlib` is used. RIPEMD-160 falls back to a pure Python
+implementation if the OpenSSL build `hashlib` links against does not provide it (e.g. OpenSSL 3 without the legacy
+provider).
+
+The ``*_many`` functions hash a sequence of inputs in one call.
+"""
+from __future__ import annotations
+import hashlib
+import struct
+from collections.abc import Iterable, Callable
+from typing import Optional
+
+__all__ = [
+    "sha256",
+    "hash256",
+    "ripemd160",
+    "hash160",
+    "sha256_many",
+    "hash256_many",
+    "hash160_many",
+    "set_backend",
+    "reset_backend",
+]
+
+Data = bytes | bytearray | memoryview
+
+_sha256 = hashlib.sha256
+
+
+def _hashlib_sha256(data: Data) -> bytes:
+    return _sha256(data).digest()
+
+
+def _ripemd160_fallback(data: Data) -> bytes:
+    return _RIPEMD160(bytes(data)).digest()
+
+
+try:
+    # copying a prepared object is considerably cheaper than looking up the algorithm by name on every call
+    _ripemd160_prototype = hashlib.new("ripemd160")
+
+    def _hashlib_ripemd160(data: Data) -> bytes:
+        h = _ripemd160_prototype.copy()
+        h.update(data)
+        return h.digest()
+
+    _default_ripemd160 = _hashlib_ripemd160
+except ValueError:
+    _default_ripemd160 = _ripemd160_fallback
+
+_sha256_digest: Callable[[Data], bytes] = _hashlib_sha256
+_ripemd160_digest: Callable[[Data], bytes] = _default_ripemd160
+
+
+def set_backend(
+    sha256: Optional[Callable[[Data], bytes]] = None,
+    ripemd160: Optional[Callable[[Data], bytes]] = None,
+) -> None:
+    """
+    Replace the digest functions used by this module.
+
+    Args:
+        sha256: a function returning the SHA-256 digest of its argument. Unchanged if not specified.
+        ripemd160: a function returning the RIPEMD-160 digest of its argument. Unchanged if not specified.
+    """
+    global _sha256_digest, _ripemd160_digest
+    if sha256 is not None:
+        _sha256_digest = sha256
+    if ripemd160 is not None:
+        _ripemd160_digest = ripemd160
+
+
+def reset_backend() -> None:
+    """
+    Restore the default digest functions.
+    """
+    global _sha256_digest, _ripemd160_digest
+    _sha256_digest = _hashlib_sha256
+    _ripemd160_digest = _default_ripemd160
+
+
+def sha256(data: Data) -> bytes:
+    """
+    Return the SHA-256 digest of `data`.
+    """
+    return _sha256_digest(data)
+
+
+def hash256(data: Data) -> bytes:
+    """
+    Return the double SHA-256 digest of `data`, as used for checksums and Merkle trees.
+    """
+    return _sha256_digest(_sha256_digest(data))
+
+
+def ripemd160(data: Data) -> bytes:
+    """
+    Return the RIPEMD-160 digest of `data`.
+    """
+    return _ripemd160_digest(data)
+
+
+def hash160(data: Data) -> bytes:
+    """
+    Return the RIPEMD-160 digest of the SHA-256 digest of `data`, as used for script hashes.
+    """
+    return _ripemd160_digest(_sha256_digest(data))
+
+
+def sha256_many(items: Iterable[Data]) -> list[bytes]:
+    """
+    Return the SHA-256 digest of every item.
+    """
+    return list(map(_sha256_digest, items))
+
+
+def hash256_many(items: Iterable[Data]) -> list[bytes]:
+    """
+    Return the double SHA-256 digest of every item.
+    """
+    sha = _sha256_digest
+    return [sha(sha(item)) for item in items]
+
+
+def hash160_many(items: Iterable[Data]) -> list[bytes]:
+    """
+    Return the RIPEMD-160 digest of the SHA-256 digest of every item.
+    """
+    sha = _sha256_digest
+    ripemd = _ripemd160_digest
+    return [ripemd(sha(item)) for item in items]
+
+
+class _RIPEMD160:
+    """
+    Pure Python RIPEMD-160, see https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
+    """
+
+    # message word selection and rotation amounts of the left and right lines, per round of 16 steps
+    _RL = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15),
+        (7, 4, 13, 1, 10, 6, 15, 3, 12, 0, 9, 5, 2, 14, 11, 8),
+        (3, 10, 14, 4, 9, 15, 8, 1, 2, 7, 0, 6, 13, 11, 5, 12),
+        (1, 9, 11, 10, 0, 8, 12, 4, 13, 3, 7, 15, 14, 5, 6, 2),
+        (4, 0, 5, 9, 7, 12, 2, 10, 14, 1, 3, 8, 11, 6, 15, 13),
+    )
+    _RR = (
+        (5, 14, 7, 0, 9, 2, 11, 4, 13, 6, 15, 8, 1, 10, 3, 12),
+        (6, 11, 3, 7, 0, 13, 5, 10, 14, 15, 8, 12, 4, 9, 1, 2),
+        (15, 5, 1, 3, 7, 14, 6, 9, 11, 8, 12, 2, 10, 0, 4, 13),
+        (8, 6, 4, 1, 3, 11, 15, 0, 5, 12, 2, 13, 9, 7, 10, 14),
+        (12, 15, 10, 4, 1, 5, 8, 7, 6, 2, 13, 14, 0, 3, 9, 11),
+    )
+    _SL = (
+        (11, 14, 15, 12, 5, 8, 7, 9, 11, 13, 14, 15, 6, 7, 9, 8),
+        (7, 6, 8, 13, 11, 9, 7, 15, 7, 12, 15, 9, 11, 7, 13, 12),
+        (11, 13, 6, 7, 14, 9, 13, 15, 14, 8, 13, 6, 5, 12, 7, 5),
+        (11, 12, 14, 15, 14, 15, 9, 8, 9, 14, 5, 6, 8, 6, 5, 12),
+        (9, 15, 5, 11, 6, 8, 13, 12, 5, 12, 13, 14, 11, 8, 5, 6),
+    )
+    _SR = (
+        (8, 9, 9, 11, 13, 15, 15, 5, 7, 7, 8, 11, 14, 14, 12, 6),
+        (9, 13, 15, 7, 12, 8, 9, 11, 7, 7, 12, 7, 6, 15, 13, 11),
+        (9, 7, 15, 11, 8, 6, 6, 14, 12, 13, 5, 14, 13, 13, 7, 5),
+        (15, 5, 8, 11, 14, 14, 6, 14, 6, 9, 12, 9, 12, 5, 15, 8),
+        (8, 5, 12, 9, 12, 5, 14, 6, 8, 13, 6, 5, 15, 13, 11, 11),
+    )
+    _KL = (0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E)
+    _KR = (0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000)
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    @staticmethod
+    def _f(j: int, x: int, y: int, z: int) -> int:
+        if j == 0:
+            return x ^ y ^ z
+        if j == 1:
+            return (x & y) | (~x & z)
+        if j == 2:
+            return (x | ~y) ^ z
+        if j == 3:
+            return (x & z) | (y & ~z)
+        return x ^ (y | ~z)
+
+    def _compress(self, state: list[int], block: bytes) -> None:
+        mask = 0xFFFFFFFF
+        x = struct.unpack("<16I", block)
+        al, bl, cl, dl, el = state
+        ar, br, cr, dr, er = state
+        f = self._f
+        for j in range(5):
+            for i in range(16):
+                t = (
+                    al + (f(j, bl, cl, dl) & mask) + x[self._RL[j][i]] + self._KL[j]
+                ) & mask
+                s = self._SL[j][i]
+                t = (((t << s) | (t >> (32 - s))) + el) & mask
+                al, el, dl, cl, bl = el, dl, ((cl << 10) | (cl >> 22)) & mask, bl, t
+
+                t = (
+                    ar + (f(4 - j, br, cr, dr) & mask) + x[self._RR[j][i]] + self._KR[j]
+                ) & mask
+                s = self._SR[j][i]
+                t = (((t << s) | (t >> (32 - s))) + er) & mask
+                ar, er, dr, cr, br = er, dr, ((cr << 10) | (cr >> 22)) & mask, br, t
+
+        t = (state[1] + cl + dr) & mask
+        state[1] = (state[2] + dl + er) & mask
+        state[2] = (state[3] + el + ar) & mask
+        state[3] = (state[4] + al + br) & mask
+        state[4] = (state[0] + bl + cr) & mask
+        state[0] = t
+
+    def digest(self) -> bytes:
+        data = self._data
+        padded = (
+            data
+            + b"\x80"
+            + bytes((55 - len(data)) % 64)
+            + struct.pack("<Q", (len(data) * 8) & 0xFFFFFFFFFFFFFFFF)
+        )
+        state = [0x67452301, 0xEFCDAB89, 0x98BADCFE, 0x10325476, 0xC3D2E1F0]
+        for offset in range(0, len(padded), 64):
+            self._compress(state, padded[offset : offset + 64])
+        return struct.pack("<5I", *state)
@@ -2,14 +2,42 @@ from __future__ import annotations
 import sys
 import abc
 import struct
-from io import BytesIO, SEEK_END
-from typing import Type, TypeVar, Optional
-from collections.abc import Sequence
+import functools
+import operator
+from typing import Type, TypeVar, Optional, Callable, Any, Generic
+from collections.abc import Sequence, Iterator
+from epicchain.core import varint
 
 
 ISerializable_T = TypeVar("ISerializable_T", bound="ISerializable")
 
-__all__ = ["ISerializable", "BinaryReader", "BinaryWriter"]
+__all__ = [
+    "ISerializable",
+    "BinaryReader",
+    "BinaryWriter",
+    "Field",
+    "SerializationPlan",
+    "InsufficientDataError",
+    "StreamDeserializer",
+    "CachedSizeMixin",
+    "CachedHashMixin",
+]
+
+
+class InsufficientDataError(ValueError):
+    """
+    Raised by :class:`~epicchain.core.serialization.BinaryReader` if the stream ends before the requested data.
+    """
+
+    def __init__(self, message: str, needed: int):
+        """
+        Args:
+            message: error description.
+            needed: the number of additional bytes the read required.
+        """
+        super(InsufficientDataError, self).__init__(message)
+        #: The number of additional bytes required to complete the failing read.
+        self.needed = needed
 
 
 class ISerializable(abc.ABC):
@@ -17,6 +45,8 @@ class ISerializable(abc.ABC):
     An interface like class supporting EpicChain's network serialization protocol.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def serialize(self, writer: BinaryWriter) -> None:
         """
@@ -37,7 +67,7 @@ class ISerializable(abc.ABC):
 
     @classmethod
     def deserialize_from_bytes(
-        cls: Type[ISerializable_T], data: bytes | bytearray
+        cls: Type[ISerializable_T], data: bytes | bytearray | memoryview
     ) -> ISerializable_T:
         """
         Parse data into an object instance.
@@ -53,11 +83,44 @@ class ISerializable(abc.ABC):
             payload.deserialize(br)
             return payload
 
+    @classmethod
+    def deserialize_many(
+        cls: Type[ISerializable_T],
+        data: bytes | bytearray | memoryview,
+        count: Optional[int] = None,
+    ) -> Iterator[ISerializable_T]:
+        """
+        Lazily parse consecutive objects from `data` using a single reader.
+
+        Example:
+        ::
+
+            txs = list(Transaction.deserialize_many(dump))
+
+        Args:
+            data: the serialized objects back-to-back, without a count prefix.
+            count: (Optional) the number of objects to parse. Parses until `data` is exhausted if not specified.
+
+        Raises:
+            ValueError: if `count` objects or a trailing object cannot be read from `data`.
+
+        Returns:
+            an iterator producing the deserialized instances in order.
+        """
+        with _StrictBinaryReader(data) as br:
+            size = len(br)
+            n = 0
+            while n != count and (count is not None or br._offset < size):
+                payload = cls._serializable_init()
+                payload.deserialize(br)
+                yield payload
+                n += 1
+
     def to_array(self) -> bytes:
         """Serialize the object into a bytearray."""
         with BinaryWriter() as bw:
             self.serialize(bw)
-            return bw._stream.getvalue()
+            return bw.to_array()
 
     @abc.abstractmethod
     def __len__(self):
@@ -73,7 +136,150 @@ class ISerializable(abc.ABC):
         return cls()
 
 
+def _same_key_item(cached: Any, current: Any) -> bool:
+    # objects are compared by identity, lengths by value as only small ints are shared instances
+    return cached is current or (type(cached) is int and cached == current)
+
+
+def nested_key(*values: Any) -> tuple:
+    """
+    Flatten `values` into a key for :meth:`CachedSizeMixin._size_key` or :meth:`CachedHashMixin._hash_key`.
+
+    Every list is followed by its length and its elements, and every
+    :class:`~epicchain.core.serialization.ISerializable` by its attribute values, recursively. Replacing a list
+    element or assigning an attribute of a nested object thus changes the key. Attributes holding cached results are
+    skipped, as are objects without a `__dict__`.
+    """
+    key: list = []
+    pending = list(reversed(values))
+    while pending:
+        value = pending.pop()
+        key.append(value)
+        if isinstance(value, list):
+            key.append(len(value))
+            pending.extend(reversed(value))
+        elif isinstance(value, ISerializable) and hasattr(value, "__dict__"):
+            pending.extend(
+                reversed(
+                    [v for k, v in vars(value).items() if not k.startswith("_cached")]
+                )
+            )
+    return tuple(key)
+
+
+class CachedSizeMixin:
+    """
+    Memoise the serialized size of an :class:`~epicchain.core.serialization.ISerializable` that was deserialized.
+
+    Decoded payloads are rarely changed afterwards, yet computing their size walks all nested objects. Inheritors
+    record the number of bytes consumed during deserialization with :meth:`_cache_size`, after which `len()` returns
+    it in constant time. The cached size is discarded once any object returned by :meth:`_size_key` is not the very
+    same object anymore, or a returned length differs. Use :func:`nested_key` to cover nested objects. Changes it
+    cannot detect, like writing into a `bytearray`, require a call to :meth:`invalidate_size`.
+
+    Inheritors implement `_compute_size()` instead of `__len__()`.
+    """
+
+    _cached_size: Optional[tuple[tuple, int]] = None
+
+    def __len__(self):
+        cached = self._cached_size
+        if cached is not None:
+            key = self._size_key()
+            if len(cached[0]) == len(key) and all(map(_same_key_item, cached[0], key)):
+                return cached[1]
+        return self._compute_size()
+
+    @abc.abstractmethod
+    def _compute_size(self) -> int:
+        """Calculate the length of the object in number of bytes."""
+
+    def _size_key(self) -> tuple:
+        """
+        All attribute values that affect the size. Mutable containers should be accompanied by their length and
+        elements, see :func:`nested_key`.
+        """
+        return ()
+
+    def _cache_size(self, size: int) -> None:
+        # holding on to the key objects guarantees their identities are not reused by new objects
+        self._cached_size = (self._size_key(), size)
+
+    def invalidate_size(self) -> None:
+        """Discard the cached size. Call this after changing a nested object in place."""
+        self._cached_size = None
+
+
+class CachedHashMixin:
+    """
+    Memoise the hash of the unsigned data of an object.
+
+    Computing the hash serializes the unsigned data and hashes it, yet it is requested over and over, e.g. for equality,
+    set membership and Merkle trees. :meth:`hash` returns the cached value as long as every value returned by
+    :meth:`_hash_key` is the very same object as when the hash was computed, thus assigning any of those attributes
+    invalidates it. Use :func:`nested_key` to cover nested objects. Changes it cannot detect, like writing into a
+    `bytearray`, require a call to :meth:`invalidate_hash`.
+
+    Inheritors implement `_compute_hash()` instead of `hash()`.
+
+    Note:
+        The returned hash is shared between calls. Never deserialize into it.
+    """
+
+    _cached_hash: Optional[tuple[tuple, Any]] = None
+
+    def hash(self):
+        """
+        Get a unique identifier based on the unsigned data portion of the object.
+        """
+        key = self._hash_key()
+        cached = self._cached_hash
+        if (
+            cached is not None
+            and len(cached[0]) == len(key)
+            and all(map(_same_key_item, cached[0], key))
+        ):
+            return cached[1]
+        value = self._compute_hash()
+        # holding on to the key objects guarantees their identities are not reused by new objects
+        self._cached_hash = (key, value)
+        return value
+
+    @abc.abstractmethod
+    def _compute_hash(self):
+        """Calculate the hash of the unsigned data."""
+
+    def _hash_key(self) -> tuple:
+        """
+        All attribute values that make up the unsigned data. Mutable containers should be accompanied by their length
+        and elements, see :func:`nested_key`.
+        """
+        return ()
+
+    def invalidate_hash(self) -> None:
+        """Discard the cached hash. Call this after changing a nested object in place."""
+        self._cached_hash = None
+
+
 class BinaryReader(object):
+    """
+    A convenience class for reading data from byte streams.
+
+    The reader operates directly on a `memoryview` of the input and tracks the read position with an integer offset,
+    such that the input data is never copied as a whole. Integers are unpacked in place. Use
+    :meth:`~epicchain.core.serialization.BinaryReader.read_view` and
+    :meth:`~epicchain.core.serialization.BinaryReader.read_var_view` to obtain zero-copy slices of the input.
+
+    Context manager support is available to ensure proper cleanup of resources.
+
+    Example:
+    ::
+
+        with BinaryReader(b'\\x01\\x02') as br:
+            my_value = br.read_uint16()
+    """
+
+    _bool = struct.Struct("?")
     _uint8 = struct.Struct("<B")
     _uint16 = struct.Struct("<H")
     _uint32 = struct.Struct("<I")
@@ -87,27 +293,23 @@ class BinaryReader(object):
     _int16BE = struct.Struct(">h")
     _int32BE = struct.Struct(">i")
     _int64BE = struct.Struct(">q")
-    """
-        A convenience class for reading data from byte streams.
 
-        Context manager support is available to ensure proper cleanup of resources.
-
-        Example:
-        ::
-
-            with BinaryReader(b'\\x01\\x02') as br:
-                my_value = br.read_uint16()
-    """
-
-    def __init__(self, stream: bytes | bytearray) -> None:
+    def __init__(self, stream: bytes | bytearray | memoryview) -> None:
         """
         Create an instance.
 
+        Note:
+            When passing a `bytearray` it cannot be resized for as long as the reader is not closed.
+
         Args:
             stream: a stream to operate on.
         """
         super(BinaryReader, self).__init__()
-        self._stream = BytesIO(stream)
+        view = memoryview(stream)
+        if view.format != "B" or view.ndim != 1:
+            view = view.cast("B")
+        self._view = view
+        self._offset = 0
 
     def __enter__(self):
         return self
@@ -116,31 +318,42 @@ class BinaryReader(object):
         self.close()
 
     def __len__(self):
-        io = self._stream
-        # Remember our current position
-        cur_pos = io.tell()
-        # Seek to the end of the File object
-        io.seek(0, SEEK_END)
-        # Remember position, which is equal to the full length
-        full_size = io.tell()
-        # Seek back to the current position
-        io.seek(cur_pos)
-        return full_size
+        return self._view.nbytes
+
+    def tell(self) -> int:
+        """Return the current position in the stream."""
+        return self._offset
+
+    def _unpack(self, fmt: struct.Struct):
+        try:
+            value = fmt.unpack_from(self._view, self._offset)[0]
+        except struct.error:
+            raise self._insufficient_data(fmt.size) from None
+        self._offset += fmt.size
+        return value
+
+    def _insufficient_data(self, length: int) -> InsufficientDataError:
+        available = max(self._view.nbytes - self._offset, 0)
+        return InsufficientDataError(
+            f"Could not read {length} bytes from stream. Only found {available} bytes of data",
+            length - available,
+        )
 
     def read_byte(self) -> bytes:
         """
         Read a single byte.
 
         Raises:
-            ValueError: if 1 byte of data cannot be read from the stream.
+            InsufficientDataError: if 1 byte of data cannot be read from the stream.
 
         Returns:
             bytes: a hex escaped bytearray with 1 element.
         """
-        value = self._stream.read(1)
-        if len(value) != 1:
-            raise ValueError("Could not read byte from empty stream")
-        return value
+        offset = self._offset
+        if offset >= self._view.nbytes:
+            raise InsufficientDataError("Could not read byte from empty stream", 1)
+        self._offset = offset + 1
+        return self._view[offset : offset + 1].tobytes()
 
     def read_bytes(self, length: int, _skip_length_check: bool = False) -> bytes:
         """
@@ -150,17 +363,32 @@ class BinaryReader(object):
             length: number of bytes to read.
 
         Raises:
-            ValueError: if `length` bytes of data cannot be read from the stream.
+            InsufficientDataError: if `length` bytes of data cannot be read from the stream.
 
         Returns:
             bytes: `length` number of bytes.
         """
-        value = self._stream.read(length)
-        if not _skip_length_check and len(value) != length:
-            raise ValueError(
-                f"Could not read {length} bytes from stream. Only found {len(value)} bytes of data"
-            )
+        return self.read_view(length, _skip_length_check).tobytes()
+
+    def read_view(self, length: int, _skip_length_check: bool = False) -> memoryview:
+        """
+        Read the specified number of bytes from the stream without copying them.
+
+        Note:
+            The returned view references the input data of the reader and remains valid after the reader is closed.
+            Materialise it with `bytes()` if the data must outlive the input.
+
+        Args:
+            length: number of bytes to read.
 
+        Raises:
+            InsufficientDataError: if `length` bytes of data cannot be read from the stream.
+        """
+        offset = self._offset
+        value = self._view[offset : offset + length]
+        if not _skip_length_check and len(value) != length:
+            raise self._insufficient_data(length)
+        self._offset = offset + len(value)
         return value
 
     def read_bool(self) -> bool:
@@ -170,85 +398,101 @@ class BinaryReader(object):
         Returns:
             bool: False for b'\x00'. True for all other values.
         """
-        return struct.unpack("?", self._stream.read(1))[0]
+        return self._unpack(self._bool)
 
     def read_uint8(self) -> int:
         """
         Read 1 byte as an unsigned integer value from the stream.
         """
-        return self._uint8.unpack(self._stream.read(1))[0]
+        return self._unpack(self._uint8)
 
     def read_uint16(self) -> int:
         """
         Read 2 bytes as an unsigned integer value from the stream.
         """
-        return self._uint16.unpack(self._stream.read(2))[0]
+        return self._unpack(self._uint16)
 
     def read_uint16BE(self) -> int:
         """
         Read 2 bytes as an unsigned integer value from the stream.
         """
-        return self._uint16BE.unpack(self._stream.read(2))[0]
+        return self._unpack(self._uint16BE)
 
     def read_int16(self) -> int:
         """
         Read 2 bytes as an unsigned integer value from the stream.
         """
-        return self._int16.unpack(self._stream.read(2))[0]
+        return self._unpack(self._int16)
 
     def read_int16BE(self) -> int:
         """
         Read 2 bytes as an unsigned integer value from the stream.
         """
-        return self._int16BE.unpack(self._stream.read(2))[0]
+        return self._unpack(self._int16BE)
 
     def read_uint32(self) -> int:
         """
         Read 4 bytes as an unsigned integer value from the stream.
         """
-        return self._uint32.unpack(self._stream.read(4))[0]
+        return self._unpack(self._uint32)
 
     def read_uint32BE(self) -> int:
         """
         Read 4 bytes as an unsigned integer value from the stream.
         """
-        return self._uint32BE.unpack(self._stream.read(4))[0]
+        return self._unpack(self._uint32BE)
 
     def read_int32(self) -> int:
         """
         Read 4 bytes as a signed integer value from the stream.
         """
-        return self._int32.unpack(self._stream.read(4))[0]
+        return self._unpack(self._int32)
 
     def read_int32BE(self) -> int:
         """
         Read 4 bytes as a signed integer value from the stream.
         """
-        return self._int32BE.unpack(self._stream.read(4))[0]
+        return self._unpack(self._int32BE)
 
     def read_uint64(self) -> int:
         """
         Read 8 bytes as an unsigned integer value from the stream.
         """
-        return self._uint64.unpack(self._stream.read(8))[0]
+        return self._unpack(self._uint64)
 
     def read_uint64BE(self) -> int:
         """
         Read 8 bytes as an unsigned integer value from the stream.
         """
-        return self._uint64BE.unpack(self._stream.read(8))[0]
+        return self._unpack(self._uint64BE)
 
     def read_int64(self) -> int:
         """
         Read 8 bytes as a signed integer value from the stream.
         """
-        return self._int64.unpack(self._stream.read(8))[0]
+        return self._unpack(self._int64)
 
     def read_int64BE(self) -> int:
         """
         Read 8 bytes as a signed integer value from the stream.
         """
-        return self._int64BE.unpack(self._stream.read(8))[0]
+        return self._unpack(self._int64BE)
+
+    def read_struct(self, fmt: struct.Struct) -> tuple:
+        """
+        Read `fmt.size` bytes and unpack them in one go according to the precompiled format `fmt`.
+
+        Args:
+            fmt: precompiled format.
+
+        Raises:
+            InsufficientDataError: if `fmt.size` bytes of data cannot be read from the stream.
+        """
+        offset = self._offset
+        if self._view.nbytes - offset < fmt.size:
+            raise self._insufficient_data(fmt.size)
+        self._offset = offset + fmt.size
+        return fmt.unpack_from(self._view, offset)
 
     def read_var_int(self, max: int = sys.maxsize) -> int:
         """
@@ -268,19 +512,19 @@ class BinaryReader(object):
 
         Raises:
             ValueError: if the return value exceeds the `max` argument.
+            InsufficientDataError: if the stream ends before the complete integer.
         """
-        fb = int.from_bytes(self.read_byte(), "little")
-        if fb == 0:
-            return fb
-
-        if fb == 0xFD:
-            value = self.read_uint16()
-        elif fb == 0xFE:
-            value = self.read_uint32()
-        elif fb == 0xFF:
-            value = self.read_uint64()
-        else:
-            value = fb
+        offset = self._offset
+        try:
+            value, self._offset = varint.decode(self._view, offset)
+        except IndexError:
+            raise InsufficientDataError(
+                "Could not read byte from empty stream", 1
+            ) from None
+        except struct.error:
+            self._offset = offset + 1
+            # the prefixes 0xFD, 0xFE and 0xFF are followed by 2, 4 and 8 bytes respectively
+            raise self._insufficient_data(1 << (self._view[offset] - 0xFC)) from None
 
         if value > max:
             raise ValueError("Invalid format")
@@ -309,6 +553,19 @@ class BinaryReader(object):
         length = self.read_var_int(max)
         return self.read_bytes(length, _skip_length_check=True)
 
+    def read_var_view(self, max: int = sys.maxsize) -> memoryview:
+        """
+        Read bytes that starts with a variable length indicator without copying them.
+
+        The zero-copy counterpart of :func:`~epicchain.core.serialization.BinaryReader.read_var_bytes`. See
+        :func:`~epicchain.core.serialization.BinaryReader.read_view` for the lifetime of the returned view.
+
+        Args:
+            max: (Optional) maximum number of bytes to read.
+        """
+        length = self.read_var_int(max)
+        return self.read_view(length, _skip_length_check=True)
+
     def read_var_string(self, max: int = sys.maxsize) -> str:
         """
         Read a UTF-8 string that starts with a variable length indicator.
@@ -328,9 +585,13 @@ class BinaryReader(object):
             ValueError: if decoding fails or insufficient data is present in the stream.
         """
         length = self.read_var_int(max)
+        data = self.read_view(length, _skip_length_check=True)
+        if len(data) != length:
+            raise InsufficientDataError(
+                f"unpack requires a buffer of {length} bytes", length - len(data)
+            )
         try:
-            data = struct.unpack(f"{length}s", self._stream.read(length))[0]
-            return data.decode("utf-8")
+            return str(data, "utf-8")
         except Exception as e:
             raise ValueError(str(e))
 
@@ -370,6 +631,8 @@ class BinaryReader(object):
                 obj = obj_type._serializable_init()
                 obj.deserialize(self)
                 obj_array.append(obj)
+        except InsufficientDataError as e:
+            raise InsufficientDataError(f"Insufficient data - {str(e)}", e.needed)
         except Exception as e:
             raise ValueError(f"Insufficient data - {str(e)}")
         return obj_array
@@ -381,14 +644,17 @@ class BinaryReader(object):
         Note:
             This is done automatically when using the context manager
         """
-        if self._stream:
-            self._stream.close()
+        self._view.release()
 
 
 class BinaryWriter(object):
     """
     A convenience class for writing data to byte streams.
 
+    Data is written into a single `bytearray` that grows as needed. Appending at the end of the buffer is the fast
+    path, so a `size_hint` only pays off for writers that fill the preallocated buffer with few large writes. Use :meth:`~epicchain.core.serialization.BinaryWriter.getbuffer` to access the
+    written data without copying it.
+
     Context manager support is available to ensure proper cleanup of resources.
 
     Example:
@@ -396,18 +662,35 @@ class BinaryWriter(object):
 
         with serialization.BinaryWriter() as bw:
             bw.write_uint8(5)
-            self.assertEqual(b'\\x05', bw._stream.getvalue())
+            self.assertEqual(b'\\x05', bw.to_array())
     """
 
-    def __init__(self, stream: Optional[bytearray | bytes] = None) -> None:
+    _bool = struct.Struct("?")
+    _uint8 = struct.Struct("<B")
+    _uint16 = struct.Struct("<H")
+    _uint32 = struct.Struct("<I")
+    _uint64 = struct.Struct("<Q")
+    _int16 = struct.Struct("<h")
+    _int32 = struct.Struct("<i")
+    _int64 = struct.Struct("<q")
+
+    def __init__(
+        self, stream: Optional[bytearray | bytes] = None, size_hint: int = 0
+    ) -> None:
         """
         Create an instance.
 
         Args:
             stream: a stream to operate on.
+            size_hint: number of bytes to preallocate.
         """
         super(BinaryWriter, self).__init__()
-        self._stream = BytesIO(stream) if stream else BytesIO()
+        buffer = bytearray(stream) if stream else bytearray()
+        self._initial_length = len(buffer)
+        if size_hint > len(buffer):
+            buffer.extend(bytes(size_hint - len(buffer)))
+        self._buffer = buffer
+        self._offset = 0
 
     def __enter__(self):
         return self
@@ -416,18 +699,9 @@ class BinaryWriter(object):
         self.close()
 
     def __len__(self):
-        io = self._stream
-        # Remember our current position
-        cur_pos = io.tell()
-        # Seek to the end of the File object
-        io.seek(0, SEEK_END)
-        # Remember position, which is equal to the full length
-        full_size = io.tell()
-        # Seek back to the current position
-        io.seek(cur_pos)
-        return full_size
-
-    def write_bytes(self, value: bytes) -> int:
+        return max(self._offset, self._initial_length)
+
+    def write_bytes(self, value: bytes | bytearray | memoryview) -> int:
         """
         Write a `bytes` type to the stream.
 
@@ -437,7 +711,49 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._stream.write(value)
+        offset = self._offset
+        end = offset + len(value)
+        # grows the buffer if `end` lies beyond the current allocation
+        self._buffer[offset:end] = value
+        self._offset = end
+        return end - offset
+
+    def _pack_into(self, fmt: struct.Struct, data) -> int:
+        offset = self._offset
+        buffer = self._buffer
+        if offset == len(buffer):
+            # appending is cheaper than growing the buffer and packing into it afterwards
+            buffer += fmt.pack(data)
+        else:
+            end = offset + fmt.size
+            if end > len(buffer):
+                buffer.extend(bytes(end - len(buffer)))
+            fmt.pack_into(buffer, offset, data)
+        self._offset = offset + fmt.size
+        return fmt.size
+
+    def write_struct(self, fmt: struct.Struct, *values) -> int:
+        """
+        Pack `values` in one go according to the precompiled format `fmt` and write them to the stream.
+
+        Args:
+            fmt: precompiled format.
+            values: the values to pack.
+
+        Returns:
+            int: the number of bytes written.
+        """
+        offset = self._offset
+        buffer = self._buffer
+        if offset == len(buffer):
+            buffer += fmt.pack(*values)
+        else:
+            end = offset + fmt.size
+            if end > len(buffer):
+                buffer.extend(bytes(end - len(buffer)))
+            fmt.pack_into(buffer, offset, *values)
+        self._offset = offset + fmt.size
+        return fmt.size
 
     def _pack(self, fmt, data) -> int:
         """
@@ -452,7 +768,7 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self.write_bytes(struct.pack(fmt, data))
+        return self._pack_into(_get_struct(fmt), data)
 
     def write_bool(self, value: bool) -> int:
         """
@@ -464,7 +780,7 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("?", value)
+        return self._pack_into(self._bool, value)
 
     def write_uint8(self, value) -> int:
         """
@@ -475,7 +791,7 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self.write_bytes(bytes([value]))
+        return self._pack_into(self._uint8, value)
 
     def write_uint16(self, value: int, endian: str = "<") -> int:
         """
@@ -488,7 +804,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%sH" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._uint16, value)
+        return self._pack(endian + "H", value)
 
     def write_uint32(self, value: int, endian: str = "<") -> int:
         """
@@ -501,7 +819,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%sI" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._uint32, value)
+        return self._pack(endian + "I", value)
 
     def write_uint64(self, value: int, endian: str = "<") -> int:
         """
@@ -514,7 +834,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%sQ" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._uint64, value)
+        return self._pack(endian + "Q", value)
 
     def write_int16(self, value: int, endian: str = "<") -> int:
         """
@@ -525,7 +847,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%sh" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._int16, value)
+        return self._pack(endian + "h", value)
 
     def write_int32(self, value: int, endian: str = "<") -> int:
         """
@@ -536,7 +860,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%si" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._int32, value)
+        return self._pack(endian + "i", value)
 
     def write_int64(self, value: int, endian: str = "<") -> int:
         """
@@ -547,7 +873,9 @@ class BinaryWriter(object):
         Returns:
             int: the number of bytes written.
         """
-        return self._pack("%sq" % endian, value)
+        if endian == "<":
+            return self._pack_into(self._int64, value)
+        return self._pack(endian + "q", value)
 
     def write_var_string(self, value: str, encoding: str = "utf-8") -> int:
         """
@@ -591,31 +919,16 @@ class BinaryWriter(object):
 
         Raises:
             TypeError: if ``value`` is not of type int.
-            ValueError: if `value` is < 0.
+            ValueError: if `value` is < 0 or exceeds the uint64 range.
 
         Returns:
             int: the number of bytes written.
         """
-        if not isinstance(value, int):
-            raise TypeError("%s not int type." % value)
-
-        if value < 0:
-            raise ValueError("%d too small." % value)
-
-        elif value < 0xFD:
-            return self.write_bytes(bytes([value]))
-
-        elif value <= 0xFFFF:
-            self.write_bytes(bytes([0xFD]))
-            return self.write_uint16(value, endian)
-
-        elif value <= 0xFFFFFFFF:
-            self.write_bytes(bytes([0xFE]))
-            return self.write_uint32(value, endian)
-
-        else:
-            self.write_bytes(bytes([0xFF]))
-            return self.write_uint64(value, endian)
+        data = varint.encode(value)
+        if endian != "<" and len(data) > 1:
+            # keep the prefix, reverse the little endian value
+            data = data[:1] + data[:0:-1]
+        return self.write_bytes(data)
 
     def write_var_bytes(self, value: bytes, endian: str = "<") -> int:
         """
@@ -653,24 +966,484 @@ class BinaryWriter(object):
         Serialize a list of objects and write them to the stream.
 
         Args:
-            objects: a list of objects.
-        """
-        self.write_var_int(len(objects))
+            objects: a list of objects, or an array type like :class:`~epicchain.core.types.UInt256Array`.
+        """
+        if not isinstance(objects, list):
+            # array types write their count prefix and items in one go
+            serialize = getattr(objects, "serialize", None)
+            if serialize is not None:
+                serialize(self)
+                return
+        self.write_bytes(varint.encode(len(objects)))
         for o in objects:
             o.serialize(self)
 
     def close(self) -> None:
         """
-        Close the internal stream to prevent resource leaking.
+        Release the internal buffer to prevent resource leaking.
 
         Note:
             This is done automatically when using the context manager
         """
-        if self._stream:
-            self._stream.close()
+        self._buffer = bytearray()
+        self._initial_length = self._offset = 0
+
+    def getbuffer(self) -> memoryview:
+        """
+        Get a view of the data written so far without copying it.
+
+        Note:
+            The writer cannot grow its buffer while a view is held. Release the view (or let it go out of scope)
+            before writing more data.
+        """
+        return memoryview(self._buffer)[: len(self)]
 
     def to_array(self) -> bytes:
         """
         Get the raw bytes from the underlying stream.
+
+        Note:
+            The data is copied once, as `bytes` cannot share the memory of the writer's `bytearray`. Use
+            :meth:`~epicchain.core.serialization.BinaryWriter.getbuffer` where a read-only view suffices, e.g. for
+            hashing.
         """
-        return self._stream.getvalue()
+        with self.getbuffer() as view:
+            return view.tobytes()
+
+
+@functools.lru_cache(maxsize=32)
+def _get_struct(fmt: str) -> struct.Struct:
+    return struct.Struct(fmt)
+
+
+class Field:
+    """
+    A single field of a :class:`~epicchain.core.serialization.SerializationPlan`.
+
+    Use the factory methods to create instances. Fixed-width fields are packed with a `struct` format, variable
+    length fields read and write themselves through the `BinaryReader` and `BinaryWriter`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fmt: Optional[str] = None,
+        encode: Optional[Callable[[Any], Any]] = None,
+        decode: Optional[Callable[[Any], Any]] = None,
+        read: Optional[Callable[[BinaryReader], Any]] = None,
+        write: Optional[Callable[[BinaryWriter, Any], Any]] = None,
+    ):
+        """
+        Args:
+            name: the attribute name on the object.
+            fmt: `struct` format character(s) for fixed-width fields.
+            encode: convert the attribute value into a value accepted by `fmt`.
+            decode: convert the unpacked value into the attribute value.
+            read: read a variable length value from the reader.
+            write: write a variable length value to the writer.
+        """
+        if (fmt is None) == (read is None or write is None):
+            raise ValueError(
+                "A field must either have a format or both a read and write function"
+            )
+        self.name = name
+        self.fmt = fmt
+        self.encode = encode
+        self.decode = decode
+        self.read = read
+        self.write = write
+
+    @property
+    def is_fixed(self) -> bool:
+        """True if the field has a fixed width."""
+        return self.fmt is not None
+
+    @classmethod
+    def boolean(cls, name: str) -> Field:
+        return cls(name, "?")
+
+    @classmethod
+    def uint8(cls, name: str, decode: Optional[Callable[[int], Any]] = None) -> Field:
+        return cls(name, "B", decode=decode)
+
+    @classmethod
+    def uint16(cls, name: str) -> Field:
+        return cls(name, "H")
+
+    @classmethod
+    def uint32(cls, name: str) -> Field:
+        return cls(name, "I")
+
+    @classmethod
+    def uint64(cls, name: str) -> Field:
+        return cls(name, "Q")
+
+    @classmethod
+    def int16(cls, name: str) -> Field:
+        return cls(name, "h")
+
+    @classmethod
+    def int32(cls, name: str) -> Field:
+        return cls(name, "i")
+
+    @classmethod
+    def int64(cls, name: str) -> Field:
+        return cls(name, "q")
+
+    @classmethod
+    def fixed_bytes(
+        cls, name: str, length: int, obj_type: Optional[Type[ISerializable]] = None
+    ) -> Field:
+        """
+        A fixed length byte sequence.
+
+        Args:
+            name: the attribute name on the object.
+            length: number of bytes.
+            obj_type: an optional type that is constructed from and serializes to exactly `length` bytes,
+                like `UInt160` or `UInt256`.
+        """
+        fmt = f"{int(length)}s"
+        if obj_type is None:
+            return cls(name, fmt)
+        return cls(name, fmt, encode=obj_type.to_array, decode=obj_type)
+
+    @classmethod
+    def var_bytes(cls, name: str, max: int = sys.maxsize) -> Field:
+        return cls(
+            name,
+            read=lambda reader: reader.read_var_bytes(max),
+            write=lambda writer, value: writer.write_var_bytes(value),
+        )
+
+    @classmethod
+    def serializable(cls, name: str, obj_type: Type[ISerializable]) -> Field:
+        return cls(
+            name,
+            read=lambda reader: reader.read_serializable(obj_type),
+            write=lambda writer, value: writer.write_serializable(value),
+        )
+
+    @classmethod
+    def serializable_list(
+        cls, name: str, obj_type: Type[ISerializable], max: Optional[int] = None
+    ) -> Field:
+        return cls(
+            name,
+            read=lambda reader: reader.read_serializable_list(obj_type, max),
+            write=lambda writer, value: writer.write_serializable_list(value),
+        )
+
+
+class _FixedRun:
+    """Consecutive fixed-width fields compiled into a single `struct.Struct`."""
+
+    def __init__(self, fields: Sequence[Field]):
+        self.fields = tuple(fields)
+        self.names = tuple(f.name for f in fields)
+        self.fmt = struct.Struct("<" + "".join(f.fmt for f in fields))  # type: ignore
+        self._getter = operator.attrgetter(*self.names)
+        self._encoders = [(i, f.encode) for i, f in enumerate(fields) if f.encode]
+        self._decoders = [(i, f.decode) for i, f in enumerate(fields) if f.decode]
+
+    def write(self, obj: object, writer: BinaryWriter) -> None:
+        values = self._getter(obj)
+        if len(self.names) == 1:
+            values = (values,)
+        if self._encoders:
+            encoded = list(values)
+            for i, encode in self._encoders:
+                encoded[i] = encode(encoded[i])
+            writer.write_struct(self.fmt, *encoded)
+        else:
+            writer.write_struct(self.fmt, *values)
+
+    def read(self, obj: object, reader: BinaryReader) -> None:
+        values = reader.read_struct(self.fmt)
+        if self._decoders:
+            decoded = list(values)
+            for i, decode in self._decoders:
+                decoded[i] = decode(decoded[i])
+            values = tuple(decoded)
+        for name, value in zip(self.names, values):
+            setattr(obj, name, value)
+
+
+class SerializationPlan:
+    """
+    A declarative field schema for `ISerializable` objects, compiled once per class.
+
+    Consecutive fixed-width fields are compiled into a single precompiled `struct.Struct` such that they are read and
+    written with one call. Variable length fields are processed in between in declaration order.
+
+    Example:
+    ::
+
+        class Foo(ISerializable):
+            _plan = SerializationPlan(
+                Field.uint32("version"),
+                Field.fixed_bytes("prev_hash", 32, types.UInt256),
+                Field.var_bytes("script", max=1024),
+            )
+
+            def serialize(self, writer: BinaryWriter) -> None:
+                self._plan.serialize(self, writer)
+
+            def deserialize(self, reader: BinaryReader) -> None:
+                self._plan.deserialize(self, reader)
+    """
+
+    def __init__(self, *fields: Field):
+        """
+        Args:
+            fields: the fields in serialization order.
+        """
+        self.fields = fields
+        self._steps: list[_FixedRun | Field] = []
+
+        run: list[Field] = []
+        for field in fields:
+            if field.is_fixed:
+                run.append(field)
+                continue
+            if run:
+                self._steps.append(_FixedRun(run))
+                run = []
+            self._steps.append(field)
+        if run:
+            self._steps.append(_FixedRun(run))
+
+        #: The number of bytes occupied by all fixed-width fields.
+        self.fixed_size = sum(
+            s.fmt.size for s in self._steps if isinstance(s, _FixedRun)
+        )
+
+    def serialize(self, obj: object, writer: BinaryWriter) -> None:
+        """
+        Write the fields of `obj` to the stream.
+
+        Args:
+            obj: the object to read the attributes from.
+            writer: instance.
+        """
+        for step in self._steps:
+            if isinstance(step, _FixedRun):
+                step.write(obj, writer)
+            else:
+                step.write(writer, getattr(obj, step.name))  # type: ignore
+
+    def deserialize(self, obj: object, reader: BinaryReader) -> None:
+        """
+        Read the fields from the stream and set them on `obj`.
+
+        Args:
+            obj: the object to set the attributes on.
+            reader: instance.
+        """
+        for step in self._steps:
+            if isinstance(step, _FixedRun):
+                step.read(obj, reader)
+            else:
+                setattr(obj, step.name, step.read(reader))  # type: ignore
+
+
+class _StrictBinaryReader(BinaryReader):
+    """A reader that fails on incomplete variable length data instead of returning what is available."""
+
+    def read_view(self, length: int, _skip_length_check: bool = False) -> memoryview:
+        return super(_StrictBinaryReader, self).read_view(length)
+
+
+class StreamDeserializer(Generic[ISerializable_T]):
+    """
+    Incrementally deserialize consecutive objects of `obj_type` from data that arrives in chunks, e.g. from a socket
+    or a file.
+
+    Data is buffered until the next object is complete. If an object cannot be read yet, the number of missing bytes
+    is available via :attr:`needed` and no new attempt is made before at least that many bytes have been fed.
+    Consumed data is discarded right away, such that the buffer only holds the object in progress.
+
+    Objects are either self delimiting, preceded by a fixed-width size indicator described by `length_prefix`, or
+    framed by a header that `frame_size` reads the object size from, like the payload length of a
+    :class:`~epicchain.network.message.Message`. Length prefixed and framed objects are parsed exactly once. A self
+    delimiting object is parsed again from its own start every time a read ran out of data.
+
+    The stream cannot be resynchronised after malformed data, except for a framed object that fails to deserialize:
+    its frame is skipped and the error is passed to `on_error`.
+
+    Example:
+    ::
+
+        parser = StreamDeserializer(message.Message, frame_size=message.Message.read_frame_size)
+        while data := await reader.read(max(parser.needed, 65536)):
+            for msg in parser.feed(data):
+                handle(msg)
+    """
+
+    def __init__(
+        self,
+        obj_type: Type[ISerializable_T],
+        length_prefix: Optional[str] = None,
+        max_size: int = sys.maxsize,
+        frame_size: Optional[Callable[[BinaryReader], int]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ) -> None:
+        """
+        Args:
+            obj_type: the object class to deserialize into.
+            length_prefix: (Optional) `struct` format of the size indicator preceding each object, e.g. "<I".
+            max_size: (Optional) maximum size of a single object in number of bytes.
+            frame_size: (Optional) reads the frame header at the start of each object and returns the number of
+                bytes following it. Raises `ValueError` if the header is malformed.
+            on_error: (Optional) called with the exception of a framed object that failed to deserialize, after which
+                its frame is skipped. If not set the exception is handled as malformed data.
+        """
+        self._obj_type = obj_type
+        self._prefix = struct.Struct(length_prefix) if length_prefix else None
+        self._frame_size = frame_size
+        self._on_error = on_error
+        self.max_size = max_size
+        self._buffer = bytearray()
+        self._start = 0
+        self._required = self._minimum_size()
+        self._error: Optional[Exception] = None
+
+    def _minimum_size(self) -> int:
+        return self._prefix.size if self._prefix else 1
+
+    @property
+    def buffered(self) -> int:
+        """The number of bytes received but not yet consumed."""
+        return len(self._buffer) - self._start
+
+    @property
+    def needed(self) -> int:
+        """The minimum number of bytes to feed before the next object can be returned."""
+        return max(self._required - self.buffered, 0)
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """The malformed data error that the next :meth:`feed` call raises, if any."""
+        return self._error
+
+    def feed(self, data: bytes | bytearray | memoryview) -> list[ISerializable_T]:
+        """
+        Add the next chunk of the stream.
+
+        Args:
+            data: the received bytes.
+
+        Raises:
+            ValueError: if the stream holds malformed data or an object exceeds `max_size`. The buffered data is
+                discarded as the stream cannot be resynchronised. If objects were completed before the malformed
+                data, they are returned instead and the error is raised by the next call.
+
+        Returns:
+            the objects completed by `data` in stream order.
+        """
+        if self._error is not None:
+            error = self._error
+            self.reset()
+            raise error
+
+        try:
+            self._buffer += data
+        except BufferError:
+            # a view on the buffer is still referenced, leave it untouched
+            self._buffer = self._buffer[self._start :] + data
+            self._start = 0
+
+        objects = []
+        try:
+            while self.buffered >= self._required:
+                obj = self._read_next()
+                if obj is not None:
+                    objects.append(obj)
+        except Exception as e:
+            self.reset()
+            if not objects:
+                raise
+            self._error = e
+
+        if self._start:
+            try:
+                del self._buffer[: self._start]
+            except BufferError:
+                self._buffer = self._buffer[self._start :]
+            self._start = 0
+        return objects
+
+    def _read_next(self) -> Optional[ISerializable_T]:
+        start = self._start
+        if self._prefix:
+            (length,) = self._prefix.unpack_from(self._buffer, start)
+            if length > self.max_size:
+                raise ValueError(
+                    f"Object size {length} exceeds the maximum of {self.max_size}"
+                )
+            consumed = self._prefix.size + length
+            if self.buffered < consumed:
+                self._required = consumed
+                return None
+            view = memoryview(self._buffer)[
+                start + self._prefix.size : start + consumed
+            ]
+            with BinaryReader(view) as br:
+                obj = br.read_serializable(self._obj_type)
+        elif self._frame_size:
+            return self._read_next_frame(self._frame_size)
+        else:
+            with _StrictBinaryReader(memoryview(self._buffer)[start:]) as br:
+                try:
+                    obj = br.read_serializable(self._obj_type)
+                except InsufficientDataError as e:
+                    self._required = self.buffered + e.needed
+                    if self._required > self.max_size:
+                        raise ValueError(
+                            f"Object size exceeds the maximum of {self.max_size}"
+                        )
+                    return None
+                consumed = br._offset
+
+        self._start = start + consumed
+        self._required = self._minimum_size()
+        return obj
+
+    def _read_next_frame(
+        self, frame_size: Callable[[BinaryReader], int]
+    ) -> Optional[ISerializable_T]:
+        start = self._start
+        with _StrictBinaryReader(memoryview(self._buffer)[start:]) as br:
+            try:
+                length = frame_size(br)
+            except InsufficientDataError as e:
+                self._required = self.buffered + e.needed
+                return None
+            length += br.tell()
+        if length > self.max_size:
+            raise ValueError(
+                f"Object size {length} exceeds the maximum of {self.max_size}"
+            )
+        if self.buffered < length:
+            self._required = length
+            return None
+
+        # the frame is consumed even if the object turns out to be malformed
+        self._start = start + length
+        self._required = self._minimum_size()
+        view = memoryview(self._buffer)[start : start + length]
+        try:
+            with BinaryReader(view) as br:
+                return br.read_serializable(self._obj_type)
+        except Exception as e:
+            if self._on_error is None:
+                raise
+            self._on_error(e)
+            return None
+
+    def reset(self) -> None:
+        """Discard all buffered data."""
+        self._buffer = bytearray()
+        self._start = 0
+        self._required = self._minimum_size()
+        self._error = None
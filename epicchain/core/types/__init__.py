@@ -1,4 +1,4 @@
 from .uint import *
 from pybiginteger import BigInteger
 
-__all__ = ["UInt160", "UInt256", "BigInteger"]
+__all__ = ["UInt160", "UInt256", "UInt256Array", "BigInteger"]
@@ -1,12 +1,68 @@
 from __future__ import annotations
+import sys
+import bisect
+import functools
 from epicchain.core import serialization
-from typing import Type, Optional
+from typing import Type, TypeVar, Optional, overload
+from collections.abc import Sequence, Iterable, Iterator
 
-__all__ = ["UInt160", "UInt256"]
+__all__ = ["UInt160", "UInt256", "UInt256Array"]
+
+_UInt_T = TypeVar("_UInt_T", bound="_UIntBase")
+
+#: Maximum number of entries held by each of the string conversion caches.
+STRING_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=STRING_CACHE_SIZE)
+def _data_to_string(data: bytes) -> str:
+    db = bytearray(data)
+    db.reverse()
+    return db.hex()
+
+
+@functools.lru_cache(maxsize=STRING_CACHE_SIZE)
+def _string_to_data(value: str) -> bytes:
+    # only successful conversions are cached, a ValueError of fromhex() does not create an entry
+    reversed_data = bytearray.fromhex(value)
+    reversed_data.reverse()
+    return bytes(reversed_data)
+
+
+def string_cache_info() -> dict[str, functools._CacheInfo]:
+    """
+    Return the hit and miss counters of the caches behind ``str()`` and ``from_string()`` of the UInt types.
+    """
+    return {
+        "str": _data_to_string.cache_info(),
+        "from_string": _string_to_data.cache_info(),
+    }
+
+
+def clear_string_caches() -> None:
+    """
+    Empty the string conversion caches and reset their counters.
+    """
+    _data_to_string.cache_clear()
+    _string_to_data.cache_clear()
+
+
+#: The instance returned by ``zero()`` for each UInt type.
+_shared_zeros: dict[type, _UIntBase] = {}
+
+
+def _shared_zero(cls: Type[_UInt_T]) -> _UInt_T:
+    try:
+        return _shared_zeros[cls]  # type: ignore
+    except KeyError:
+        return _shared_zeros.setdefault(cls, cls(data=cls._ZERO))  # type: ignore
 
 
 class _UIntBase(serialization.ISerializable):
+    __slots__ = ("_data",)
+
     _BYTE_LEN = 0
+    _ZERO = b""
 
     def __init__(self, data: Optional[bytes | bytearray] = None) -> None:
         """
@@ -24,7 +80,7 @@ class _UIntBase(serialization.ISerializable):
                 raise ValueError(
                     f"Invalid UInt: data length {len(data)} != specified num_bytes {num_bytes}"
                 )
-            self._data = data[:num_bytes]
+            self._data = bytes(data[:num_bytes])
 
     def __len__(self) -> int:
         """Count of data bytes."""
@@ -46,45 +102,40 @@ class _UIntBase(serialization.ISerializable):
         return False
 
     def __hash__(self):
-        slice_length = 4 if len(self._data) >= 4 else len(self._data)
-        return int.from_bytes(self._data[:slice_length], "little")
+        # covers all bytes and is randomized per process, such that crafted values do not collide
+        return hash(self._data)
 
     def __str__(self):
         """Convert the data to a human-readable format (data is in reverse byte order)."""
-        db = bytearray(self._data)
-        db.reverse()
-        return db.hex()
+        return _data_to_string(self._data)
 
-    def _compare_to(self, other) -> int:
+    def _ordering_key(self, other) -> tuple[bytes, bytes]:
         if not isinstance(other, type(self)):
             raise TypeError(
                 f"Cannot compare {type(self).__name__} to type {type(other).__name__}"
             )
+        # the data is little endian, thus comparing the reversed bytes compares the numeric values
+        return self._data[::-1], other._data[::-1]
 
-        x = self._data
-        y = other._data
-
-        length = len(x)
-
-        for i in range(length - 1, 0, -1):
-            if x[i] > y[i]:
-                return 1
-            if x[i] < y[i]:
-                return -1
-
-        return 0
+    def _compare_to(self, other) -> int:
+        x, y = self._ordering_key(other)
+        return (x > y) - (x < y)
 
     def __lt__(self, other):
-        return self._compare_to(other) < 0
+        x, y = self._ordering_key(other)
+        return x < y
 
     def __gt__(self, other):
-        return self._compare_to(other) > 0
+        x, y = self._ordering_key(other)
+        return x > y
 
     def __le__(self, other):
-        return self._compare_to(other) <= 0
+        x, y = self._ordering_key(other)
+        return x <= y
 
     def __ge__(self, other):
-        return self._compare_to(other) >= 0
+        x, y = self._ordering_key(other)
+        return x >= y
 
     def to_array(self) -> bytes:
         """
@@ -100,7 +151,11 @@ class _UIntBase(serialization.ISerializable):
 
 
 class UInt160(_UIntBase):
+    __slots__ = ()
+
     _BYTE_LEN = 20
+    # shared by all zero instances
+    _ZERO = bytes(_BYTE_LEN)
 
     def __init__(self, data: bytes):
         """
@@ -149,17 +204,15 @@ class UInt160(_UIntBase):
             raise ValueError(
                 f"Invalid {cls.__name__} Format: {len(value)} chars != {cls._BYTE_LEN * 2} chars"
             )
-        reversed_data = bytearray.fromhex(value)
-        reversed_data.reverse()
-        return cls(data=reversed_data)
+        return cls(data=_string_to_data(value))
 
     @classmethod
     def zero(cls: Type[UInt160]) -> UInt160:
         """
         Returns:
-            An instance initialized to zero.
+            The shared instance initialized to zero. Never deserialize into it.
         """
-        return cls(data=bytes(20))
+        return _shared_zero(cls)
 
     def serialize(self, writer: serialization.BinaryWriter) -> None:
         """
@@ -176,12 +229,21 @@ class UInt160(_UIntBase):
 
         Args:
             reader: instance.
+
+        Raises:
+            ValueError: if called on the instance returned by :meth:`zero`.
         """
-        self._data = bytes(reader.read_bytes(self._BYTE_LEN))
+        if self is _shared_zeros.get(type(self)):
+            raise ValueError("Cannot deserialize into the shared zero instance")
+        self._data = reader.read_bytes(self._BYTE_LEN)
 
 
 class UInt256(_UIntBase):
+    __slots__ = ()
+
     _BYTE_LEN = 32
+    # shared by all zero instances
+    _ZERO = bytes(_BYTE_LEN)
 
     def __init__(self, data: bytes):
         """
@@ -230,18 +292,15 @@ class UInt256(_UIntBase):
             raise ValueError(
                 f"Invalid {cls.__name__} Format: {len(value)} chars != {cls._BYTE_LEN * 2} chars"
             )
-        reversed_data = bytearray.fromhex(value)
-        reversed_data.reverse()
-        return cls(data=reversed_data)
+        return cls(data=_string_to_data(value))
 
     @classmethod
     def zero(cls: Type[UInt256]) -> UInt256:
         """
         Returns:
-            An instance initialized to zero.
+            The shared instance initialized to zero. Never deserialize into it.
         """
-
-        return cls(data=bytes(cls._BYTE_LEN))
+        return _shared_zero(cls)
 
     def serialize(self, writer: serialization.BinaryWriter) -> None:
         """
@@ -258,5 +317,217 @@ class UInt256(_UIntBase):
 
         Args:
             reader: instance.
+
+        Raises:
+            ValueError: if called on the instance returned by :meth:`zero`.
+        """
+        if self is _shared_zeros.get(type(self)):
+            raise ValueError("Cannot deserialize into the shared zero instance")
+        self._data = reader.read_bytes(self._BYTE_LEN)
+
+
+class _SortedItems(Sequence):
+    # exposes a buffer of sorted fixed size items to `bisect`
+    __slots__ = ("_data", "_size")
+
+    def __init__(self, data: bytes, size: int):
+        self._data = data
+        self._size = size
+
+    def __len__(self) -> int:
+        return len(self._data) // self._size
+
+    def __getitem__(self, index):
+        offset = index * self._size
+        return self._data[offset : offset + self._size]
+
+
+class UInt256Array(Sequence):
+    """
+    A compact sequence of `UInt256` values stored back-to-back in a single buffer.
+
+    Items are created on access, such that holding N hashes costs 32 * N bytes instead of a Python object per hash.
+    Membership tests use a sorted copy of the buffer that is built on first use.
+
+    Payloads taking a list of `UInt256`, like :class:`~epicchain.network.payloads.inventory.InventoryPayload`,
+    accept an instance in its place.
+
+    Example:
+    ::
+
+        hashes = UInt256Array([UInt256.zero()])
+        hashes.append(tx.hash())
+        assert tx.hash() in hashes
+    """
+
+    __slots__ = ("_data", "_sorted")
+
+    _ITEM_SIZE = 32
+
+    def __init__(self, values: Iterable[UInt256] = ()):
+        """
+        Args:
+            values: (Optional) the initial items.
+        """
+        self._data = bytearray()
+        self._sorted: Optional[_SortedItems] = None
+        self.extend(values)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview) -> UInt256Array:
+        """
+        Create an instance from the raw data of back-to-back hashes.
+
+        Args:
+            data: the concatenated hashes, without a length prefix.
+
+        Raises:
+            ValueError: if the data length is not a multiple of 32.
+        """
+        if len(data) % cls._ITEM_SIZE:
+            raise ValueError(
+                f"Invalid data length {len(data)} - must be a multiple of {cls._ITEM_SIZE}"
+            )
+        array = cls()
+        array._data[:] = data
+        return array
+
+    def __len__(self) -> int:
+        return len(self._data) // self._ITEM_SIZE
+
+    @overload
+    def __getitem__(self, index: int) -> UInt256:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> UInt256Array:
+        ...
+
+    def __getitem__(self, index):
+        size = self._ITEM_SIZE
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return self.from_bytes(self._data[start * size : stop * size])
+            return self.from_bytes(
+                b"".join(
+                    self._data[i * size : (i + 1) * size]
+                    for i in range(start, stop, step)
+                )
+            )
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("UInt256Array index out of range")
+        offset = index * size
+        return UInt256(self._data[offset : offset + size])
+
+    def __iter__(self) -> Iterator[UInt256]:
+        data = bytes(self._data)
+        size = self._ITEM_SIZE
+        for offset in range(0, len(data), size):
+            yield UInt256(data[offset : offset + size])
+
+    def __contains__(self, value) -> bool:
+        return self._find(value) is not None
+
+    def _find(self, value) -> Optional[bytes]:
+        if not isinstance(value, UInt256):
+            return None
+        if self._sorted is None:
+            size = self._ITEM_SIZE
+            items = sorted(
+                self._data[i : i + size] for i in range(0, len(self._data), size)
+            )
+            self._sorted = _SortedItems(b"".join(items), size)
+        key = value._data
+        i = bisect.bisect_left(self._sorted, key)
+        if i < len(self._sorted) and self._sorted[i] == key:
+            return key
+        return None
+
+    def index(self, value, start: int = 0, stop: int = sys.maxsize) -> int:
+        """
+        Return the position of the first occurrence of `value`.
+
+        Raises:
+            ValueError: if the value is not present.
+        """
+        key = self._find(value)
+        if key is not None:
+            size = self._ITEM_SIZE
+            start, stop, _ = slice(start, stop).indices(len(self))
+            offset = self._data.find(key, start * size, stop * size)
+            # find() also matches across item boundaries
+            while offset != -1:
+                if offset % size == 0:
+                    return offset // size
+                offset = self._data.find(key, offset + 1, stop * size)
+        raise ValueError(f"{value} is not in UInt256Array")
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UInt256Array):
+            return self._data == other._data
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return len(self) == len(other) and all(x == y for x, y in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} at {hex(id(self))}> {len(self)} items"
+
+    def append(self, value: UInt256) -> None:
+        """
+        Add a single item to the end.
+
+        Args:
+            value: the item to add.
+        """
+        self._data += value._data
+        self._sorted = None
+
+    def extend(self, values: Iterable[UInt256]) -> None:
+        """
+        Add all items in `values` to the end.
+
+        Args:
+            values: the items to add.
+        """
+        if isinstance(values, UInt256Array):
+            self._data += values._data
+        else:
+            self._data += b"".join(v._data for v in values)
+        self._sorted = None
+
+    def tobytes(self) -> bytes:
+        """Return the raw data of all items, without a length prefix."""
+        return bytes(self._data)
+
+    def serialize(self, writer: serialization.BinaryWriter) -> None:
+        """
+        Serialize the items with a var-int count prefix into a binary stream, like a list of `UInt256`.
+
+        Args:
+            writer: instance.
+        """
+        writer.write_var_int(len(self))
+        writer.write_bytes(self._data)
+
+    @classmethod
+    def deserialize_from(
+        cls, reader: serialization.BinaryReader, max: Optional[int] = None
+    ) -> UInt256Array:
+        """
+        Deserialize a var-int count prefixed list of `UInt256` from a binary stream.
+
+        Args:
+            reader: instance.
+            max: (Optional) the maximum number of items.
+
+        Raises:
+            ValueError: if the count prefix exceeds `max`.
+            ValueError: if the stream holds less items than the count prefix specifies.
         """
-        self._data = bytes(reader.read_bytes(self._BYTE_LEN))
+        count = reader.read_var_int()
+        if max is not None and count > max:
+            raise ValueError(f"Item count {count} exceeds the maximum of {max}")
+        return cls.from_bytes(reader.read_view(count * cls._ITEM_SIZE))
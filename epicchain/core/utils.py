@@ -1,7 +1,7 @@
-import hashlib
 from enum import Enum
 from collections.abc import Sequence
-from epicchain.core import serialization, Size, types
+from typing import Any, Callable
+from epicchain.core import serialization, Size, types, varint, hashing
 
 
 def get_var_size(value: object) -> int:
@@ -19,46 +19,81 @@ def get_var_size(value: object) -> int:
         TypeError: if a specific Iterable type is not supported.
         ValueError: if a specific object type is not supported .
     """
+    func = _var_size_dispatch.get(type(value))
+    if func is None:
+        func = _resolve_var_size(type(value))
+    return func(value)
+
+
+def _var_size_str(value: str) -> int:
     # public static int GetVarSize(this string value)
-    if isinstance(value, str):
-        value_size = len(value.encode("utf-8"))
-        return get_var_size(value_size) + value_size
-
-    # internal static int GetVarSize(int value)
-    elif isinstance(value, int):
-        if value < 0xFD:
-            return Size.uint8
-        elif value <= 0xFFFF:
-            return Size.uint8 + Size.uint16
-        else:
-            return Size.uint8 + Size.uint32
+    value_size = len(value.encode("utf-8"))
+    return varint.size(value_size) + value_size
+
 
+def _var_size_bytes(value: bytes | bytearray) -> int:
+    # experimental replacement for: value_size = value.Length * Marshal.SizeOf<T>();
+    # because I don't think we have a reliable 'SizeOf' in python
+    value_length = len(value)
+    return varint.size(value_length) + value_length
+
+
+def _var_size_sequence(value: Sequence) -> int:
     # internal static int GetVarSize<T>(this T[] value)
-    elif isinstance(value, Sequence):
-        value_length = len(value)
-        value_size = 0
-
-        if value_length > 0:
-            if isinstance(value[0], serialization.ISerializable):
-                value_size = sum(map(lambda t: len(t), value))
-            elif isinstance(value[0], Enum):
-                # Note: currently all Enum's in epicchain core (C#) are of type Byte. Only porting that part of the code
-                value_size = value_length * Size.uint8
-            elif isinstance(value, (bytes, bytearray)):
-                # experimental replacement for: value_size = value.Length * Marshal.SizeOf<T>();
-                # because I don't think we have a reliable 'SizeOf' in python
-                value_size = value_length * Size.uint8
-            else:
-                raise TypeError(
-                    f"Cannot accurately determine size of objects that do not inherit from 'ISerializable', "
-                    f"'Enum' or 'bytes'. Found type: {type(value[0])}"
-                )
+    value_length = len(value)
+    value_size = 0
+
+    if value_length > 0:
+        if isinstance(value[0], serialization.ISerializable):
+            value_size = sum(map(len, value))
+        elif isinstance(value[0], Enum):
+            # Note: currently all Enum's in epicchain core (C#) are of type Byte. Only porting that part of the code
+            value_size = value_length * Size.uint8
+        elif isinstance(value, (bytes, bytearray)):
+            value_size = value_length * Size.uint8
+        else:
+            raise TypeError(
+                f"Cannot accurately determine size of objects that do not inherit from 'ISerializable', "
+                f"'Enum' or 'bytes'. Found type: {type(value[0])}"
+            )
+
+    return varint.size(value_length) + value_size
+
+
+def _resolve_var_size(value_type: type) -> Callable[[Any], int]:
+    # handles subclasses of the supported types and remembers the outcome for the next call
+    if issubclass(value_type, str):
+        func: Callable[[Any], int] = _var_size_str
+    elif issubclass(value_type, int):
+        # internal static int GetVarSize(int value)
+        func = varint.size
+    elif issubclass(value_type, (bytes, bytearray)):
+        func = _var_size_bytes
+    elif issubclass(value_type, Sequence):
+        func = _var_size_sequence
     else:
         raise ValueError(
-            f"[NOT SUPPORTED] Unexpected value type {type(value)} for get_var_size()"
+            f"[NOT SUPPORTED] Unexpected value type {value_type} for get_var_size()"
         )
+    _var_size_dispatch[value_type] = func
+    return func
+
+
+def _var_size_uint256_array(value: types.UInt256Array) -> int:
+    value_length = len(value)
+    return varint.size(value_length) + value_length * Size.uint256
+
 
-    return get_var_size(value_length) + value_size
+#: Size functions by exact type, extended on first use of any other supported type.
+_var_size_dispatch: dict[type, Callable[[Any], int]] = {
+    str: _var_size_str,
+    int: varint.size,
+    bytes: _var_size_bytes,
+    bytearray: _var_size_bytes,
+    list: _var_size_sequence,
+    tuple: _var_size_sequence,
+    types.UInt256Array: _var_size_uint256_array,
+}
 
 
 def to_script_hash(data: bytes) -> types.UInt160:
@@ -68,6 +103,4 @@ def to_script_hash(data: bytes) -> types.UInt160:
     Args:
         data: data to hash
     """
-    intermediate_data = hashlib.sha256(data).digest()
-    data_ = hashlib.new("ripemd160", intermediate_data).digest()
-    return types.UInt160(data_)
+    return types.UInt160(hashing.hash160(data))
@@ -0,0 +1,194 @@
+"""
+Codec for the variable length integers (var-int) of the EpicChain network protocol.
+
+Values below 0xFD are encoded in a single byte. Larger values are prefixed with 0xFD, 0xFE or 0xFF followed by the
+value as little endian uint16, uint32 or uint64 respectively. See: :ref:`library-core-variable-length-encoding`
+
+The bulk functions process many values in one call. :func:`encode_many` is vectorised with NumPy when it is
+installed.
+"""
+from __future__ import annotations
+import struct
+from collections.abc import Sequence, Iterable
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None
+
+__all__ = ["size", "encode", "decode", "size_many", "encode_many", "decode_many"]
+
+MAX_VALUE = 0xFFFFFFFFFFFFFFFF
+
+_uint16 = struct.Struct("<H")
+_uint32 = struct.Struct("<I")
+_uint64 = struct.Struct("<Q")
+_prefixed_uint16 = struct.Struct("<BH")
+_prefixed_uint32 = struct.Struct("<BI")
+_prefixed_uint64 = struct.Struct("<BQ")
+
+# encoded single byte values, such that the most common case does not allocate
+_single = tuple(bytes([i]) for i in range(0xFD))
+
+# below this number of values the NumPy setup costs outweigh the vectorised encoding
+_NUMPY_THRESHOLD = 512
+
+
+def size(value: int) -> int:
+    """
+    Return the number of bytes `value` occupies when encoded.
+
+    Args:
+        value: a positive integer.
+    """
+    if value < 0xFD:
+        return 1
+    elif value <= 0xFFFF:
+        return 3
+    elif value <= 0xFFFFFFFF:
+        return 5
+    else:
+        return 9
+
+
+def encode(value: int) -> bytes:
+    """
+    Encode `value` as var-int.
+
+    Args:
+        value: the integer to encode.
+
+    Raises:
+        TypeError: if `value` is not an integer.
+        ValueError: if `value` is negative or exceeds the uint64 range.
+    """
+    try:
+        if 0 <= value < 0xFD:
+            return _single[value]
+        elif 0xFD <= value <= 0xFFFF:
+            return _prefixed_uint16.pack(0xFD, value)
+        elif 0xFFFF < value <= 0xFFFFFFFF:
+            return _prefixed_uint32.pack(0xFE, value)
+        elif 0xFFFFFFFF < value <= MAX_VALUE:
+            return _prefixed_uint64.pack(0xFF, value)
+    except (TypeError, struct.error):
+        raise TypeError("%s not int type." % value) from None
+
+    if value < 0:
+        raise ValueError("%d too small." % value)
+    raise ValueError("%d too large." % value)
+
+
+def decode(data: bytes | bytearray | memoryview, offset: int = 0) -> tuple[int, int]:
+    """
+    Decode a var-int from `data` starting at `offset`.
+
+    Args:
+        data: the buffer to read from.
+        offset: position of the var-int in `data`.
+
+    Raises:
+        IndexError: if `offset` lies beyond the end of `data`.
+        struct.error: if `data` ends before the var-int.
+
+    Returns:
+        the decoded value and the offset directly after it.
+    """
+    fb = data[offset]
+    if fb < 0xFD:
+        return fb, offset + 1
+    elif fb == 0xFD:
+        return _uint16.unpack_from(data, offset + 1)[0], offset + 3
+    elif fb == 0xFE:
+        return _uint32.unpack_from(data, offset + 1)[0], offset + 5
+    else:
+        return _uint64.unpack_from(data, offset + 1)[0], offset + 9
+
+
+def size_many(values: Iterable[int]) -> int:
+    """
+    Return the number of bytes all `values` occupy when encoded.
+
+    Args:
+        values: positive integers.
+    """
+    return sum(map(size, values))
+
+
+def encode_many(values: Sequence[int]) -> bytes:
+    """
+    Encode all `values` as consecutive var-ints.
+
+    Args:
+        values: the integers to encode.
+
+    Raises:
+        TypeError: if any value is not an integer.
+        ValueError: if any value is negative or exceeds the uint64 range.
+    """
+    if not values:
+        return b""
+    try:
+        if 0 <= min(values) and max(values) < 0xFD:
+            return bytes(values)
+    except TypeError:
+        pass  # encode() produces the error
+    if np is not None and len(values) >= _NUMPY_THRESHOLD:
+        return _encode_many_numpy(values)
+    return b"".join(map(encode, values))
+
+
+def _encode_many_numpy(values: Sequence[int]) -> bytes:
+    try:
+        arr = np.asarray(values, dtype=np.uint64)
+    except (OverflowError, TypeError, ValueError):
+        # let the scalar encoder report the offending value
+        return b"".join(map(encode, values))
+
+    sizes = np.select(
+        [arr < 0xFD, arr <= 0xFFFF, arr <= 0xFFFFFFFF], [1, 3, 5], default=9
+    )
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    out = np.empty(int(ends[-1]), dtype=np.uint8)
+
+    single = sizes == 1
+    out[starts[single]] = arr[single]
+    for prefix, width, dtype in ((0xFD, 2, "<u2"), (0xFE, 4, "<u4"), (0xFF, 8, "<u8")):
+        mask = sizes == width + 1
+        if not mask.any():
+            continue
+        positions = starts[mask]
+        out[positions] = prefix
+        payload = arr[mask].astype(dtype).view(np.uint8).reshape(-1, width)
+        out[(positions + 1)[:, None] + np.arange(width)] = payload
+    return out.tobytes()
+
+
+def decode_many(
+    data: bytes | bytearray | memoryview, count: int, offset: int = 0
+) -> tuple[list[int], int]:
+    """
+    Decode `count` consecutive var-ints from `data` starting at `offset`.
+
+    Args:
+        data: the buffer to read from.
+        count: the number of var-ints to decode.
+        offset: position of the first var-int in `data`.
+
+    Raises:
+        IndexError: if `data` ends before the last var-int starts.
+        struct.error: if `data` ends before the last var-int.
+
+    Returns:
+        the decoded values and the offset directly after the last one.
+    """
+    chunk = data[offset : offset + count]
+    if len(chunk) == count and max(chunk, default=0) < 0xFD:
+        return list(chunk), offset + count
+
+    values = []
+    for _ in range(count):
+        value, offset = decode(data, offset)
+        values.append(value)
+    return values, offset
@@ -11,6 +11,7 @@ from epicchain.network.payloads import (
     address,
     empty,
     extensible,
+    filter,
     ping,
     transaction,
 )
@@ -110,14 +111,15 @@ class Message(serialization.ISerializable):
             writer: instance.
         """
         payload = self.payload.to_array()
+        payload_len = len(payload)
 
         if (
-            len(self.payload) > self.COMPRESSION_MIN_SIZE
+            payload_len > self.COMPRESSION_MIN_SIZE
             and MessageConfig.COMPRESSED not in self.config
         ):
-            compressed_data = lz4.block.compress(self.payload.to_array(), store_size=False)  # type: ignore
-            compressed_data = len(payload).to_bytes(4, "little") + compressed_data
-            if len(compressed_data) < len(self.payload) - self.COMPRESSION_THRESHOLD:
+            compressed_data = lz4.block.compress(payload, store_size=False)  # type: ignore
+            compressed_data = payload_len.to_bytes(4, "little") + compressed_data
+            if len(compressed_data) < payload_len - self.COMPRESSION_THRESHOLD:
                 payload = compressed_data
                 self.config |= MessageConfig.COMPRESSED
 
@@ -125,6 +127,24 @@ class Message(serialization.ISerializable):
         writer.write_uint8(self.type.value)
         writer.write_var_bytes(payload)
 
+    @classmethod
+    def read_frame_size(cls, reader: serialization.BinaryReader) -> int:
+        """
+        Read the frame header of a serialized message and return the payload length that follows it.
+
+        Used as `frame_size` of a :class:`~epicchain.core.serialization.StreamDeserializer`, such that a message with
+        an invalid payload can be skipped.
+
+        Args:
+            reader: instance positioned at the start of the message.
+
+        Raises:
+            ValueError: if the payload length exceeds `PAYLOAD_MAX_SIZE`.
+        """
+        reader.read_uint8()
+        reader.read_uint8()
+        return reader.read_var_int(cls.PAYLOAD_MAX_SIZE)
+
     def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
         Deserialize the object from a binary stream.
@@ -135,7 +155,7 @@ class Message(serialization.ISerializable):
         self.config = MessageConfig(reader.read_uint8())
         self.type = MessageType(reader.read_uint8())
 
-        payload_data = reader.read_var_bytes(self.PAYLOAD_MAX_SIZE)
+        payload_data = reader.read_var_view(self.PAYLOAD_MAX_SIZE)
         if len(payload_data) > 0:
             if MessageConfig.COMPRESSED in self.config:
                 # From the lz4 documentation:
@@ -149,7 +169,11 @@ class Message(serialization.ISerializable):
                 except lz4.block.LZ4BlockError:
                     raise ValueError("Invalid payload data - decompress failed")
 
-            self.payload = self._payload_from_data(self.type, payload_data)
+            try:
+                self.payload = self._payload_from_data(self.type, payload_data)
+            except serialization.InsufficientDataError as e:
+                # the payload data is complete, thus not a matter of waiting for more data
+                raise ValueError(f"Invalid payload data - {e}")
 
         if self.payload is None:
             self.payload = empty.EmptyPayload()
@@ -177,6 +201,12 @@ class Message(serialization.ISerializable):
                 return br.read_serializable(transaction.Transaction)
             elif msg_type == MessageType.EXTENSIBLE:
                 return br.read_serializable(extensible.ExtensiblePayload)
+            elif msg_type == MessageType.FILTERLOAD:
+                return br.read_serializable(filter.FilterLoadPayload)
+            elif msg_type == MessageType.FILTERADD:
+                return br.read_serializable(filter.FilterAddPayload)
+            elif msg_type == MessageType.MERKLEBLOCK:
+                return br.read_serializable(block.MerkleBlockPayload)
             else:
                 logger.debug(f"Unsupported payload {msg_type.name}")
 
@@ -4,20 +4,27 @@ P2P node. Connects over TCP. Handles network messages.
 from __future__ import annotations
 import asyncio
 import traceback
-import struct
 import string
 from datetime import datetime
 from epicchain.network import message, capabilities, relaycache
 from epicchain.network.ipfilter import ipfilter
 from epicchain.network.convenience import nodeweight
-from epicchain.network.payloads import address, version, inventory, ping, block
+from epicchain.network.payloads import (
+    address,
+    version,
+    inventory,
+    ping,
+    block,
+    filter,
+)
 from epicchain import network_logger as logger, settings
-from epicchain.core import types, msgrouter
+from epicchain.core import types, msgrouter, serialization, cryptography as crypto
 from contextlib import suppress
 from socket import AF_INET as IP4_FAMILY
 from typing import Optional, Callable, cast
 from asyncio.streams import StreamWriter, StreamReader
 from epicchain.network.message import Message
+from collections import deque
 from collections.abc import Sequence
 
 
@@ -29,6 +36,9 @@ class EpicChainNode:
     #: list[address.NetworkAddress]: a list of known network addresses (class attribute).
     addresses = []  # type: list[address.NetworkAddress]
 
+    #: int: Number of bytes to request from the network per read if no message is partially received.
+    READ_SIZE = 65536
+
     def __init__(self, reader: StreamReader, writer: StreamWriter):
         #: Unique identifier.
         self.nodeid: int = id(self)
@@ -50,6 +60,9 @@ class EpicChainNode:
         #: bool: Whether the node is in the process of disconnecting and shutting down its tasks.
         self.disconnecting: bool = False
 
+        #: The filter loaded by the remote node with `FILTERLOAD`. If set, blocks are sent to it as `MERKLEBLOCK`.
+        self.bloom_filter: Optional[crypto.BloomFilter] = None
+
         #: dict[message.MessageType, Callable[[message.Message], None]]: A table matching message types to handler
         #: functions.
         self.dispatch_table: dict[
@@ -79,6 +92,13 @@ class EpicChainNode:
         self.reader = reader
         self.writer = writer
 
+        self._message_stream = serialization.StreamDeserializer(
+            Message,
+            frame_size=Message.read_frame_size,
+            on_error=self._on_malformed_message,
+        )
+        self._received: deque[Message] = deque()
+
     def __eq__(self, other):
         if type(other) is type(self):
             return self.address == other.address and self.nodeid == other.nodeid
@@ -204,7 +224,9 @@ class EpicChainNode:
         Args:
             msg:
         """
-        pass
+        payload = cast(filter.FilterAddPayload, msg.payload)
+        if self.bloom_filter is not None:
+            self.bloom_filter.add(payload.data)
 
     def handler_filterclear(self, msg: message.Message) -> None:
         """
@@ -213,7 +235,7 @@ class EpicChainNode:
         Args:
             msg:
         """
-        pass
+        self.bloom_filter = None
 
     def handler_filterload(self, msg: message.Message) -> None:
         """
@@ -222,7 +244,20 @@ class EpicChainNode:
         Args:
             msg:
         """
-        pass
+        payload = cast(filter.FilterLoadPayload, msg.payload)
+        # an empty filter has no bits to map items to and would fail every later check. Oversized filters are refused
+        # like they are on deserialization
+        if (
+            not 0 < len(payload.filter) <= filter.FilterLoadPayload.MAX_FILTER_SIZE
+            or payload.K > filter.FilterLoadPayload.MAX_K
+        ):
+            logger.debug(
+                f"Ignoring FILTERLOAD with an invalid filter from {self.address.address}"
+            )
+            return
+        self.bloom_filter = crypto.BloomFilter(
+            len(payload.filter) * 8, payload.K, payload.tweak, payload.filter
+        )
 
     def handler_getaddr(self, msg: message.Message) -> None:
         """
@@ -273,6 +308,8 @@ class EpicChainNode:
                     msg_type=message.MessageType.TRANSACTION, payload=item
                 )
                 self._create_task_with_cleanup(self.send_message(m))
+            elif payload.type == inventory.InventoryType.BLOCK:
+                self._create_task_with_cleanup(self.send_block(cast(block.Block, item)))
 
     def handler_getheaders(self, msg: message.Message) -> None:
         """
@@ -299,7 +336,7 @@ class EpicChainNode:
         Args:
             msg:
         """
-        pass
+        msgrouter.on_merkleblock(self.nodeid, msg.payload)
 
     def handler_headers(self, msg: message.Message) -> None:
         """
@@ -392,35 +429,20 @@ class EpicChainNode:
 
         async def _read():
             try:
-                # readexactly can throw ConnectionResetError
-                message_header = await self.reader.readexactly(3)
-                payload_length = message_header[2]
-
-                if payload_length == 0xFD:
-                    len_bytes = await self.reader.readexactly(2)
-                    (payload_length,) = struct.unpack("<H", len_bytes)
-                elif payload_length == 0xFE:
-                    len_bytes = await self.reader.readexactly(4)
-                    (payload_length,) = struct.unpack("<I", len_bytes)
-                elif payload_length == 0xFE:
-                    len_bytes = await self.reader.readexactly(8)
-                    (payload_length,) = struct.unpack("<Q", len_bytes)
-                else:
-                    len_bytes = b""
-
-                if payload_length > Message.PAYLOAD_MAX_SIZE:
-                    raise ValueError("Invalid format")
-
-                payload_data = await self.reader.readexactly(payload_length)
-                raw = message_header + len_bytes + payload_data
-
-                try:
-                    return Message.deserialize_from_bytes(raw)
-                except Exception:
-                    logger.debug(
-                        f"Failed to deserialize message: {traceback.format_exc()}"
+                # partially received messages are kept by the stream deserializer, such that a timeout or
+                # cancellation never loses data
+                while not self._received:
+                    if self._message_stream.error is not None:
+                        # the messages preceding malformed data have been handled, no need to wait for more data
+                        raise self._message_stream.error
+                    # read can throw ConnectionResetError
+                    data = await self.reader.read(
+                        max(self._message_stream.needed, self.READ_SIZE)
                     )
-                    return None
+                    if not data:
+                        raise ConnectionResetError("Connection closed by remote")
+                    self._received.extend(self._message_stream.feed(data))
+                return self._received.popleft()
 
             except (ConnectionResetError, ValueError) as e:
                 # ensures we break out of the main run() loop of Node, which triggers a disconnect callback to clean up
@@ -433,6 +455,7 @@ class EpicChainNode:
                 return None
             except Exception:
                 # ensures we break out of the main run() loop of Node, which triggers a disconnect callback to clean up
+                self.disconnecting = True
                 logger.debug(f"error read message 1 {traceback.format_exc()}")
                 return None
 
@@ -445,6 +468,10 @@ class EpicChainNode:
             traceback.print_exc()
             return None
 
+    def _on_malformed_message(self, e: Exception) -> None:
+        # the frame of the message is skipped, such that the connection remains usable
+        logger.debug(f"Failed to deserialize message: {traceback.format_exc()}")
+
     # raw network commands
     async def request_address_list(self) -> None:
         """
@@ -577,6 +604,25 @@ class EpicChainNode:
         m = message.Message(msg_type=message.MessageType.INV, payload=inv)
         await self.send_message(m)
 
+    async def send_block(self, block_: block.Block) -> None:
+        """
+        Send a block to the remote node.
+
+        If the remote node loaded a bloom filter the block is sent as :class:`~.block.MerkleBlockPayload`, flagging
+        the transactions that match the filter.
+
+        Args:
+            block_: the block to send.
+        """
+        if self.bloom_filter is None:
+            m = message.Message(msg_type=message.MessageType.BLOCK, payload=block_)
+        else:
+            m = message.Message(
+                msg_type=message.MessageType.MERKLEBLOCK,
+                payload=block.MerkleBlockPayload.from_filter(block_, self.bloom_filter),
+            )
+        await self.send_message(m)
+
     async def send_ping(self) -> None:
         """
         Send a Ping message and expecting a Pong response.
@@ -2,15 +2,14 @@
 Block payload and related classes.
 """
 from __future__ import annotations
-import hashlib
-from epicchain.core import Size as s, serialization, types, utils, cryptography as crypto
+from epicchain.core import Size as s, serialization, types, utils, hashing, cryptography as crypto
 from epicchain.network.payloads import verification, transaction, inventory
 from bitarray import bitarray  # type: ignore
 from collections.abc import Sequence
 from typing import Optional
 
 
-class Header(verification.IVerifiable):
+class Header(serialization.CachedHashMixin, verification.IVerifiable):
     """
     A `Block` header only object.
 
@@ -20,6 +19,17 @@ class Header(verification.IVerifiable):
         :class:`~epicchain.network.payloads.block.TrimmedBlock`
     """
 
+    _unsigned_plan = serialization.SerializationPlan(
+        serialization.Field.uint32("version"),
+        serialization.Field.fixed_bytes("prev_hash", s.uint256, types.UInt256),
+        serialization.Field.fixed_bytes("merkle_root", s.uint256, types.UInt256),
+        serialization.Field.uint64("timestamp"),
+        serialization.Field.uint64("nonce"),
+        serialization.Field.uint32("index"),
+        serialization.Field.uint8("primary_index"),
+        serialization.Field.fixed_bytes("next_consensus", s.uint160, types.UInt160),
+    )
+
     def __init__(
         self,
         version: int,
@@ -46,18 +56,7 @@ class Header(verification.IVerifiable):
         self.witness = witness
 
     def __len__(self):
-        return (
-            s.uint32
-            + s.uint256
-            + s.uint256
-            + s.uint64
-            + s.uint64
-            + s.uint32
-            + s.uint8
-            + s.uint160
-            + 1
-            + len(self.witness)
-        )
+        return self._unsigned_plan.fixed_size + 1 + len(self.witness)
 
     def __eq__(self, other):
         if other is None:
@@ -71,11 +70,27 @@ class Header(verification.IVerifiable):
     def hash(self) -> types.UInt256:
         """
         Get a unique identifier based on the unsigned data portion of the object.
+
+        The hash is cached until one of the unsigned fields is assigned.
         """
+        return super(Header, self).hash()
+
+    def _hash_key(self) -> tuple:
+        return (
+            self.version,
+            self.prev_hash,
+            self.merkle_root,
+            self.timestamp,
+            self.nonce,
+            self.index,
+            self.primary_index,
+            self.next_consensus,
+        )
+
+    def _compute_hash(self) -> types.UInt256:
         with serialization.BinaryWriter() as bw:
             self.serialize_unsigned(bw)
-            data_to_hash = bytearray(bw._stream.getvalue())
-            data = hashlib.sha256(data_to_hash).digest()
+            data = hashing.sha256(bw.getbuffer())
             return types.UInt256(data=data)
 
     def serialize(self, writer: serialization.BinaryWriter) -> None:
@@ -95,14 +110,7 @@ class Header(verification.IVerifiable):
         Args:
             writer: instance.
         """
-        writer.write_uint32(self.version)
-        writer.write_serializable(self.prev_hash)
-        writer.write_serializable(self.merkle_root)
-        writer.write_uint64(self.timestamp)
-        writer.write_uint64(self.nonce)
-        writer.write_uint32(self.index)
-        writer.write_uint8(self.primary_index)
-        writer.write_serializable(self.next_consensus)
+        self._unsigned_plan.serialize(self, writer)
 
     def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
@@ -132,16 +140,9 @@ class Header(verification.IVerifiable):
         Raises:
             ValueError: if the primary_index field is greater than the configured consensus validator count.
         """
-        self.version = reader.read_uint32()
+        self._unsigned_plan.deserialize(self, reader)
         if self.version > 0:
             raise ValueError("Deserialization error - invalid version")
-        self.prev_hash = reader.read_serializable(types.UInt256)
-        self.merkle_root = reader.read_serializable(types.UInt256)
-        self.timestamp = reader.read_uint64()
-        self.nonce = reader.read_uint64()
-        self.index = reader.read_uint32()
-        self.primary_index = reader.read_uint8()
-        self.next_consensus = reader.read_serializable(types.UInt160)
 
     def get_script_hashes_for_verifying(self, snapshot) -> list[types.UInt160]:
         """
@@ -170,7 +171,7 @@ class Header(verification.IVerifiable):
         )
 
 
-class Block(inventory.IInventory):
+class Block(serialization.CachedSizeMixin, inventory.IInventory):
     """
     The famous Block. I transfer chain state.
     """
@@ -186,12 +187,15 @@ class Block(inventory.IInventory):
         self.header = header
         self.transactions = [] if transactions is None else transactions
 
-    def __len__(self):
+    def _compute_size(self) -> int:
         # calculate the varint length that needs to be inserted before the transaction objects.
         magic_len = utils.get_var_size(len(self.transactions))
-        txs_len = sum([len(t) for t in self.transactions])
+        txs_len = sum(map(len, self.transactions))
         return len(self.header) + magic_len + txs_len
 
+    def _size_key(self) -> tuple:
+        return serialization.nested_key(self.header, self.transactions)
+
     def __eq__(self, other):
         if other is None:
             return False
@@ -295,10 +299,12 @@ class Block(inventory.IInventory):
             ValueError: if the content count of the block is zero, or if there is a duplicate transaction in the list,
                 or if the merkle root does not include the calculated root.
         """
+        start = reader.tell()
         self.header = reader.read_serializable(Header)
         self.transactions = reader.read_serializable_list(
             transaction.Transaction, max=0xFFFF
         )
+        self._cache_size(reader.tell() - start)
 
         if len(set(self.transactions)) != len(self.transactions):
             raise ValueError(
@@ -313,13 +319,30 @@ class Block(inventory.IInventory):
         """Not supported."""
         raise NotImplementedError
 
-    def rebuild_merkle_root(self) -> None:
+    def rebuild_merkle_root(
+        self, accumulator: Optional[crypto.MerkleAccumulator] = None
+    ) -> None:
         """
         Recalculates the Merkle root.
+
+        Args:
+            accumulator: the transaction hashes as appended while building the block. Its root is used instead of
+             hashing all transactions again.
+
+        Raises:
+            ValueError: if the number of hashes in `accumulator` does not match the number of transactions.
         """
-        self.header.merkle_root = crypto.MerkleTree.compute_root(
-            [t.hash() for t in self.transactions]
-        )
+        if accumulator is None:
+            self.header.merkle_root = crypto.MerkleTree.compute_root(
+                [t.hash() for t in self.transactions]
+            )
+            return
+
+        if len(accumulator) != len(self.transactions):
+            raise ValueError(
+                f"Accumulator holds {len(accumulator)} hashes, block has {len(self.transactions)} transactions"
+            )
+        self.header.merkle_root = accumulator.root()
 
     def trim(self) -> TrimmedBlock:
         """
@@ -368,7 +391,7 @@ class TrimmedBlock(serialization.ISerializable):
             writer: instance.
         """
         writer.write_serializable(self.header)
-        writer.write_serializable_list(list(self.hashes))
+        writer.write_serializable_list(self.hashes)
 
     def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
@@ -378,24 +401,39 @@ class TrimmedBlock(serialization.ISerializable):
             reader: instance.
         """
         self.header = reader.read_serializable(Header)
-        self.hashes = reader.read_serializable_list(types.UInt256, max=0xFFFF)
+        self.hashes = types.UInt256Array.deserialize_from(reader, max=0xFFFF)
 
     @classmethod
     def _serializable_init(cls):
         return cls(Header._serializable_init(), [])
 
 
+def _filter_matches(
+    bloom_filter: crypto.BloomFilter, tx: transaction.Transaction
+) -> bool:
+    if bloom_filter.check(tx.hash().to_array()):
+        return True
+    return any(bloom_filter.check(signer.account.to_array()) for signer in tx.signers)
+
+
 class MerkleBlockPayload(serialization.ISerializable):
     """
     Payload for transfering merkletree hashes of a block.
     """
 
     def __init__(self, block: Block, flags: bitarray):
-        hashes = [t.hash() for t in block.transactions]
-        tree = crypto.MerkleTree(hashes)
+        """
+        Create payload.
+
+        Args:
+            block: the block to create the payload for.
+            flags: per transaction in `block` whether it is of interest to the receiver.
+        """
+        # the transaction hashes only, without the duplicates that pad the Merkle tree to a power of two. The
+        # receiver rebuilds the tree from these, and `deserialize()` bounds their count by `tx_count`
+        self.hashes = [t.hash() for t in block.transactions]
         self.flags = flags.tobytes()
-        self.tx_count = len(hashes)
-        self.hashes = tree.to_hash_array()
+        self.tx_count = len(self.hashes)
         self.header = block.header
 
     def __len__(self):
@@ -406,6 +444,23 @@ class MerkleBlockPayload(serialization.ISerializable):
             + utils.get_var_size(self.flags)
         )
 
+    @classmethod
+    def from_filter(
+        cls, block: Block, bloom_filter: crypto.BloomFilter
+    ) -> MerkleBlockPayload:
+        """
+        Create the payload for a peer that loaded `bloom_filter`.
+
+        A transaction is flagged if its hash or the account of any of its signers is present in the filter.
+
+        Args:
+            block: the block to create the payload for.
+            bloom_filter: the filter of the receiving peer.
+        """
+        flags = bitarray(endian="little")
+        flags.extend(_filter_matches(bloom_filter, tx) for tx in block.transactions)
+        return cls(block, flags)
+
     def serialize(self, writer: serialization.BinaryWriter) -> None:
         """
         Serialize the object into a binary stream.
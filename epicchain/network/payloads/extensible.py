@@ -2,8 +2,7 @@
 Customizable payload.
 """
 from __future__ import annotations
-import hashlib
-from epicchain.core import types, serialization, Size as s, utils
+from epicchain.core import types, serialization, Size as s, utils, hashing
 from epicchain.network.payloads import inventory, verification
 
 
@@ -117,8 +116,7 @@ class ExtensiblePayload(inventory.IInventory):
         """
         with serialization.BinaryWriter() as bw:
             self.serialize_unsigned(bw)
-            data_to_hash = bytearray(bw._stream.getvalue())
-            data = hashlib.sha256(data_to_hash).digest()
+            data = hashing.sha256(bw.getbuffer())
             return types.UInt256(data=data)
 
     @property
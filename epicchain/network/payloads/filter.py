@@ -43,6 +43,11 @@ class FilterAddPayload(serialization.ISerializable):
 
 
 class FilterLoadPayload(serialization.ISerializable):
+    #: Maximum size of the filter in bytes.
+    MAX_FILTER_SIZE = 36000
+    #: Maximum number of hash functions.
+    MAX_K = 50
+
     def __init__(self, filter: crypto.BloomFilter):
         """
         Create payload.
@@ -75,10 +80,10 @@ class FilterLoadPayload(serialization.ISerializable):
         Args:
             reader: instance.
         """
-        self.filter = reader.read_var_bytes(max=36000)
+        self.filter = reader.read_var_bytes(max=self.MAX_FILTER_SIZE)
         self.K = reader.read_uint8()
-        if self.K > 50:
-            raise ValueError("Deserialization error - K exceeds limit of 50")
+        if self.K > self.MAX_K:
+            raise ValueError(f"Deserialization error - K exceeds limit of {self.MAX_K}")
         self.tweak = reader.read_uint32()
 
     @classmethod
@@ -26,7 +26,7 @@ class InventoryPayload(serialization.ISerializable):
 
         Args:
             type: indicator to what type of object the hashes of this payload relate to.
-            hashes: hashes of "type" objects.
+            hashes: hashes of "type" objects. Can be a :class:`~epicchain.core.types.UInt256Array`.
         """
         self.type = type
         self.hashes = hashes
@@ -43,9 +43,7 @@ class InventoryPayload(serialization.ISerializable):
             writer: instance.
         """
         writer.write_uint8(self.type)
-        writer.write_var_int(len(self.hashes))
-        for h in self.hashes:  # type: types.UInt256
-            writer.write_bytes(h.to_array())
+        writer.write_serializable_list(self.hashes)
 
     def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
@@ -55,7 +53,7 @@ class InventoryPayload(serialization.ISerializable):
             reader: instance.
         """
         self.type = InventoryType(reader.read_uint8())
-        self.hashes = reader.read_serializable_list(types.UInt256)
+        self.hashes = types.UInt256Array.deserialize_from(reader)
 
     @classmethod
     def _serializable_init(cls):
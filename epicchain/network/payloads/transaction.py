@@ -2,13 +2,12 @@
 Transaction payload and related classes.
 """
 from __future__ import annotations
-import hashlib
 import abc
 import base58  # type: ignore
 import base64
 from enum import Enum, IntEnum
 from typing import Optional, Type, TypeVar
-from epicchain.core import Size as s, serialization, utils, types, interfaces
+from epicchain.core import Size as s, serialization, utils, types, interfaces, hashing
 from epicchain import settings, vm
 from epicchain.network.payloads import inventory, verification
 from collections.abc import Sequence
@@ -212,7 +211,12 @@ class OracleResponse(TransactionAttribute, interfaces.IJson):
         return cls(0, OracleResponseCode.ERROR, b"")
 
 
-class Transaction(inventory.IInventory, interfaces.IJson):
+class Transaction(
+    serialization.CachedSizeMixin,
+    serialization.CachedHashMixin,
+    inventory.IInventory,
+    interfaces.IJson,
+):
     """
     Data to be executed by the EpicChain virtual machine.
     """
@@ -228,6 +232,14 @@ class Transaction(inventory.IInventory, interfaces.IJson):
         1 + 4 + 8 + 8 + 4  # Version  # NONCE  # SYSTEM_FEE  # NETWORK_FEE
     )  # VALID_UNTIL_BLOCK
 
+    _header_plan = serialization.SerializationPlan(
+        serialization.Field.uint8("version"),
+        serialization.Field.uint32("nonce"),
+        serialization.Field.int64("system_fee"),
+        serialization.Field.int64("network_fee"),
+        serialization.Field.uint32("valid_until_block"),
+    )
+
     def __init__(
         self,
         version: int,
@@ -279,19 +291,20 @@ class Transaction(inventory.IInventory, interfaces.IJson):
         else:
             self.protocol_magic = 0x4F454E
 
-    def __len__(self):
+    def _compute_size(self) -> int:
         return (
-            s.uint8
-            + s.uint32
-            + s.uint64
-            + s.uint64
-            + s.uint32
+            self.HEADER_SIZE
             + utils.get_var_size(self.attributes)
             + utils.get_var_size(self.signers)
             + utils.get_var_size(self.script)
             + utils.get_var_size(self.witnesses)
         )
 
+    def _size_key(self) -> tuple:
+        return (self.script,) + serialization.nested_key(
+            self.attributes, self.signers, self.witnesses
+        )
+
     def __eq__(self, other):
         if other is None:
             return False
@@ -318,11 +331,25 @@ class Transaction(inventory.IInventory, interfaces.IJson):
     def hash(self) -> types.UInt256:
         """
         Get a unique block identifier based on the unsigned data portion of the object.
+
+        The hash is cached until an unsigned field, a signer or an attribute is assigned or replaced.
         """
+        return super(Transaction, self).hash()
+
+    def _hash_key(self) -> tuple:
+        return (
+            self.version,
+            self.nonce,
+            self.system_fee,
+            self.network_fee,
+            self.valid_until_block,
+            self.script,
+        ) + serialization.nested_key(self.signers, self.attributes)
+
+    def _compute_hash(self) -> types.UInt256:
         with serialization.BinaryWriter() as bw:
             self.serialize_unsigned(bw)
-            data_to_hash = bytearray(bw._stream.getvalue())
-            data = hashlib.sha256(data_to_hash).digest()
+            data = hashing.sha256(bw.getbuffer())
             return types.UInt256(data=data)
 
     @property
@@ -358,11 +385,7 @@ class Transaction(inventory.IInventory, interfaces.IJson):
         Args:
             writer: instance.
         """
-        writer.write_uint8(self.version)
-        writer.write_uint32(self.nonce)
-        writer.write_int64(self.system_fee)
-        writer.write_int64(self.network_fee)
-        writer.write_uint32(self.valid_until_block)
+        self._header_plan.serialize(self, writer)
         writer.write_serializable_list(self.signers)
         writer.write_serializable_list(self.attributes)
         writer.write_var_bytes(self.script)
@@ -380,6 +403,7 @@ class Transaction(inventory.IInventory, interfaces.IJson):
         Args:
             reader: instance.
         """
+        start = reader.tell()
         self.deserialize_unsigned(reader)
         self.witnesses = reader.read_serializable_list(
             verification.Witness, max=len(self.signers)
@@ -388,6 +412,7 @@ class Transaction(inventory.IInventory, interfaces.IJson):
             raise ValueError(
                 "Deserialization error - witness length does not match signers length"
             )
+        self._cache_size(reader.tell() - start)
 
     def deserialize_unsigned(self, reader: serialization.BinaryReader) -> None:
         """
@@ -401,18 +426,14 @@ class Transaction(inventory.IInventory, interfaces.IJson):
             ValueError: If the system of network fee is negative.
             ValueError: If there is no script
         """
-        self.version = reader.read_uint8()
+        self._header_plan.deserialize(self, reader)
         if self.version > 0:
             raise ValueError("Deserialization error - invalid version")
-        self.nonce = reader.read_uint32()
-        self.system_fee = reader.read_int64()
         if self.system_fee < 0:
             raise ValueError("Deserialization error - negative system fee")
-        self.network_fee = reader.read_int64()
         if self.network_fee < 0:
             raise ValueError("Deserialization error - negative network fee")
 
-        self.valid_until_block = reader.read_uint32()
         self.signers = Transaction._deserialize_signers(
             reader, self.MAX_TRANSACTION_ATTRIBUTES
         )
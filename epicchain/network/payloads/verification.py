@@ -2,11 +2,10 @@
 Classes for managing transaction signers and signature scopes.
 """
 from __future__ import annotations
-import hashlib
 import abc
 import base64
 from enum import IntFlag, IntEnum
-from epicchain.core import serialization, utils, types, cryptography, Size as s, interfaces
+from epicchain.core import serialization, utils, types, cryptography, hashing, Size as s, interfaces
 from typing import Optional, Any, no_type_check, Iterator
 from collections.abc import Sequence
 
@@ -75,6 +74,11 @@ class Signer(serialization.ISerializable, interfaces.IJson):
     #: Maximum number of allowed_contracts or allowed_groups
     MAX_SUB_ITEMS = 16
 
+    _header_plan = serialization.SerializationPlan(
+        serialization.Field.fixed_bytes("account", s.uint160, types.UInt160),
+        serialization.Field.uint8("scope", WitnessScope),
+    )
+
     def __init__(
         self,
         account: types.UInt160,
@@ -125,8 +129,7 @@ class Signer(serialization.ISerializable, interfaces.IJson):
         Args:
             writer: instance.
         """
-        writer.write_serializable(self.account)
-        writer.write_uint8(self.scope)
+        self._header_plan.serialize(self, writer)
 
         if WitnessScope.CUSTOM_CONTRACTS in self.scope:
             writer.write_serializable_list(self.allowed_contracts)
@@ -144,8 +147,7 @@ class Signer(serialization.ISerializable, interfaces.IJson):
         Args:
             reader: instance.
         """
-        self.account = reader.read_serializable(types.UInt160)
-        self.scope = WitnessScope(reader.read_uint8())
+        self._header_plan.deserialize(self, reader)
 
         if WitnessScope.GLOBAL in self.scope and self.scope != WitnessScope.GLOBAL:
             raise ValueError(
@@ -253,6 +255,11 @@ class Witness(serialization.ISerializable, interfaces.IJson):
     _MAX_INVOCATION_SCRIPT = 1024
     _MAX_VERIFICATION_SCRIPT = 1024
 
+    _plan = serialization.SerializationPlan(
+        serialization.Field.var_bytes("invocation_script", _MAX_INVOCATION_SCRIPT),
+        serialization.Field.var_bytes("verification_script", _MAX_VERIFICATION_SCRIPT),
+    )
+
     def __init__(self, invocation_script: bytes, verification_script: bytes):
         #: A set of VM instructions to set up the stack for verification.
         self.invocation_script = invocation_script
@@ -273,8 +280,7 @@ class Witness(serialization.ISerializable, interfaces.IJson):
         Args:
             writer: instance.
         """
-        writer.write_var_bytes(self.invocation_script)
-        writer.write_var_bytes(self.verification_script)
+        self._plan.serialize(self, writer)
 
     def deserialize(self, reader: serialization.BinaryReader) -> None:
         """
@@ -283,16 +289,11 @@ class Witness(serialization.ISerializable, interfaces.IJson):
         Args:
             reader: instance.
         """
-        self.invocation_script = reader.read_var_bytes(max=self._MAX_INVOCATION_SCRIPT)
-        self.verification_script = reader.read_var_bytes(
-            max=self._MAX_VERIFICATION_SCRIPT
-        )
+        self._plan.deserialize(self, reader)
 
     def script_hash(self) -> types.UInt160:
         """Get the script hash based on the verification script."""
-        intermediate_data = hashlib.sha256(self.verification_script).digest()
-        data = hashlib.new("ripemd160", intermediate_data).digest()
-        return types.UInt160(data=data)
+        return types.UInt160(data=hashing.hash160(self.verification_script))
 
     def to_json(self) -> dict:
         """Convert object into JSON representation."""
@@ -736,7 +737,7 @@ class ConditionCalledByGroup(WitnessCondition):
     def _deserialize_without_type(
         self, reader: serialization.BinaryReader, max_nesting_depth: int
     ) -> None:
-        self.group = reader.read_serializable(cryptography.ECPoint)  # type: ignore
+        self.group = cryptography.ECPoint.read_cached(reader)
 
     def to_json(self) -> dict:
         """Convert object into JSON representation."""
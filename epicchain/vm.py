@@ -2,12 +2,13 @@
 EpicChain Virtual Machine classes.
 """
 from __future__ import annotations
-import hashlib
+import functools
 from enum import IntEnum
 from epicchain.contracts import callflags
-from epicchain.core import types, serialization, cryptography
-from typing import Optional, Iterator, Union, Type, Protocol
-from collections.abc import Sequence
+from epicchain.core import types, serialization, cryptography, hashing
+from typing import Optional, Iterator, Union, Type, Protocol, Any
+from collections.abc import Sequence, Mapping, Callable
+from types import MappingProxyType
 
 
 class StackItemType(IntEnum):
@@ -24,12 +25,11 @@ class StackItemType(IntEnum):
     ARRAY = 0x40
     STRUCT = 0x41
     MAP = 0x48
+    INTEROPINTERFACE = 0x60
 
 
 def _syscall_name_to_int(name: str) -> int:
-    return int.from_bytes(
-        hashlib.sha256(name.encode()).digest()[:4], "little", signed=False
-    )
+    return int.from_bytes(hashing.sha256(name.encode())[:4], "little", signed=False)
 
 
 class OpCode(IntEnum):
@@ -324,99 +324,85 @@ class ScriptBuilder:
         self.data = bytearray()
 
     def emit(self, opcode: OpCode, data: Optional[bytes] = None) -> ScriptBuilder:
-        self.emit_raw(opcode.value.to_bytes(1, "little"))
+        self.data.append(opcode)
         if data is not None:
-            self.emit_raw(data)
+            self.data += data
         return self
 
     def emit_push(self, value) -> ScriptBuilder:
-        if value is None:
-            return self.emit(OpCode.PUSHNULL)
-        elif isinstance(value, bool):
-            if value is True:
-                return self.emit(OpCode.PUSHT)
-            else:
-                return self.emit(OpCode.PUSHF)
-        elif isinstance(value, str):
-            self.emit_push(value.encode("utf-8"))
-            return self
-        elif isinstance(value, serialization.ISerializable):
-            return self.emit_push(value.to_array())
-        elif isinstance(value, IntEnum):
-            return self.emit_push(value.value)
-        elif isinstance(value, (types.BigInteger, int)):
-            if -1 <= value <= 16:
-                self.emit_raw((OpCode.PUSH0 + value).to_bytes(1, "little"))
-                return self
-            else:
-                if isinstance(value, int):
-                    bigint = types.BigInteger(value)
-                else:
-                    bigint = value
-                data = bytearray(bigint.to_array())
-                if len(data) == 1:
-                    return self.emit(OpCode.PUSHINT8, data)
-                if len(data) == 2:
-                    return self.emit(OpCode.PUSHINT16, data)
-                if len(data) <= 4:
-                    self._pad_right(data, 4, bigint.sign < 0)
-                    return self.emit(OpCode.PUSHINT32, data)
-                if len(data) <= 8:
-                    self._pad_right(data, 8, bigint.sign < 0)
-                    return self.emit(OpCode.PUSHINT64, data)
-                if len(data) <= 16:
-                    self._pad_right(data, 16, bigint.sign < 0)
-                    return self.emit(OpCode.PUSHINT128, data)
-                if len(data) <= 32:
-                    self._pad_right(data, 32, bigint.sign < 0)
-                    return self.emit(OpCode.PUSHINT256, data)
-                raise ValueError("Input number exceeds maximum data size of 32 bytes")
-        elif isinstance(value, (bytes, bytearray)):
-            len_value = len(value)
-            if len_value > 0xFFFFFFFF:
-                raise ValueError(
-                    f"Value is too long {len_value}. Maximum allowed length is 0xFFFF_FFFF"
-                )
+        value_type = type(value)
+        push = _PUSH_HANDLERS.get(value_type)
+        if push is None:
+            push = _resolve_push_handler(value_type)
+        push(self, value)
+        return self
+
+    def _push_null(self, value: None) -> None:
+        self.data.append(OpCode.PUSHNULL)
 
-            if len_value < 0x100:
-                self.emit(OpCode.PUSHDATA1)
-                self.emit_raw(len_value.to_bytes(1, "little"))
-                self.emit_raw(value)
-            elif len_value < 0x10000:
-                self.emit(OpCode.PUSHDATA2)
-                self.emit_raw((len_value & 0xFF).to_bytes(1, "little"))
-                self.emit_raw(((len_value >> 8) & 0xFF).to_bytes(1, "little"))
-                self.emit_raw(value)
-            else:
-                self.emit(OpCode.PUSHDATA4)
-                self.emit_raw(len_value.to_bytes(4, "little"))
-                self.emit_raw(value)
-            return self
-        elif isinstance(value, Sequence):
-            for item in reversed(value):
-                if isinstance(item, Sequence):
-                    self.emit_push(item)
-                    continue
-                self.emit_push(item)
-            self.emit_push(len(value))
-            self.emit(OpCode.PACK)
-            return self
-        elif isinstance(value, dict):
-            for k, v in reversed(value.items()):
-                # This restriction exists on the VM side where keys to a 'Map' may only be of 'PrimitiveType'
-                if not isinstance(
-                    k, (int, str, bool, bytes, serialization.ISerializable)
-                ):
-                    raise ValueError(
-                        f"Unsupported key type {type(k)}. "
-                        f"Supported types by the VM are bool, int, str, bytes or ISerializable"
-                    )
-                self.emit_push(v)
-                self.emit_push(k)
-            self.emit_push(len(value))
-            return self.emit(OpCode.PACKMAP)
+    def _push_bool(self, value: bool) -> None:
+        self.data.append(OpCode.PUSHT if value else OpCode.PUSHF)
+
+    def _push_str(self, value: str) -> None:
+        self._push_bytes(value.encode("utf-8"))
+
+    def _push_serializable(self, value: serialization.ISerializable) -> None:
+        self._push_bytes(value.to_array())
+
+    def _push_enum(self, value: IntEnum) -> None:
+        self.emit_push(value.value)
+
+    def _push_int(self, value: int) -> None:
+        if -1 <= value <= 16:
+            self.data.append(OpCode.PUSH0 + value)
+            return
+        # size of the minimal two's complement encoding, equal to the length of types.BigInteger.to_array()
+        size = ((value if value >= 0 else ~value).bit_length() + 8) // 8
+        if size > 32:
+            raise ValueError("Input number exceeds maximum data size of 32 bytes")
+        opcode, width = _PUSHINT_WIDTHS[size]
+        self.data.append(opcode)
+        self.data += value.to_bytes(width, "little", signed=True)
+
+    def _push_biginteger(self, value: types.BigInteger) -> None:
+        self._push_int(int(value))
+
+    def _push_bytes(self, value: bytes | bytearray) -> None:
+        len_value = len(value)
+        data = self.data
+        if len_value < 0x100:
+            data.append(OpCode.PUSHDATA1)
+            data.append(len_value)
+        elif len_value < 0x10000:
+            data.append(OpCode.PUSHDATA2)
+            data += len_value.to_bytes(2, "little")
+        elif len_value <= 0xFFFFFFFF:
+            data.append(OpCode.PUSHDATA4)
+            data += len_value.to_bytes(4, "little")
         else:
-            raise ValueError(f"Unsupported value type {type(value)}")
+            raise ValueError(
+                f"Value is too long {len_value}. Maximum allowed length is 0xFFFF_FFFF"
+            )
+        data += value
+
+    def _push_sequence(self, value: Sequence) -> None:
+        for item in reversed(value):
+            self.emit_push(item)
+        self._push_int(len(value))
+        self.data.append(OpCode.PACK)
+
+    def _push_dict(self, value: dict) -> None:
+        for k, v in reversed(value.items()):
+            # This restriction exists on the VM side where keys to a 'Map' may only be of 'PrimitiveType'
+            if not isinstance(k, (int, str, bool, bytes, serialization.ISerializable)):
+                raise ValueError(
+                    f"Unsupported key type {type(k)}. "
+                    f"Supported types by the VM are bool, int, str, bytes or ISerializable"
+                )
+            self.emit_push(v)
+            self.emit_push(k)
+        self._push_int(len(value))
+        self.data.append(OpCode.PACKMAP)
 
     def emit_raw(self, data: bytes) -> ScriptBuilder:
         self.data.extend(data)
@@ -462,11 +448,14 @@ class ScriptBuilder:
             call_flags: call flags for the operation.
         """
         self.emit(OpCode.NEWARRAY0)
-        self.emit_push(callflags.CallFlags.ALL if call_flags is None else call_flags)
-        self.emit_push(operation)
-        self.emit_push(script_hash)
-        self.emit_syscall(Syscalls.SYSTEM_CONTRACT_CALL)
-        return self
+        return self.emit_raw(
+            _contract_call_template(
+                script_hash,
+                operation,
+                None,
+                callflags.CallFlags.ALL if call_flags is None else call_flags,
+            )
+        )
 
     def emit_contract_call_with_args(
         self,
@@ -487,15 +476,18 @@ class ScriptBuilder:
         if isinstance(args, Sequence):
             for arg in reversed(args):
                 self.emit_push(arg)
-            self.emit_push(len(args))
-            self.emit(OpCode.PACK)
+            arg_count: Optional[int] = len(args)
         else:
             self.emit_push(args)
-        self.emit_push(callflags.CallFlags.ALL if call_flags is None else call_flags)
-        self.emit_push(operation)
-        self.emit_push(script_hash)
-        self.emit_syscall(Syscalls.SYSTEM_CONTRACT_CALL)
-        return self
+            arg_count = None
+        return self.emit_raw(
+            _contract_call_template(
+                script_hash,
+                operation,
+                arg_count,
+                callflags.CallFlags.ALL if call_flags is None else call_flags,
+            )
+        )
 
     def emit_contract_call_and_count_iterator(
         self,
@@ -701,17 +693,102 @@ class ScriptBuilder:
         self.emit_jump(OpCode.JMP, self._offset_to(loop_start))
         return self
 
-    def _pad_right(self, data: bytearray, length: int, is_negative: bool):
-        if len(data) >= length:
-            return
-        pad = b"\xFF" if is_negative else b"\x00"
-        while len(data) != length:
-            data.extend(pad)
-
     def _offset_to(self, absolute_position: int):
         return absolute_position - len(self.data)
 
 
+# PUSHINT opcode and operand width per minimal two's complement size of an integer
+_PUSHINT_WIDTHS: tuple[tuple[OpCode, int], ...] = tuple(
+    (OpCode.PUSHINT8, 1)
+    if size <= 1
+    else (OpCode.PUSHINT16, 2)
+    if size == 2
+    else (OpCode.PUSHINT32, 4)
+    if size <= 4
+    else (OpCode.PUSHINT64, 8)
+    if size <= 8
+    else (OpCode.PUSHINT128, 16)
+    if size <= 16
+    else (OpCode.PUSHINT256, 32)
+    for size in range(33)
+)
+
+_PushHandler = Callable[[ScriptBuilder, Any], None]
+
+# the push handler per value type, in order of precedence. Subclasses resolve to the first matching entry
+_PUSH_HANDLER_ORDER: tuple[tuple[type | tuple[type, ...], _PushHandler], ...] = (
+    (type(None), ScriptBuilder._push_null),
+    (bool, ScriptBuilder._push_bool),
+    (str, ScriptBuilder._push_str),
+    (serialization.ISerializable, ScriptBuilder._push_serializable),
+    (IntEnum, ScriptBuilder._push_enum),
+    (int, ScriptBuilder._push_int),
+    (types.BigInteger, ScriptBuilder._push_biginteger),
+    ((bytes, bytearray), ScriptBuilder._push_bytes),
+    (Sequence, ScriptBuilder._push_sequence),
+    (dict, ScriptBuilder._push_dict),
+)
+
+# exact value type to push handler, filled on first use of a type
+_PUSH_HANDLERS: dict[type, _PushHandler] = {
+    type(None): ScriptBuilder._push_null,
+    bool: ScriptBuilder._push_bool,
+    int: ScriptBuilder._push_int,
+    str: ScriptBuilder._push_str,
+    bytes: ScriptBuilder._push_bytes,
+    bytearray: ScriptBuilder._push_bytes,
+    list: ScriptBuilder._push_sequence,
+    dict: ScriptBuilder._push_dict,
+}
+
+
+def _resolve_push_handler(value_type: type) -> _PushHandler:
+    for base, handler in _PUSH_HANDLER_ORDER:
+        if issubclass(value_type, base):
+            _PUSH_HANDLERS[value_type] = handler
+            return handler
+    raise ValueError(f"Unsupported value type {value_type}")
+
+
+#: Maximum number of contract call templates held by the cache behind :meth:`ScriptBuilder.emit_contract_call` and
+#: :meth:`ScriptBuilder.emit_contract_call_with_args`.
+CONTRACT_CALL_CACHE_SIZE = 1024
+
+
+@functools.lru_cache(maxsize=CONTRACT_CALL_CACHE_SIZE)
+def _contract_call_template(
+    script_hash: types.UInt160,
+    operation: str,
+    arg_count: Optional[int],
+    call_flags: callflags.CallFlags,
+) -> bytes:
+    # everything a contract call emits after the argument pushes. `arg_count` is `None` if the arguments are not
+    # packed into an array
+    sb = ScriptBuilder()
+    if arg_count is not None:
+        sb.emit_push(arg_count)
+        sb.emit(OpCode.PACK)
+    sb.emit_push(call_flags)
+    sb.emit_push(operation)
+    sb.emit_push(script_hash)
+    sb.emit_syscall(Syscalls.SYSTEM_CONTRACT_CALL)
+    return bytes(sb.data)
+
+
+def contract_call_cache_info() -> functools._CacheInfo:
+    """
+    Return the hit and miss counters of the contract call template cache.
+    """
+    return _contract_call_template.cache_info()
+
+
+def clear_contract_call_cache() -> None:
+    """
+    Empty the contract call template cache and reset its counters.
+    """
+    _contract_call_template.cache_clear()
+
+
 class VMState(IntEnum):
     NONE = 0
     HALT = 1 << 0
@@ -908,22 +985,235 @@ class Syscalls:
 
     @classmethod
     def all(cls) -> Iterator[Syscall]:
-        for name, value in vars(cls).items():
-            if name.isupper():
-                yield value
+        return iter(_SYSCALLS_BY_NUMBER.values())
 
     @classmethod
     def get_by_number(cls, syscall_number: int) -> Optional[Syscall]:
-        for name, value in vars(cls).items():
-            if name.isupper() and value.number == syscall_number:
-                return value
-        else:
-            return None
+        return _SYSCALLS_BY_NUMBER.get(syscall_number)
 
     @classmethod
     def get_by_name(cls, syscall_name: str) -> Optional[Syscall]:
-        for name, value in vars(cls).items():
-            if name.isupper() and value.name == syscall_name:
-                return value
-        else:
+        return _SYSCALLS_BY_NAME.get(syscall_name)
+
+    @classmethod
+    def by_number(cls) -> Mapping[int, Syscall]:
+        """
+        Read-only mapping of interop number to syscall.
+        """
+        return _SYSCALLS_BY_NUMBER
+
+    @classmethod
+    def by_name(cls) -> Mapping[str, Syscall]:
+        """
+        Read-only mapping of interop name to syscall.
+        """
+        return _SYSCALLS_BY_NAME
+
+
+# built once such that lookups do not walk the class attributes
+_SYSCALLS_BY_NUMBER: Mapping[int, Syscall] = MappingProxyType(
+    {value.number: value for name, value in vars(Syscalls).items() if name.isupper()}
+)
+_SYSCALLS_BY_NAME: Mapping[str, Syscall] = MappingProxyType(
+    {syscall.name: syscall for syscall in _SYSCALLS_BY_NUMBER.values()}
+)
+
+
+def _operand_sizes() -> tuple[int, ...]:
+    op = OpCode
+    sizes = [0] * 256
+    for opcode, size in (
+        (op.PUSHINT8, 1),
+        (op.PUSHINT16, 2),
+        (op.PUSHINT32, 4),
+        (op.PUSHINT64, 8),
+        (op.PUSHINT128, 16),
+        (op.PUSHINT256, 32),
+        (op.PUSHA, 4),
+        (op.PUSHDATA1, -1),
+        (op.PUSHDATA2, -2),
+        (op.PUSHDATA4, -4),
+        (op.CALL, 1),
+        (op.CALL_L, 4),
+        (op.CALLT, 2),
+        (op.TRY, 2),
+        (op.TRY_L, 8),
+        (op.ENDTRY, 1),
+        (op.ENDTRY_L, 4),
+        (op.SYSCALL, 4),
+        (op.INITSSLOT, 1),
+        (op.INITSLOT, 2),
+        (op.LDSFLD, 1),
+        (op.STSFLD, 1),
+        (op.LDLOC, 1),
+        (op.STLOC, 1),
+        (op.LDARG, 1),
+        (op.STARG, 1),
+        (op.NEWARRAY_T, 1),
+        (op.ISTYPE, 1),
+        (op.CONVERT, 1),
+    ):
+        sizes[opcode] = size
+    # the odd JMP* opcodes are the _L variants with a 4 byte offset
+    for value in range(op.JMP, op.JMPLE_L + 1):
+        sizes[value] = 4 if value % 2 else 1
+    return tuple(sizes)
+
+
+#: Operand size in bytes per opcode value. Negative values give the size of the length prefix of the variable length
+#: operands of PUSHDATA1/2/4.
+OPERAND_SIZES = _operand_sizes()
+
+# opcode value to OpCode lookup, `None` for values that are not a valid opcode
+_OPCODES: tuple[Optional[OpCode], ...] = tuple(
+    OpCode(i) if i in OpCode._value2member_map_ else None for i in range(256)
+)
+
+# opcode value to whether its operand is a jump offset relative to the instruction
+_IS_JUMP = tuple(
+    OpCode.JMP <= i <= OpCode.CALL_L
+    or i in (OpCode.PUSHA, OpCode.ENDTRY, OpCode.ENDTRY_L)
+    for i in range(256)
+)
+
+
+class Instruction:
+    """
+    A single instruction of a script. See :func:`iter_instructions`.
+
+    The operand is a view on the script it was decoded from and is not copied.
+    """
+
+    __slots__ = ("opcode", "offset", "operand")
+
+    def __init__(self, opcode: OpCode, offset: int, operand: memoryview):
+        #: The instruction opcode.
+        self.opcode = opcode
+        #: The position of the instruction in the script.
+        self.offset = offset
+        #: The operand of the instruction, excluding the length prefix of PUSHDATA1/2/4.
+        self.operand = operand
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} at {self.offset}: {self}>"
+
+    def __str__(self):
+        name = self.opcode.name
+        if OpCode.PUSHINT8 <= self.opcode <= OpCode.PUSHINT256:
+            return f"{name} {int.from_bytes(self.operand, 'little', signed=True)}"
+        if self.opcode == OpCode.SYSCALL:
+            syscall = self.syscall
+            if syscall is not None:
+                return f"{name} {syscall.name}"
+            return f"{name} {self.operand.hex()}"
+        if self.opcode in (OpCode.TRY, OpCode.TRY_L):
+            targets = ("-" if t is None else str(t) for t in self.try_targets)
+            return f"{name} {', '.join(targets)}"
+        target = self.jump_target
+        if target is not None:
+            return f"{name} {target}"
+        if self.operand:
+            return f"{name} {self.operand.hex()}"
+        return name
+
+    @property
+    def size(self) -> int:
+        """
+        The total size of the instruction in bytes.
+        """
+        prefix = OPERAND_SIZES[self.opcode]
+        return 1 + len(self.operand) + (-prefix if prefix < 0 else 0)
+
+    @property
+    def syscall(self) -> Optional[Syscall]:
+        """
+        The called interop service of a SYSCALL instruction.
+
+        `None` for other instructions and for unknown syscall numbers.
+        """
+        if self.opcode != OpCode.SYSCALL:
+            return None
+        return Syscalls.get_by_number(int.from_bytes(self.operand, "little"))
+
+    @property
+    def jump_target(self) -> Optional[int]:
+        """
+        The absolute script position targeted by a JMP*, CALL, CALL_L, PUSHA, ENDTRY or ENDTRY_L instruction.
+
+        `None` for other instructions.
+        """
+        if not _IS_JUMP[self.opcode]:
             return None
+        return self.offset + int.from_bytes(self.operand, "little", signed=True)
+
+    @property
+    def try_targets(self) -> tuple[Optional[int], Optional[int]]:
+        """
+        The absolute script positions of the catch and finally blocks of a TRY or TRY_L instruction.
+
+        A position is `None` if the block is absent or the instruction is not a TRY.
+        """
+        if self.opcode not in (OpCode.TRY, OpCode.TRY_L):
+            return None, None
+        half = len(self.operand) // 2
+        catch = int.from_bytes(self.operand[:half], "little", signed=True)
+        finally_ = int.from_bytes(self.operand[half:], "little", signed=True)
+        return (
+            self.offset + catch if catch else None,
+            self.offset + finally_ if finally_ else None,
+        )
+
+
+def iter_instructions(
+    script: bytes | bytearray | memoryview, offset: int = 0
+) -> Iterator[Instruction]:
+    """
+    Decode the instructions of `script` one at a time.
+
+    Decoding is lazy, such that a caller that stops early does not pay for the rest of the script.
+
+    Args:
+        script: the script to decode.
+        offset: position in `script` to start decoding at.
+
+    Raises:
+        ValueError: if an invalid opcode is encountered or an operand exceeds the script.
+    """
+    view = memoryview(script)
+    end_of_script = len(view)
+    opcodes = _OPCODES
+    sizes = OPERAND_SIZES
+    while offset < end_of_script:
+        opcode = opcodes[view[offset]]
+        if opcode is None:
+            raise ValueError(f"Invalid opcode {view[offset]:#04x} at {offset}")
+        start = offset + 1
+        size = sizes[opcode]
+        if size < 0:
+            start -= size
+            if start > end_of_script:
+                raise ValueError(
+                    f"Operand of {opcode.name} at {offset} exceeds the script"
+                )
+            size = int.from_bytes(view[offset + 1 : start], "little")
+        end = start + size
+        if end > end_of_script:
+            raise ValueError(f"Operand of {opcode.name} at {offset} exceeds the script")
+        yield Instruction(opcode, offset, view[start:end])
+        offset = end
+
+
+def disassemble(script: bytes | bytearray | memoryview) -> str:
+    """
+    Return a human readable listing of `script`, one instruction per line prefixed with its position.
+
+    Raises:
+        ValueError: if an invalid opcode is encountered or an operand exceeds the script.
+    """
+    return "\n".join(
+        f"{instruction.offset:04d} {instruction}"
+        for instruction in iter_instructions(script)
+    )
@@ -12,7 +12,7 @@ from jsonschema import validate  # type: ignore
 from epicchain import settings, vm
 from epicchain.contracts import abi, utils as contractutils, contract
 from epicchain.network.payloads import transaction, verification
-from epicchain.core import types, utils as coreutils, cryptography
+from epicchain.core import types, cryptography, hashing
 from epicchain.wallet import utils, scrypt_parameters as scrypt
 from epicchain.wallet.types import EpicChainAddress
 
@@ -204,7 +204,7 @@ class Account:
             contract_script = contractutils.create_signature_redeemscript(
                 key_pair.public_key
             )
-            script_hash = coreutils.to_script_hash(contract_script)
+            script_hash = utils.public_key_to_script_hash(key_pair.public_key)
             address = address if address else utils.script_hash_to_address(script_hash)
             public_key = key_pair.public_key
 
@@ -643,13 +643,9 @@ class Account:
 
         # Now check that the address hashes match. If they don't, the password was wrong.
         key_pair = cryptography.KeyPair(private_key=private_key)
-        script_hash = coreutils.to_script_hash(
-            contractutils.create_signature_redeemscript(key_pair.public_key)
-        )
+        script_hash = utils.public_key_to_script_hash(key_pair.public_key)
         address = utils.script_hash_to_address(script_hash)
-        first_hash = hashlib.sha256(address.encode("utf-8")).digest()
-        second_hash = hashlib.sha256(first_hash).digest()
-        checksum = second_hash[:4]
+        checksum = hashing.hash256(address.encode("utf-8"))[:4]
         if checksum != address_checksum:
             raise ValueError(
                 f"Wrong passphrase or key was encrypted with an address version that is not "
@@ -679,14 +675,10 @@ class Account:
             _scrypt_parameters = scrypt.ScryptParameters()
 
         key_pair = cryptography.KeyPair(private_key=private_key)
-        script_hash = coreutils.to_script_hash(
-            contractutils.create_signature_redeemscript(key_pair.public_key)
-        )
+        script_hash = utils.public_key_to_script_hash(key_pair.public_key)
         address = utils.script_hash_to_address(script_hash)
         # XEP2 checksum: hash the address twice and get the first 4 bytes
-        first_hash = hashlib.sha256(address.encode("utf-8")).digest()
-        second_hash = hashlib.sha256(first_hash).digest()
-        checksum = second_hash[:4]
+        checksum = hashing.hash256(address.encode("utf-8"))[:4]
 
         pwd_normalized = bytes(unicodedata.normalize("NFC", passphrase), "utf-8")
         derived = hashlib.scrypt(
@@ -1,11 +1,54 @@
 """
 EpicChain address utilities.
 """
+import functools
 import base58
-from epicchain.core import types, cryptography, utils as coreutils
+from collections.abc import Iterable
+from epicchain.core import types, cryptography, hashing
 from epicchain.wallet.types import EpicChainAddress
 from epicchain.contracts import utils as contractutils
 
+#: Maximum number of entries held by each of the address conversion caches.
+ADDRESS_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _encode_address(data: bytes) -> EpicChainAddress:
+    return base58.b58encode_check(data).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _decode_address(address: EpicChainAddress) -> bytes:
+    # only valid addresses are cached, a ValueError does not create an entry
+    validate_address(address)
+    return base58.b58decode_check(address)[1:]
+
+
+@functools.lru_cache(maxsize=ADDRESS_CACHE_SIZE)
+def _signature_script_hash(public_key: bytes) -> bytes:
+    return hashing.hash160(contractutils.create_signature_redeemscript(public_key))
+
+
+def address_cache_info() -> dict[str, functools._CacheInfo]:
+    """
+    Return the hit and miss counters of the caches behind :func:`script_hash_to_address`,
+    :func:`address_to_script_hash` and :func:`public_key_to_script_hash`.
+    """
+    return {
+        "script_hash_to_address": _encode_address.cache_info(),
+        "address_to_script_hash": _decode_address.cache_info(),
+        "public_key_to_script_hash": _signature_script_hash.cache_info(),
+    }
+
+
+def clear_address_caches() -> None:
+    """
+    Empty the address conversion caches and reset their counters.
+    """
+    _encode_address.cache_clear()
+    _decode_address.cache_clear()
+    _signature_script_hash.cache_clear()
+
 
 def script_hash_to_address(
     script_hash: types.UInt160, address_version: int = 0x35
@@ -18,8 +61,9 @@ def script_hash_to_address(
         address_version: network protocol address version. Historically has been fixed to `0x35` for MainNet and TestNet.
          Use the `getversion()` RPC method to query for its value.
     """
-    data = address_version.to_bytes(1, "little") + script_hash.to_array()
-    return base58.b58encode_check(data).decode("utf-8")
+    return _encode_address(
+        address_version.to_bytes(1, "little") + script_hash.to_array()
+    )
 
 
 def address_to_script_hash(address: EpicChainAddress) -> types.UInt160:
@@ -33,17 +77,48 @@ def address_to_script_hash(address: EpicChainAddress) -> types.UInt160:
         ValueError: if the length of data (address value in bytes) is not valid.
         ValueError: if the account version is not valid.
     """
-    validate_address(address)
-    data = base58.b58decode_check(address)
-    return types.UInt160(data[1:])
+    return types.UInt160(_decode_address(address))
 
 
 def public_key_to_script_hash(public_key: cryptography.ECPoint) -> types.UInt160:
     """
-    Convert the specified public key to a script hash.
+    Convert the specified public key to the script hash of its signature contract.
+    """
+    return types.UInt160(_signature_script_hash(public_key.encode_point(True)))
+
+
+def public_keys_to_script_hashes(
+    public_keys: Iterable[cryptography.ECPoint],
+) -> list[types.UInt160]:
+    """
+    Convert the specified public keys to the script hashes of their signature contracts.
+
+    Unlike :func:`public_key_to_script_hash` this does not use the cache, as bulk conversions tend to see every key
+    once and would only evict the entries of frequently used keys.
+    """
+    scripts = [
+        contractutils.create_signature_redeemscript(key.encode_point(True))
+        for key in public_keys
+    ]
+    return list(map(types.UInt160, hashing.hash160_many(scripts)))
+
+
+def public_keys_to_addresses(
+    public_keys: Iterable[cryptography.ECPoint], address_version: int = 0x35
+) -> list[EpicChainAddress]:
+    """
+    Convert the specified public keys to the addresses of their signature contracts.
+
+    Args:
+        public_keys: public keys to convert.
+        address_version: network protocol address version. Historically has been fixed to `0x35` for MainNet and TestNet.
+         Use the `getversion()` RPC method to query for its value.
     """
-    contract_script = contractutils.create_signature_redeemscript(public_key)
-    return coreutils.to_script_hash(contract_script)
+    version = address_version.to_bytes(1, "little")
+    return [
+        base58.b58encode_check(version + script_hash.to_array()).decode("utf-8")
+        for script_hash in public_keys_to_script_hashes(public_keys)
+    ]
 
 
 def is_valid_address(address: EpicChainAddress) -> bool:
@@ -0,0 +1,283 @@
+import asyncio
+import unittest
+from epicchain import vm
+from epicchain.api import localvm, wrappers
+from epicchain.contracts import contract, xef, manifest, abi, callflags
+from epicchain.core import types
+from epicchain.network.payloads import verification
+
+
+def _method(name, offset, parameter_count, return_type, safe=True):
+    parameters = [
+        abi.ContractParameterDefinition(f"arg{i}", abi.ContractParameterType.ANY)
+        for i in range(parameter_count)
+    ]
+    return abi.ContractMethodDescriptor(name, offset, parameters, return_type, safe)
+
+
+class LocalVMTestCase(unittest.TestCase):
+    contract_hash = types.UInt160(b"\x01" * 20)
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        # get(key), find(prefix) and put(key, value) on the contract's storage
+        sb = vm.ScriptBuilder()
+        get_offset = len(sb.data)
+        sb.emit(vm.OpCode.INITSLOT, b"\x00\x01")
+        sb.emit(vm.OpCode.LDARG0)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_GET_READ_ONLY_CONTEXT)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_GET)
+        sb.emit(vm.OpCode.RET)
+        find_offset = len(sb.data)
+        sb.emit(vm.OpCode.INITSLOT, b"\x00\x01")
+        sb.emit_push(localvm.FindOptions.KEYS_ONLY | localvm.FindOptions.REMOVE_PREFIX)
+        sb.emit(vm.OpCode.LDARG0)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_GET_READ_ONLY_CONTEXT)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_FIND)
+        sb.emit(vm.OpCode.RET)
+        put_offset = len(sb.data)
+        sb.emit(vm.OpCode.INITSLOT, b"\x00\x02")
+        sb.emit(vm.OpCode.LDARG1)
+        sb.emit(vm.OpCode.LDARG0)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_GET_CONTEXT)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_STORAGE_PUT)
+        sb.emit(vm.OpCode.RET)
+
+        manifest_ = manifest.ContractManifest("test")
+        manifest_.abi = abi.ContractABI(
+            methods=[
+                _method("get", get_offset, 1, abi.ContractParameterType.BYTEARRAY),
+                _method(
+                    "find", find_offset, 1, abi.ContractParameterType.INTEROPINTERFACE
+                ),
+                _method(
+                    "put", put_offset, 2, abi.ContractParameterType.VOID, safe=False
+                ),
+            ],
+            events=[],
+        )
+        cls.contract_state = contract.ContractState(
+            1, xef.XEF(script=sb.to_array()), manifest_, 0, cls.contract_hash
+        )
+
+    def setUp(self) -> None:
+        self.snapshot = localvm.MemorySnapshot()
+        self.snapshot.add_contract(self.contract_state)
+        self.snapshot.put_storage(self.contract_hash, b"\x01a", b"A")
+        self.snapshot.put_storage(self.contract_hash, b"\x01b", b"B")
+        self.snapshot.put_storage(self.contract_hash, b"\x02c", b"C")
+
+    def test_arithmetic(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_push(-7).emit_push(2).emit(vm.OpCode.DIV)
+        sb.emit_push(-7).emit_push(2).emit(vm.OpCode.MOD)
+        sb.emit_push(2**200).emit_push(2**200).emit(vm.OpCode.MUL)
+        result = localvm.test_invoke(sb.to_array())
+        self.assertEqual("FAULT", result.state)
+        self.assertIn("Integer overflow", result.exception)
+
+        sb = vm.ScriptBuilder()
+        sb.emit_push(-7).emit_push(2).emit(vm.OpCode.DIV)
+        sb.emit_push(-7).emit_push(2).emit(vm.OpCode.MOD)
+        sb.emit_push(1).emit_push(254).emit(vm.OpCode.SHL)
+        result = localvm.test_invoke(sb.to_array())
+        self.assertEqual("HALT", result.state)
+        self.assertEqual([-3, -1, 2**254], [item.value for item in result.stack])
+
+    def test_result_types(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_push(True)
+        sb.emit_push("abc")
+        sb.emit_push({"key": 1})
+        sb.emit(vm.OpCode.PUSHNULL)
+        sb.emit_push(b"\x01\x02").emit(vm.OpCode.CONVERT, b"\x30")
+        result = localvm.test_invoke(sb.to_array())
+        self.assertEqual("HALT", result.state)
+        self.assertTrue(result.stack[0].as_bool())
+        self.assertEqual("abc", result.stack[1].as_str())
+        self.assertEqual({b"key": 1}, result.stack[2].as_dict())
+        self.assertIsNone(result.stack[3].as_none())
+        self.assertEqual(b"\x01\x02", result.stack[4].as_bytes())
+        # 3x PUSH/PUSHDATA1 + 2x PUSHDATA1, PUSH1, PACKMAP, PUSHNULL, PUSHDATA1, CONVERT
+        self.assertEqual(
+            (1 + 8 + 8 + 1 + 1 + 2048 + 1 + 8 + 8192) * 30, result.xpp_consumed
+        )
+
+    def test_call_and_slots(self):
+        sb = vm.ScriptBuilder()
+        sb.emit(vm.OpCode.INITSSLOT, b"\x01")
+        sb.emit_push(5)
+        sb.emit(vm.OpCode.STSFLD0)
+        sb.emit_push(3)
+        sb.emit_call(3)
+        sb.emit(vm.OpCode.RET)
+        # function adding its argument to the static field
+        sb.emit(vm.OpCode.INITSLOT, b"\x01\x01")
+        sb.emit(vm.OpCode.LDARG0)
+        sb.emit(vm.OpCode.LDSFLD0)
+        sb.emit(vm.OpCode.ADD)
+        sb.emit(vm.OpCode.RET)
+        result = localvm.test_invoke(sb.to_array())
+        self.assertEqual("HALT", result.state)
+        self.assertEqual([8], [item.value for item in result.stack])
+
+    def test_try_catch_finally(self):
+        sb = vm.ScriptBuilder()
+        # TRY catch=+12 finally=+16
+        sb.emit(vm.OpCode.TRY, b"\x0c\x10")
+        sb.emit_push("error")
+        sb.emit(vm.OpCode.THROW)
+        sb.emit(vm.OpCode.NOP)
+        # catch: the exception is on the stack
+        sb.emit(vm.OpCode.ENDTRY, b"\x06")
+        sb.emit(vm.OpCode.NOP)
+        sb.emit(vm.OpCode.NOP)
+        # finally
+        sb.emit_push(1)
+        sb.emit(vm.OpCode.ENDFINALLY)
+        sb.emit_push(2)
+        result = localvm.test_invoke(sb.to_array())
+        self.assertEqual("HALT", result.state, result.exception)
+        self.assertEqual([b"error", 1, 2], [item.value for item in result.stack])
+
+        result = localvm.test_invoke(
+            vm.ScriptBuilder().emit_push("boom").emit(vm.OpCode.THROW).to_array()
+        )
+        self.assertEqual("FAULT", result.state)
+        self.assertEqual("An unhandled exception was thrown. boom", result.exception)
+
+    def test_faults(self):
+        for script, message in [
+            (vm.OpCode.ABORT + b"", "ABORT is executed."),
+            (
+                vm.OpCode.PUSH0 + vm.OpCode.PUSH0 + vm.OpCode.DIV,
+                "Attempted to divide by zero.",
+            ),
+            (vm.OpCode.DROP + b"", "Stack or index out of range executing DROP at 0"),
+            (b"\xff", "Invalid opcode 0xff at 0"),
+        ]:
+            result = localvm.test_invoke(script)
+            self.assertEqual("FAULT", result.state)
+            self.assertEqual(message, result.exception)
+            self.assertEqual([], result.stack)
+
+    def test_xpp_limit(self):
+        script = vm.ScriptBuilder().emit_jump(vm.OpCode.JMP, 0).to_array()
+        engine = localvm.ApplicationEngine(script, xpp_limit=1000)
+        result = engine.execute()
+        self.assertEqual("FAULT", result.state)
+        self.assertEqual("Insufficient XPP.", result.exception)
+
+    def test_contract_call_storage(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args(self.contract_hash, "get", [b"\x01a"])
+        sb.emit_contract_call_with_args(self.contract_hash, "put", [b"\x01a", b"X"])
+        sb.emit_contract_call_with_args(self.contract_hash, "get", [b"\x01a"])
+        sb.emit_contract_call_with_args(self.contract_hash, "get", [b"\x09"])
+        result = localvm.test_invoke(sb.to_array(), self.snapshot)
+        self.assertEqual("HALT", result.state, result.exception)
+        self.assertEqual(
+            [b"A", None, b"X", None], [item.value for item in result.stack]
+        )
+        # writes are not persisted
+        self.assertEqual(b"A", self.snapshot.get_storage(self.contract_hash, b"\x01a"))
+
+    def test_read_only_call_flags(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args(
+            self.contract_hash, "put", [b"\x01a", b"X"], callflags.CallFlags.READ_ONLY
+        )
+        result = localvm.test_invoke(sb.to_array(), self.snapshot)
+        self.assertEqual("FAULT", result.state)
+        self.assertIn("Cannot call this SYSCALL", result.exception)
+
+    def test_unwrap_iterator(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args_and_unwrap_iterator(
+            self.contract_hash, "find", [b"\x01"]
+        )
+        result = localvm.test_invoke(sb.to_array(), self.snapshot)
+        self.assertEqual("HALT", result.state, result.exception)
+        self.assertEqual(
+            [b"a", b"b"], [item.value for item in result.stack[0].as_list()]
+        )
+
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args(self.contract_hash, "find", [b"\x01"])
+        result = localvm.test_invoke(sb.to_array(), self.snapshot)
+        self.assertEqual([b"a", b"b"], [item.value for item in result.stack[0].value])
+
+    def test_unknown_contract(self):
+        sb = vm.ScriptBuilder().emit_contract_call(types.UInt160.zero(), "symbol")
+        result = localvm.test_invoke(sb.to_array(), self.snapshot)
+        self.assertEqual("FAULT", result.state)
+        self.assertEqual(
+            f"Called Contract Does Not Exist: {types.UInt160.zero()}", result.exception
+        )
+
+    def test_native_contract(self):
+        calls = []
+
+        def native(engine, method, args):
+            calls.append((method, args))
+            return 10**8
+
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args(
+            types.UInt160.zero(), "balanceOf", [b"\x02" * 20]
+        )
+        result = localvm.test_invoke(
+            sb.to_array(), native_contracts={types.UInt160.zero(): native}
+        )
+        self.assertEqual("HALT", result.state)
+        self.assertEqual(10**8, result.stack[0].as_int())
+        self.assertEqual([("balanceOf", [b"\x02" * 20])], calls)
+
+    def test_check_witness_and_notify(self):
+        account = types.UInt160(b"\x03" * 20)
+        sb = vm.ScriptBuilder()
+        sb.emit_push(account)
+        sb.emit_syscall(vm.Syscalls.SYSTEM_RUNTIME_CHECK_WITNESS)
+        sb.emit_push(types.UInt160(b"\x04" * 20))
+        sb.emit_syscall(vm.Syscalls.SYSTEM_RUNTIME_CHECK_WITNESS)
+        sb.emit_push([1])
+        sb.emit_push("Transfer")
+        sb.emit_syscall(vm.Syscalls.SYSTEM_RUNTIME_NOTIFY)
+        signer = verification.Signer(account)
+        result = localvm.test_invoke(sb.to_array(), signers=[signer])
+        self.assertEqual("HALT", result.state, result.exception)
+        self.assertEqual([True, False], [item.value for item in result.stack])
+        self.assertEqual(1, len(result.notifications))
+        self.assertEqual("Transfer", result.notifications[0].event_name)
+
+    def test_register_syscall(self):
+        script = (
+            vm.ScriptBuilder()
+            .emit_syscall(vm.Syscalls.SYSTEM_RUNTIME_GET_SCRIPT_CONTAINER)
+            .to_array()
+        )
+        result = localvm.test_invoke(script)
+        self.assertEqual("FAULT", result.state)
+        self.assertEqual(
+            "Syscall not supported: System.Runtime.GetScriptContainer", result.exception
+        )
+
+        engine = localvm.ApplicationEngine(script)
+        engine.register_syscall(
+            vm.Syscalls.SYSTEM_RUNTIME_GET_SCRIPT_CONTAINER, lambda e: e.push(b"tx")
+        )
+        result = engine.execute()
+        self.assertEqual("HALT", result.state)
+        self.assertEqual(b"tx", result.stack[0].value)
+        self.assertEqual((1 << 3) * 30, result.xpp_consumed)
+
+    def test_chain_facade(self):
+        facade = wrappers.ChainFacade(
+            "http://localhost:1", local_snapshot=self.snapshot
+        )
+        f = wrappers.GenericContract(self.contract_hash).call_function(
+            "get", [b"\x01b"]
+        )
+        result = asyncio.run(facade.test_invoke_raw(f))
+        self.assertEqual(b"B", result.stack[0].as_bytes())
+        self.assertEqual(result.xpp_consumed, asyncio.run(facade.estimate_xpp(f)))
@@ -1,6 +1,7 @@
 import unittest
+from epicchain import vm
 from epicchain.contracts import utils, xef
-from epicchain.core import types
+from epicchain.core import types, cryptography
 
 
 class TestContractUtils(unittest.TestCase):
@@ -21,3 +22,24 @@ class TestContractUtils(unittest.TestCase):
             "0x55f776130883b2d486dec295ca74533663d0f8ea"
         )
         self.assertEqual(expected, actual)
+
+    def test_create_signature_redeemscript(self):
+        key_pair = cryptography.KeyPair(b"\x01" * 32)
+        sb = vm.ScriptBuilder()
+        sb.emit_push(key_pair.public_key.encode_point(True))
+        sb.emit_syscall(vm.Syscalls.SYSTEM_CRYPTO_CHECK_STANDARD_ACCOUNT)
+        expected = sb.to_array()
+
+        script = utils.create_signature_redeemscript(key_pair.public_key)
+        self.assertEqual(expected, script)
+        self.assertTrue(utils.is_signature_contract(script))
+        self.assertEqual(
+            expected,
+            utils.create_signature_redeemscript(key_pair.public_key.encode_point(True)),
+        )
+        with self.assertRaises(ValueError) as context:
+            utils.create_signature_redeemscript(b"\x02" * 32)
+        self.assertEqual(
+            "Expected a compressed public key of 33 bytes, got 32",
+            str(context.exception),
+        )
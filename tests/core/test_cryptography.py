@@ -1,8 +1,10 @@
 import unittest
 import binascii
 import hashlib
+from unittest.mock import patch
 from epicchaincrypto import mmh3_hash_bytes, mmh3_hash
-from epicchain.core import types
+from copy import deepcopy
+from epicchain.core import types, serialization
 from epicchain.core import cryptography as crypto
 
 
@@ -26,6 +28,22 @@ class MerkleTreeTestCase(unittest.TestCase):
 
         self.assertEqual(expected_hash, root.to_array())
 
+    def test_compute_root_from_array(self):
+        hashes = [types.UInt256(bytes([i]) * 32) for i in range(5)]
+        self.assertEqual(
+            crypto.MerkleTree.compute_root(hashes),
+            crypto.MerkleTree.compute_root(types.UInt256Array(hashes)),
+        )
+
+    def test_compute_root_matches_tree(self):
+        for count in range(2, 18):
+            hashes = [types.UInt256(bytes([i]) * 32) for i in range(count)]
+            self.assertEqual(
+                crypto.MerkleTree(hashes).root.hash,
+                crypto.MerkleTree.compute_root(hashes),
+                msg=f"{count} hashes",
+            )
+
     def test_computer_root_no_input(self):
         self.assertEqual(types.UInt256.zero(), crypto.MerkleTree.compute_root([]))
 
@@ -62,6 +80,84 @@ class MerkleTreeTestCase(unittest.TestCase):
         self.assertEqual(False, m.root.left_child.is_root())
         self.assertEqual(True, m.root.left_child.is_leaf())
 
+    def test_proof(self):
+        for count in range(1, 12):
+            hashes = [types.UInt256(bytes([i]) * 32) for i in range(count)]
+            tree = crypto.MerkleTree(hashes)
+            for i, h in enumerate(hashes):
+                proof = tree.proof(i)
+                self.assertEqual(tree.depth - 1, len(proof.hashes))
+                self.assertTrue(crypto.verify_proof(h, proof, tree.root.hash))
+
+        with self.assertRaises(ValueError) as context:
+            tree.proof(count)
+        self.assertIn("Invalid leaf index 11", str(context.exception))
+
+    def test_verify_proof_rejects(self):
+        hashes = [types.UInt256(bytes([i]) * 32) for i in range(5)]
+        tree = crypto.MerkleTree(hashes)
+        root = tree.root.hash
+        proof = tree.proof(2)
+        self.assertFalse(crypto.verify_proof(hashes[3], proof, root))
+        self.assertFalse(crypto.verify_proof(hashes[2], proof, hashes[0]))
+        proof.index = 3
+        self.assertFalse(crypto.verify_proof(hashes[2], proof, root))
+        # index bits beyond the depth of the proof
+        proof.index = 2 + 8
+        self.assertFalse(crypto.verify_proof(hashes[2], proof, root))
+
+    def test_build_proofs(self):
+        for count in range(1, 12):
+            hashes = [types.UInt256(bytes([i]) * 32) for i in range(count)]
+            tree = crypto.MerkleTree(hashes)
+            expected = [tree.proof(i) for i in range(count)]
+            self.assertEqual(
+                expected, crypto.MerkleTree.build_proofs(hashes, range(count))
+            )
+            self.assertEqual(
+                expected,
+                crypto.MerkleTree.build_proofs(
+                    types.UInt256Array(hashes), range(count)
+                ),
+            )
+        self.assertEqual([], crypto.MerkleTree.build_proofs(hashes, []))
+        with self.assertRaises(ValueError):
+            crypto.MerkleTree.build_proofs(hashes, [-1])
+
+    def test_proof_serialization(self):
+        hashes = [types.UInt256(bytes([i]) * 32) for i in range(5)]
+        proof = crypto.MerkleTree(hashes).proof(4)
+        data = proof.to_array()
+        self.assertEqual(len(proof), len(data))
+        self.assertEqual(proof, crypto.MerkleProof.deserialize_from_bytes(data))
+
+
+class MerkleAccumulatorTestCase(unittest.TestCase):
+    def test_matches_compute_root(self):
+        hashes = [types.UInt256(bytes([i]) * 32) for i in range(40)]
+        accumulator = crypto.MerkleAccumulator()
+        self.assertEqual(types.UInt256.zero(), accumulator.root())
+        for i, h in enumerate(hashes, start=1):
+            accumulator.append(h)
+            self.assertEqual(i, len(accumulator))
+            self.assertEqual(
+                crypto.MerkleTree.compute_root(hashes[:i]),
+                accumulator.root(),
+                msg=f"{i} hashes",
+            )
+
+    def test_extend_and_reset(self):
+        hashes = [types.UInt256(bytes([i]) * 32) for i in range(7)]
+        accumulator = crypto.MerkleAccumulator(hashes[:3])
+        accumulator.extend(hashes[3:])
+        self.assertEqual(crypto.MerkleTree.compute_root(hashes), accumulator.root())
+
+        accumulator.reset()
+        self.assertEqual(0, len(accumulator))
+        self.assertEqual(types.UInt256.zero(), accumulator.root())
+        accumulator.append(hashes[0])
+        self.assertEqual(hashes[0], accumulator.root())
+
 
 class BloomFilterTestCase(unittest.TestCase):
     def shortDescription(self):
@@ -111,6 +207,74 @@ class BloomFilterTestCase(unittest.TestCase):
         filter = crypto.BloomFilter(m=7, k=10, ntweak=123456, elements=elements)
         self.assertEqual(b"\x00", filter.get_bits())
 
+    def test_add_many_and_check_many(self):
+        elements = [bytes([i]) * 20 for i in range(50)]
+        filter1 = crypto.BloomFilter(m=2000, k=5, ntweak=123456)
+        filter2 = crypto.BloomFilter(m=2000, k=5, ntweak=123456)
+        for element in elements:
+            filter1.add(element)
+        filter2.add_many(elements)
+        self.assertEqual(filter1.bits, filter2.bits)
+        others = [bytes([i]) * 21 for i in range(50)]
+        self.assertEqual(
+            [filter1.check(e) for e in elements + others],
+            filter2.check_many(elements + others),
+        )
+        self.assertEqual([True] * 50, filter2.check_many(elements))
+        filter2.add_many([])
+        self.assertEqual([], filter2.check_many([]))
+
+    def test_for_capacity(self):
+        filter = crypto.BloomFilter.for_capacity(1000, 0.01, ntweak=1)
+        # 9586 bits rounded up to whole bytes
+        self.assertEqual(9592, len(filter.bits))
+        self.assertEqual(7, filter.K)
+        self.assertEqual(1, filter.tweak)
+        self.assertEqual(
+            crypto.BloomFilter.MAX_HASH_FUNCTIONS,
+            crypto.BloomFilter.for_capacity(1, 1e-30).K,
+        )
+
+        with self.assertRaises(ValueError) as context:
+            crypto.BloomFilter.for_capacity(0, 0.01)
+        self.assertIn("Capacity must be positive, got 0", str(context.exception))
+        with self.assertRaises(ValueError) as context:
+            crypto.BloomFilter.for_capacity(10, 1.0)
+        self.assertIn(
+            "False positive rate must be between 0 and 1, got 1.0",
+            str(context.exception),
+        )
+
+    def test_for_capacity_survives_transfer(self):
+        elements = [bytes([i]) * 20 for i in range(7)]
+        filter = crypto.BloomFilter.for_capacity(7, 0.05, ntweak=3)
+        filter.add_many(elements)
+
+        # rebuilt like a node does on receiving FILTERLOAD
+        bits = filter.get_bits()
+        rebuilt = crypto.BloomFilter(len(bits) * 8, filter.K, filter.tweak, bits)
+        self.assertEqual(len(filter.bits), len(rebuilt.bits))
+        self.assertEqual([True] * 7, rebuilt.check_many(elements))
+
+    def test_union_and_intersection(self):
+        filter1 = crypto.BloomFilter(m=2000, k=5, ntweak=1)
+        filter2 = crypto.BloomFilter(m=2000, k=5, ntweak=1)
+        filter1.add_many([b"\x01", b"\x02"])
+        filter2.add_many([b"\x02", b"\x03"])
+
+        union = filter1 | filter2
+        self.assertEqual([True] * 3, union.check_many([b"\x01", b"\x02", b"\x03"]))
+        self.assertEqual(5, union.K)
+        self.assertEqual(1, union.tweak)
+
+        intersection = filter1.intersection(filter2)
+        self.assertTrue(intersection.check(b"\x02"))
+        self.assertEqual(filter1.bits & filter2.bits, (filter1 & filter2).bits)
+
+        with self.assertRaises(ValueError) as context:
+            filter1.union(crypto.BloomFilter(m=2000, k=5, ntweak=2))
+        self.assertIn("Cannot combine filters", str(context.exception))
+
 
 class Murmur128test(unittest.TestCase):
     def shortDescription(self):
@@ -138,3 +302,103 @@ class MurMur32test(unittest.TestCase):
         self.assertEqual(
             bytes.fromhex("3cdc1e41"), x.to_bytes(4, "little", signed=False)
         )
+
+
+class VerifyBatchTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        keypairs = [crypto.KeyPair(bytes([i + 1]) * 32) for i in range(3)]
+        cls.items = []
+        for i in range(100):
+            keypair = keypairs[i % 3]
+            message = i.to_bytes(4, "little")
+            signature = crypto.sign(message, keypair.private_key)
+            cls.items.append(
+                (message, signature, keypair.public_key.encode_point(True))
+            )
+        # wrong message, wrong key and an invalid key
+        message, signature, public_key = cls.items[0]
+        cls.items[10] = (b"\x01", signature, public_key)
+        cls.items[20] = (message, signature, cls.items[1][2])
+        cls.items[30] = (message, signature, b"\x02" + b"\xff" * 32)
+        cls.expected = [i not in (10, 20, 30) for i in range(100)]
+
+    def test_in_process(self):
+        self.assertEqual(self.expected[:5], crypto.verify_batch(self.items[:5]))
+        for (message, signature, public_key), expected in zip(
+            self.items[:5], self.expected
+        ):
+            self.assertEqual(
+                expected, crypto.verify_signature(message, signature, public_key)
+            )
+
+    def test_public_keys_use_point_cache(self):
+        crypto.ECPoint.clear_cache()
+        crypto.verify_batch(self.items[:6])
+        # 3 distinct valid keys parsed once each, the others are served from the cache
+        info = crypto.ECPoint.cache_info()
+        self.assertEqual(3, info["size"])
+        self.assertEqual(3, info["hits"])
+
+    def test_process_pool(self):
+        with patch("epicchain.core.cryptography.os.cpu_count", return_value=2):
+            self.assertEqual(self.expected, crypto.verify_batch(self.items))
+
+
+class ECPointCacheTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        crypto.ECPoint.clear_cache()
+        self.data = crypto.KeyPair(b"\x01" * 32).public_key.encode_point(True)
+
+    def test_shared_instance(self):
+        p1 = crypto.ECPoint.deserialize_from_bytes(self.data)
+        p2 = crypto.ECPoint.deserialize_from_bytes(bytearray(self.data))
+        self.assertIs(p1, p2)
+        self.assertEqual(
+            {"hits": 1, "misses": 1, "size": 1, "max_size": 1024},
+            crypto.ECPoint.cache_info(),
+        )
+
+        p3 = crypto.ECPoint.deserialize_from_bytes(self.data, use_cache=False)
+        self.assertIsNot(p1, p3)
+        self.assertEqual(p1, p3)
+
+    def test_shared_instance_is_immutable(self):
+        p = crypto.ECPoint.deserialize_from_bytes(self.data)
+        with self.assertRaises(ValueError) as context:
+            p.deserialize(serialization.BinaryReader(b"\x00"))
+        self.assertIn("Cannot modify a shared ECPoint", str(context.exception))
+        with self.assertRaises(ValueError):
+            p.from_bytes(b"\x00", crypto.ECCCurve.SECP256R1, True)
+
+        # copies are private
+        p_copy = deepcopy(p)
+        p_copy.deserialize(serialization.BinaryReader(b"\x00"))
+        self.assertTrue(p_copy.is_infinity)
+        self.assertFalse(p.is_infinity)
+
+    def test_validation(self):
+        p1 = crypto.ECPoint.deserialize_from_bytes(self.data, validate=False)
+        # not validated before, thus parsed again
+        p2 = crypto.ECPoint.deserialize_from_bytes(self.data, validate=True)
+        p3 = crypto.ECPoint.deserialize_from_bytes(self.data, validate=False)
+        self.assertIsNot(p1, p2)
+        self.assertIs(p2, p3)
+        self.assertEqual(1, crypto.ECPoint.cache_info()["hits"])
+
+        invalid = b"\x02" + b"\xff" * 32
+        for _ in range(2):
+            with self.assertRaises(Exception):
+                crypto.ECPoint.deserialize_from_bytes(invalid)
+        self.assertEqual(1, crypto.ECPoint.cache_info()["size"])
+
+    def test_read_cached(self):
+        reader = serialization.BinaryReader(self.data + self.data + b"\x00")
+        p1 = crypto.ECPoint.read_cached(reader)
+        p2 = crypto.ECPoint.read_cached(reader)
+        self.assertIs(p1, p2)
+        self.assertTrue(crypto.ECPoint.read_cached(reader).is_infinity)
+
+        with self.assertRaises(ValueError) as context:
+            crypto.ECPoint.read_cached(serialization.BinaryReader(b"\x05"))
+        self.assertIn("Unsupported point encoding", str(context.exception))
@@ -0,0 +1,55 @@
+import hashlib
+import unittest
+from epicchain.core import hashing
+
+
+class HashingTestCase(unittest.TestCase):
+    def tearDown(self) -> None:
+        hashing.reset_backend()
+
+    def test_digests(self):
+        data = b"\x01\x02\x03"
+        sha = hashlib.sha256(data).digest()
+        self.assertEqual(sha, hashing.sha256(data))
+        self.assertEqual(hashlib.sha256(sha).digest(), hashing.hash256(data))
+        self.assertEqual(
+            "79f901da2609f020adadbf2e5f68a16c8c3f7d57", hashing.ripemd160(data).hex()
+        )
+        self.assertEqual(hashing.ripemd160(sha), hashing.hash160(data))
+        self.assertEqual(hashing.sha256(data), hashing.sha256(memoryview(data)))
+
+    def test_many(self):
+        items = [b"", b"\x01", bytearray(b"\x02" * 100)]
+        self.assertEqual(list(map(hashing.sha256, items)), hashing.sha256_many(items))
+        self.assertEqual(
+            list(map(hashing.hash256, items)), hashing.hash256_many(iter(items))
+        )
+        self.assertEqual(list(map(hashing.hash160, items)), hashing.hash160_many(items))
+        self.assertEqual([], hashing.sha256_many([]))
+
+    def test_ripemd160_fallback(self):
+        # test vectors from the RIPEMD-160 specification
+        vectors = [
+            (b"", "9c1185a5c5e9fc54612808977ee8f548b2258d31"),
+            (b"abc", "8eb208f7e05d987a9b044a8e98c6b087f15a0bfc"),
+            (b"message digest", "5d0689ef49d2fae572b881b123a85ffa21595f36"),
+            (
+                b"abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq",
+                "12a053384a9c0c88e405a06c27dcf49ada62eb2b",
+            ),
+            (b"1234567890" * 8, "9b752e45573d4b39f4dbd3323cab82bf63326bfb"),
+        ]
+        for data, expected in vectors:
+            self.assertEqual(expected, hashing._ripemd160_fallback(data).hex())
+
+    def test_set_backend(self):
+        hashing.set_backend(sha256=lambda data: b"\x00" * 32)
+        self.assertEqual(b"\x00" * 32, hashing.sha256(b"\x01"))
+        # unchanged
+        self.assertEqual(
+            hashing._default_ripemd160(b"\x01"), hashing.ripemd160(b"\x01")
+        )
+
+        hashing.set_backend(ripemd160=hashing._ripemd160_fallback)
+        hashing.reset_backend()
+        self.assertEqual(hashlib.sha256(b"\x01").digest(), hashing.sha256(b"\x01"))
@@ -18,6 +18,140 @@ class SerializableObj(serialization.ISerializable):
         return 1
 
 
+class PlannedObj(serialization.ISerializable):
+    """Helper class for tests"""
+
+    _plan = serialization.SerializationPlan(
+        serialization.Field.uint8("a"),
+        serialization.Field.int32("b"),
+        serialization.Field.fixed_bytes("c", 2),
+        serialization.Field.var_bytes("d", max=4),
+        serialization.Field.uint16("e"),
+        serialization.Field.serializable_list("f", SerializableObj),
+    )
+
+    def __init__(self):
+        self.a = 0
+        self.b = 0
+        self.c = b"\x00\x00"
+        self.d = b""
+        self.e = 0
+        self.f = []
+
+    def serialize(self, writer: serialization.BinaryWriter) -> None:
+        self._plan.serialize(self, writer)
+
+    def deserialize(self, reader: serialization.BinaryReader) -> None:
+        self._plan.deserialize(self, reader)
+
+    def __len__(self):
+        return self._plan.fixed_size + 1 + len(self.d) + 1 + len(self.f)
+
+
+class SerializationPlanTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        obj = PlannedObj()
+        obj.a = 1
+        obj.b = -2
+        obj.c = b"\x03\x04"
+        obj.d = b"\x05"
+        obj.e = 6
+        obj.f = [SerializableObj(7), SerializableObj(8)]
+
+        expected = b"\x01\xfe\xff\xff\xff\x03\x04\x01\x05\x06\x00\x02\x07\x08"
+        self.assertEqual(expected, obj.to_array())
+        self.assertEqual(len(expected), len(obj))
+
+        obj2 = PlannedObj.deserialize_from_bytes(expected)
+        self.assertEqual(1, obj2.a)
+        self.assertEqual(-2, obj2.b)
+        self.assertEqual(b"\x03\x04", obj2.c)
+        self.assertEqual(b"\x05", obj2.d)
+        self.assertEqual(6, obj2.e)
+        self.assertEqual([7, 8], [o.a for o in obj2.f])
+
+    def test_fixed_size(self):
+        self.assertEqual(1 + 4 + 2 + 2, PlannedObj._plan.fixed_size)
+
+    def test_compiles_fixed_runs(self):
+        # the fixed fields before and after the variable length field are merged into a single struct
+        self.assertEqual(4, len(PlannedObj._plan._steps))
+
+    def test_encode_decode(self):
+        plan = serialization.SerializationPlan(
+            serialization.Field("value", "B", encode=lambda v: v - 1, decode=str)
+        )
+
+        class Obj:
+            value = 5
+
+        with serialization.BinaryWriter() as bw:
+            plan.serialize(Obj, bw)
+            self.assertEqual(b"\x04", bw.to_array())
+
+        with serialization.BinaryReader(b"\x09") as br:
+            plan.deserialize(Obj, br)
+        self.assertEqual("9", Obj.value)
+
+    def test_insufficient_data(self):
+        with self.assertRaises(ValueError) as context:
+            PlannedObj.deserialize_from_bytes(b"\x01\x02")
+        self.assertIn(
+            "Could not read 7 bytes from stream. Only found 2 bytes of data",
+            str(context.exception),
+        )
+
+    def test_invalid_field(self):
+        with self.assertRaises(ValueError) as context:
+            serialization.Field("a")
+        self.assertIn("must either have a format", str(context.exception))
+
+
+class CachedSizeObj(serialization.CachedSizeMixin, serialization.ISerializable):
+    """Helper class for tests"""
+
+    def __init__(self, data: bytes = b""):
+        self.data = data
+
+    def serialize(self, writer: serialization.BinaryWriter) -> None:
+        writer.write_var_bytes(self.data)
+
+    def deserialize(self, reader: serialization.BinaryReader) -> None:
+        start = reader.tell()
+        self.data = reader.read_var_bytes()
+        self._cache_size(reader.tell() - start)
+
+    def _compute_size(self) -> int:
+        self.computed = getattr(self, "computed", 0) + 1
+        return 1 + len(self.data)
+
+    def _size_key(self) -> tuple:
+        return (self.data,)
+
+
+class CachedSizeMixinTestCase(unittest.TestCase):
+    def test_constructed_object_computes_size(self):
+        obj = CachedSizeObj(b"\x01\x02")
+        self.assertEqual(3, len(obj))
+        self.assertEqual(3, len(obj))
+        self.assertEqual(2, obj.computed)
+
+    def test_deserialized_object_caches_size(self):
+        obj = CachedSizeObj.deserialize_from_bytes(b"\x02\x01\x02")
+        self.assertEqual(3, len(obj))
+        self.assertFalse(hasattr(obj, "computed"))
+
+        obj.data = b"\x01"
+        self.assertEqual(2, len(obj))
+        self.assertEqual(1, obj.computed)
+
+    def test_invalidate_size(self):
+        obj = CachedSizeObj.deserialize_from_bytes(b"\x02\x01\x02")
+        obj.invalidate_size()
+        self.assertEqual(3, len(obj))
+        self.assertEqual(1, obj.computed)
+
+
 class ISerializableTestCase(unittest.TestCase):
     def test_deserialize_from_bytes(self):
         # test class method
@@ -25,6 +159,29 @@ class ISerializableTestCase(unittest.TestCase):
         obj = s1.deserialize_from_bytes(b"\x01")
         self.assertEqual(1, obj.a)
 
+    def test_deserialize_many(self):
+        objs = SerializableObj.deserialize_many(b"\x01\x02\x03")
+        self.assertNotIsInstance(objs, list)
+        self.assertEqual([1, 2, 3], [o.a for o in objs])
+
+        objs = SerializableObj.deserialize_many(memoryview(b"\x01\x02\x03"), count=2)
+        self.assertEqual([1, 2], [o.a for o in objs])
+
+        self.assertEqual([], list(SerializableObj.deserialize_many(b"")))
+
+        with self.assertRaises(ValueError) as context:
+            list(SerializableObj.deserialize_many(b"\x01", count=2))
+        self.assertIn("Could not read 1 bytes from stream", str(context.exception))
+
+    def test_deserialize_many_truncated(self):
+        obj = PlannedObj()
+        obj.d = b"\x01\x02"
+        data = obj.to_array()
+        self.assertEqual(2, len(list(PlannedObj.deserialize_many(data * 2))))
+        # the trailing object misses part of its variable length field
+        with self.assertRaises(ValueError):
+            list(PlannedObj.deserialize_many(data + data[:9]))
+
 
 class BinaryReaderTestCase(unittest.TestCase):
     def test_read_bytes(self):
@@ -243,71 +400,108 @@ class BinaryReaderTestCase(unittest.TestCase):
         with serialization.BinaryReader(input_data) as br:
             self.assertEqual(3, len(br))
 
+    def test_read_view(self):
+        input_data = bytearray(b"\x01\x02\x03\x04")
+        with serialization.BinaryReader(input_data) as br:
+            v = br.read_view(2)
+            self.assertIsInstance(v, memoryview)
+            self.assertEqual(b"\x01\x02", v)
+            self.assertEqual(0x0403, br.read_uint16())
+
+        # views remain usable after the reader is closed
+        self.assertEqual(b"\x01\x02", bytes(v))
+
+        with self.assertRaises(ValueError) as context:
+            with serialization.BinaryReader(input_data) as br:
+                br.read_view(5)
+        self.assertIn(
+            "Could not read 5 bytes from stream. Only found 4 bytes of data",
+            str(context.exception),
+        )
+
+    def test_read_var_view(self):
+        input_data = b"\x02\x01\x02\x03"
+        with serialization.BinaryReader(input_data) as br:
+            v = br.read_var_view()
+            self.assertIsInstance(v, memoryview)
+            self.assertEqual(input_data[1:3], v)
+            self.assertEqual(3, br.read_uint8())
+
+    def test_reading_from_memoryview(self):
+        input_data = memoryview(b"\xff\x01\x02\x03\x04\x05\x06\x07\x08")[1:]
+        with serialization.BinaryReader(input_data) as br:
+            self.assertEqual(8, len(br))
+            self.assertEqual(0x0201, br.read_uint16())
+            b = br.read_bytes(2)
+            self.assertIsInstance(b, bytes)
+            self.assertEqual(b"\x03\x04", b)
+            self.assertEqual(0x08070605, br.read_uint32())
+
 
 class BinaryWriterTestCase(unittest.TestCase):
     def test_write_bytes(self):
         with serialization.BinaryWriter() as bw:
             bw.write_uint8(5)
             bw.write_uint16(257)
-            self.assertEqual(b"\x05\x01\x01", bw._stream.getvalue())
+            self.assertEqual(b"\x05\x01\x01", bw.to_array())
 
     def test_write_bool(self):
         with serialization.BinaryWriter() as bw:
             bw.write_bool(0)
             bw.write_bool(1)
             bw.write_bool(15)
-            self.assertEqual(b"\x00\x01\x01", bw._stream.getvalue())
+            self.assertEqual(b"\x00\x01\x01", bw.to_array())
 
     def test_write_uint8(self):
         with serialization.BinaryWriter() as bw:
             bw.write_uint8(255)
             # this also validates signed vs unsigned. If it was signed it would need an extra \x00 to express the value
             # and would not fit in 1 byte
-            self.assertEqual(b"\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF", bw.to_array())
 
     def test_write_uint16(self):
         with serialization.BinaryWriter() as bw:
             bw.write_uint16(0xFFFF)
             # this also validates signed vs unsigned. If it was signed it would need an extra \x00 to express the value
             # and would not fit in 2 bytes
-            self.assertEqual(b"\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF", bw.to_array())
 
     def test_write_uint32(self):
         with serialization.BinaryWriter() as bw:
             bw.write_uint32(0xFFFFFFFF)
             # this also validates signed vs unsigned. If it was signed it would need an extra \x00 to express the value
             # and would not fit in 4 bytes
-            self.assertEqual(b"\xFF\xFF\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF\xFF\xFF", bw.to_array())
 
     def test_write_uint64(self):
         with serialization.BinaryWriter() as bw:
             bw.write_uint64(0xFFFFFFFFFFFFFFFF)
             # this also validates signed vs unsigned. If it was signed it would need an extra \x00 to express the value
             # and would not fit in 8 bytes
-            self.assertEqual(b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF", bw.to_array())
 
     def test_write_int16(self):
         with serialization.BinaryWriter() as bw:
             bw.write_int16(-1)
             # this also validates signed vs unsigned. If it was unsigned it would be without \x00
-            self.assertEqual(b"\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF", bw.to_array())
 
     def test_write_int32(self):
         with serialization.BinaryWriter() as bw:
             bw.write_int32(-1)
             # this also validates signed vs unsigned. If it was unsigned it would be without \x00
-            self.assertEqual(b"\xFF\xFF\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF\xFF\xFF", bw.to_array())
 
     def test_write_int64(self):
         with serialization.BinaryWriter() as bw:
             bw.write_int64(-1)
             # this also validates signed vs unsigned. If it was unsigned it would be without \x00
-            self.assertEqual(b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xFF\xFF\xFF\xFF\xFF\xFF\xFF\xFF", bw.to_array())
 
     def test_write_var_string(self):
         with serialization.BinaryWriter() as bw:
             bw.write_var_string("ABC")
-            self.assertEqual(b"\x03\x41\x42\x43", bw._stream.getvalue())
+            self.assertEqual(b"\x03\x41\x42\x43", bw.to_array())
 
     def test_write_var_int(self):
         with self.assertRaises(TypeError) as context:
@@ -322,39 +516,37 @@ class BinaryWriterTestCase(unittest.TestCase):
 
         with serialization.BinaryWriter() as bw:
             bw.write_var_int(1)
-            self.assertEqual(b"\x01", bw._stream.getvalue())
+            self.assertEqual(b"\x01", bw.to_array())
 
         with serialization.BinaryWriter() as bw:
             bw.write_var_int(65535)  # 0xFFFF edge
-            self.assertEqual(b"\xfd\xff\xFF", bw._stream.getvalue())
+            self.assertEqual(b"\xfd\xff\xFF", bw.to_array())
 
         with serialization.BinaryWriter() as bw:
             bw.write_var_int(4294967295)  # 0xFFFFFFFF edge
-            self.assertEqual(b"\xfe\xff\xff\xff\xff", bw._stream.getvalue())
+            self.assertEqual(b"\xfe\xff\xff\xff\xff", bw.to_array())
 
         with serialization.BinaryWriter() as bw:
             bw.write_var_int(4294967296)
-            self.assertEqual(
-                b"\xff\x00\x00\x00\x00\x01\x00\x00\x00", bw._stream.getvalue()
-            )
+            self.assertEqual(b"\xff\x00\x00\x00\x00\x01\x00\x00\x00", bw.to_array())
 
     def test_write_var_bytes(self):
         with serialization.BinaryWriter() as bw:
             bw.write_var_bytes(b"\x01\x02\x03\x04")
-            self.assertEqual(b"\x04\x01\x02\x03\x04", bw._stream.getvalue())
+            self.assertEqual(b"\x04\x01\x02\x03\x04", bw.to_array())
 
     def test_write_serializable(self):
         s1 = SerializableObj(1)
         with serialization.BinaryWriter() as bw:
             bw.write_serializable(s1)
-            self.assertEqual(b"\x01", bw._stream.getvalue())
+            self.assertEqual(b"\x01", bw.to_array())
 
     def test_write_list_of_serializable_objects(self):
         s1 = SerializableObj(1)
         s2 = SerializableObj(3)
         with serialization.BinaryWriter() as bw:
             bw.write_serializable_list([s1, s2])
-            self.assertEqual(b"\x02\x01\x03", bw._stream.getvalue())
+            self.assertEqual(b"\x02\x01\x03", bw.to_array())
 
     def test_length(self):
         with serialization.BinaryWriter() as br:
@@ -364,3 +556,117 @@ class BinaryWriterTestCase(unittest.TestCase):
         with serialization.BinaryWriter() as br:
             br.write_uint64(1000)
             self.assertEqual(8, len(br))
+
+    def test_size_hint(self):
+        with serialization.BinaryWriter(size_hint=8) as bw:
+            self.assertEqual(0, len(bw))
+            bw.write_uint16(1)
+            self.assertEqual(b"\x01\x00", bw.to_array())
+            # grow beyond the hint
+            bw.write_uint64(2)
+            bw.write_bytes(b"\x03")
+            self.assertEqual(11, len(bw))
+            self.assertEqual(
+                b"\x01\x00\x02\x00\x00\x00\x00\x00\x00\x00\x03", bw.to_array()
+            )
+
+    def test_getbuffer(self):
+        with serialization.BinaryWriter(size_hint=10) as bw:
+            bw.write_uint32(0x01020304)
+            with bw.getbuffer() as view:
+                self.assertIsInstance(view, memoryview)
+                self.assertEqual(b"\x04\x03\x02\x01", view)
+            bw.write_uint8(5)
+            self.assertEqual(b"\x04\x03\x02\x01\x05", bw.getbuffer())
+
+    def test_write_big_endian(self):
+        with serialization.BinaryWriter() as bw:
+            bw.write_uint16(1, endian=">")
+            bw.write_int32(-2, endian=">")
+            bw.write_var_int(0x0102, endian=">")
+            self.assertEqual(b"\x00\x01\xff\xff\xff\xfe\xfd\x01\x02", bw.to_array())
+
+    def test_serializable_to_array(self):
+        s1 = SerializableObj(7)
+        data = s1.to_array()
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(b"\x07", data)
+
+
+class StreamDeserializerTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        obj = PlannedObj()
+        obj.d = b"\x01\x02\x03"
+        obj.f = [SerializableObj(1), SerializableObj(2)]
+        self.data = obj.to_array()
+
+    def test_insufficient_data_error(self):
+        with serialization.BinaryReader(b"\x01\x02") as br:
+            with self.assertRaises(serialization.InsufficientDataError) as context:
+                br.read_uint32()
+            self.assertEqual(2, context.exception.needed)
+            self.assertIsInstance(context.exception, ValueError)
+
+    def test_feed_chunks(self):
+        parser = serialization.StreamDeserializer(PlannedObj)
+        stream = self.data * 2
+        objects = []
+        for i in range(len(stream)):
+            objects.extend(parser.feed(stream[i : i + 1]))
+            if len(objects) == 0:
+                self.assertGreater(parser.needed, 0)
+        self.assertEqual(2, len(objects))
+        for obj in objects:
+            self.assertEqual(b"\x01\x02\x03", obj.d)
+            self.assertEqual([1, 2], [o.a for o in obj.f])
+        self.assertEqual(0, parser.buffered)
+
+    def test_needed(self):
+        parser = serialization.StreamDeserializer(PlannedObj)
+        self.assertEqual(1, parser.needed)
+        # stops in the middle of the variable length field
+        self.assertEqual([], parser.feed(self.data[:9]))
+        self.assertEqual(2, parser.needed)
+        self.assertEqual([], parser.feed(self.data[9:11]))
+        objects = parser.feed(self.data[11:] + self.data[:1])
+        self.assertEqual(1, len(objects))
+        self.assertEqual(1, parser.buffered)
+
+    def test_length_prefix(self):
+        parser = serialization.StreamDeserializer(PlannedObj, length_prefix="<I")
+        frame = len(self.data).to_bytes(4, "little") + self.data
+        self.assertEqual(4, parser.needed)
+        self.assertEqual([], parser.feed(frame[:6]))
+        self.assertEqual(len(frame) - 6, parser.needed)
+        self.assertEqual(2, len(parser.feed(frame[6:] + frame)))
+
+    def test_max_size(self):
+        parser = serialization.StreamDeserializer(
+            PlannedObj, length_prefix="<I", max_size=10
+        )
+        with self.assertRaises(ValueError) as context:
+            parser.feed(len(self.data).to_bytes(4, "little"))
+        self.assertEqual(
+            f"Object size {len(self.data)} exceeds the maximum of 10",
+            str(context.exception),
+        )
+        self.assertEqual(0, parser.buffered)
+
+    def test_malformed_data(self):
+        parser = serialization.StreamDeserializer(PlannedObj)
+        # var_bytes length of 5 exceeds the field maximum of 4
+        with self.assertRaises(ValueError):
+            parser.feed(self.data[:7] + b"\x05")
+        self.assertEqual(0, parser.buffered)
+
+    def test_malformed_data_after_objects(self):
+        parser = serialization.StreamDeserializer(PlannedObj)
+        objects = parser.feed(self.data + self.data[:7] + b"\x05")
+        # objects preceding the malformed data are not lost
+        self.assertEqual(1, len(objects))
+        self.assertIsInstance(parser.error, ValueError)
+        self.assertEqual(0, parser.buffered)
+        with self.assertRaises(ValueError):
+            parser.feed(self.data)
+        self.assertIsNone(parser.error)
+        self.assertEqual(1, len(parser.feed(self.data)))
@@ -1,6 +1,7 @@
 from unittest import TestCase
+from epicchain.core.types import uint
 from epicchain.core.types.uint import _UIntBase
-from epicchain.core.types import UInt160, UInt256
+from epicchain.core.types import UInt160, UInt256, UInt256Array
 from epicchain.core import serialization
 
 
@@ -60,7 +61,12 @@ class UIntBaseTest(TestCase):
 
     def test_hash_code(self):
         x = UIntBase(data=bytearray.fromhex("1122"))
-        self.assertEqual(hash(x), 8721)
+        self.assertEqual(hash(x), hash(b"\x11\x22"))
+
+        # all bytes contribute to the hash
+        a = UInt256(b"\x01" * 4 + b"\x00" * 28)
+        b = UInt256(b"\x01" * 4 + b"\x00" * 27 + b"\x01")
+        self.assertNotEqual(hash(a), hash(b))
 
     def test_to_string(self):
         x = UIntBase(data=bytearray.fromhex("1122"))
@@ -104,6 +110,10 @@ class UIntBaseTest(TestCase):
         self.assertEqual(1, z._compare_to(x))
         # test data equal
         self.assertEqual(0, x._compare_to(xx))
+        # test difference in the least significant byte
+        self.assertEqual(
+            -1, UIntBase(data=b"\x01\x00")._compare_to(UIntBase(data=b"\x02\x00"))
+        )
 
     def test_rich_comparison_methods(self):
         x = UIntBase(data=bytearray.fromhex("1122"))
@@ -124,6 +134,30 @@ class UInt160_and_256Test(TestCase):
         uint256 = UInt256.zero()
         self.assertEqual(32, len(uint256.to_array()))
 
+        # a shared instance
+        self.assertIs(UInt160.zero(), uint160)
+        self.assertIs(UInt256.zero(), uint256)
+        self.assertEqual(UInt160(bytes(20)), uint160)
+        self.assertEqual(UInt256(bytes(32)), uint256)
+
+        with serialization.BinaryReader(bytes(range(20))) as br:
+            with self.assertRaises(ValueError) as context:
+                uint160.deserialize(br)
+        self.assertEqual(
+            "Cannot deserialize into the shared zero instance", str(context.exception)
+        )
+        self.assertEqual(bytes(20), uint160.to_array())
+
+    def test_slots(self):
+        self.assertFalse(hasattr(UInt160.zero(), "__dict__"))
+        self.assertFalse(hasattr(UInt256.zero(), "__dict__"))
+
+    def test_sorting(self):
+        values = [
+            UInt160(bytes([i % 3]) + bytes(18) + bytes([i // 3])) for i in range(9)
+        ]
+        self.assertEqual(values, sorted(reversed(values)))
+
     def test_from_string_wrong_length(self):
         with self.assertRaises(ValueError) as ctx:
             UInt160.from_string("1122")
@@ -178,18 +212,45 @@ class UInt160_and_256Test(TestCase):
             str(ctx.exception),
         )
 
+    def test_string_cache(self):
+        uint.clear_string_caches()
+        value = "0x" + "01" * 20
+        x = UInt160.from_string(value)
+        y = UInt160.from_string(value)
+        self.assertEqual(x, y)
+        self.assertIsNot(x, y)
+        self.assertEqual(value[2:], str(x))
+        self.assertEqual(value[2:], str(y))
+
+        info = uint.string_cache_info()
+        self.assertEqual(1, info["from_string"].hits)
+        self.assertEqual(1, info["from_string"].misses)
+        self.assertEqual(1, info["str"].hits)
+        self.assertEqual(1, info["str"].misses)
+
+        # invalid input is not cached
+        with self.assertRaises(ValueError):
+            UInt160.from_string("zz" * 20)
+        self.assertEqual(1, uint.string_cache_info()["from_string"].currsize)
+
+        # a cached string does not follow an instance that is deserialized into
+        x.deserialize_from_bytes(b"\x02" * 20)
+        x.deserialize(serialization.BinaryReader(b"\x02" * 20))
+        self.assertEqual("02" * 20, str(x))
+        self.assertEqual(value[2:], str(y))
+
     def test_deserialize_from_stream(self):
         data_uint160 = bytearray(20 * [0x11])
         data_uint256 = bytearray(32 * [0x11])
 
         with serialization.BinaryReader(data_uint160) as br:
             # we explicitly call deserialize, instead of br.read_uint160() for coverage
-            uint160 = UInt160.zero()
+            uint160 = UInt160._serializable_init()
             uint160.deserialize(br)
             self.assertEqual(data_uint160, uint160._data)
 
         with serialization.BinaryReader(data_uint256) as br:
-            uint256 = UInt256.zero()
+            uint256 = UInt256._serializable_init()
             uint256.deserialize(br)
             self.assertEqual(data_uint256, uint256._data)
 
@@ -201,8 +262,76 @@ class UInt160_and_256Test(TestCase):
 
         with serialization.BinaryWriter() as bw:
             bw.write_serializable(uint160)
-            self.assertEqual(data_uint160, bw._stream.getvalue())
+            self.assertEqual(data_uint160, bw.to_array())
 
         with serialization.BinaryWriter() as bw:
             bw.write_serializable(uint256)
-            self.assertEqual(data_uint256, bw._stream.getvalue())
+            self.assertEqual(data_uint256, bw.to_array())
+
+
+class UInt256ArrayTest(TestCase):
+    def setUp(self) -> None:
+        self.values = [UInt256(bytes([i]) * 32) for i in range(5)]
+        self.array = UInt256Array(self.values)
+
+    def test_sequence(self):
+        self.assertEqual(5, len(self.array))
+        self.assertEqual(self.values[1], self.array[1])
+        self.assertEqual(self.values[-1], self.array[-1])
+        self.assertEqual(self.values, list(self.array))
+        with self.assertRaises(IndexError):
+            self.array[5]
+
+    def test_slicing(self):
+        self.assertIsInstance(self.array[1:3], UInt256Array)
+        self.assertEqual(self.values[1:3], self.array[1:3])
+        self.assertEqual(self.values[::2], self.array[::2])
+        self.assertEqual(self.values[::-1], self.array[::-1])
+
+    def test_membership(self):
+        self.assertIn(self.values[3], self.array)
+        self.assertNotIn(UInt256(b"\x09" * 32), self.array)
+        self.assertNotIn(UInt160.zero(), self.array)
+        self.assertEqual(3, self.array.index(self.values[3]))
+        with self.assertRaises(ValueError):
+            self.array.index(self.values[3], 0, 3)
+
+        # the index is rebuilt after changes
+        extra = UInt256(b"\x09" * 32)
+        self.array.append(extra)
+        self.assertIn(extra, self.array)
+
+    def test_index_aligned_to_items(self):
+        # matches the value 0x0101... across the boundary of the first two items
+        array = UInt256Array.from_bytes(
+            b"\x00" * 16 + b"\x01" * 32 + b"\x00" * 16 + b"\x01" * 32
+        )
+        self.assertEqual(2, array.index(UInt256(b"\x01" * 32)))
+
+    def test_from_bytes(self):
+        self.assertEqual(self.array, UInt256Array.from_bytes(self.array.tobytes()))
+        with self.assertRaises(ValueError) as context:
+            UInt256Array.from_bytes(b"\x01" * 33)
+        self.assertIn("must be a multiple of 32", str(context.exception))
+
+    def test_serialization(self):
+        with serialization.BinaryWriter() as bw:
+            bw.write_serializable_list(self.values)
+            expected = bw.to_array()
+        with serialization.BinaryWriter() as bw:
+            bw.write_serializable_list(self.array)
+            self.assertEqual(expected, bw.to_array())
+
+        with serialization.BinaryReader(expected) as br:
+            self.assertEqual(self.array, UInt256Array.deserialize_from(br))
+        with serialization.BinaryReader(expected) as br:
+            self.assertEqual(
+                self.values, UInt256Array.deserialize_from(br, max=len(self.values))
+            )
+        with serialization.BinaryReader(expected) as br:
+            with self.assertRaises(ValueError) as context:
+                UInt256Array.deserialize_from(br, max=2)
+        self.assertEqual(
+            f"Item count {len(self.values)} exceeds the maximum of 2",
+            str(context.exception),
+        )
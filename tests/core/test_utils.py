@@ -25,6 +25,7 @@ class VarSizeTestCase(unittest.TestCase):
         self.assertEqual(3, utils.get_var_size(0xFD))
         self.assertEqual(3, utils.get_var_size(0xFFFF))
         self.assertEqual(5, utils.get_var_size(0xFFFF + 1))
+        self.assertEqual(9, utils.get_var_size(0xFFFFFFFF + 1))
 
     def test_varsize_string(self):
         input = "abc"
@@ -72,6 +73,18 @@ class VarSizeTestCase(unittest.TestCase):
             utils.get_var_size(object())
         self.assertIn("NOT SUPPORTED", str(context.exception))
 
+    def test_subclasses_of_supported_types(self):
+        self.assertEqual(1, utils.get_var_size(DummyEnum.DEFAULT))
+        self.assertEqual(1 + 2, utils.get_var_size(bytearray(2)))
+        self.assertEqual(1 + 2, utils.get_var_size((DummyEnum.DEFAULT,) * 2))
+
+        class DummyStr(str):
+            pass
+
+        # resolved once and served from the dispatch table afterwards
+        for _ in range(2):
+            self.assertEqual(1 + 3, utils.get_var_size(DummyStr("abc")))
+
 
 class ScriptHashTestCase(unittest.TestCase):
     def test_to_script_hash(self):
@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+from epicchain.core import varint
+
+# (value, encoded) pairs covering the edges of every encoding width
+VECTORS = [
+    (0, b"\x00"),
+    (0xFC, b"\xfc"),
+    (0xFD, b"\xfd\xfd\x00"),
+    (0xFFFF, b"\xfd\xff\xff"),
+    (0x10000, b"\xfe\x00\x00\x01\x00"),
+    (0xFFFFFFFF, b"\xfe\xff\xff\xff\xff"),
+    (0x100000000, b"\xff\x00\x00\x00\x00\x01\x00\x00\x00"),
+    (varint.MAX_VALUE, b"\xff" * 9),
+]
+
+
+class VarIntTestCase(unittest.TestCase):
+    def test_encode(self):
+        for value, encoded in VECTORS:
+            self.assertEqual(encoded, varint.encode(value))
+            self.assertEqual(len(encoded), varint.size(value))
+
+    def test_encode_invalid(self):
+        with self.assertRaises(TypeError) as context:
+            varint.encode(b"\x01")
+        self.assertIn("not int type.", str(context.exception))
+
+        with self.assertRaises(TypeError):
+            varint.encode(300.0)
+
+        with self.assertRaises(ValueError) as context:
+            varint.encode(-1)
+        self.assertEqual("-1 too small.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            varint.encode(varint.MAX_VALUE + 1)
+        self.assertIn("too large.", str(context.exception))
+
+    def test_decode(self):
+        for value, encoded in VECTORS:
+            self.assertEqual((value, len(encoded)), varint.decode(encoded))
+            self.assertEqual(
+                (value, len(encoded) + 1), varint.decode(b"\x01" + encoded, 1)
+            )
+
+        with self.assertRaises(IndexError):
+            varint.decode(b"")
+        with self.assertRaises(Exception):
+            varint.decode(b"\xfe\x01\x02")
+
+    def test_many(self):
+        values = [value for value, _ in VECTORS]
+        encoded = b"".join(e for _, e in VECTORS)
+        self.assertEqual(len(encoded), varint.size_many(values))
+        self.assertEqual(encoded, varint.encode_many(values))
+        self.assertEqual(
+            (values, len(encoded)), varint.decode_many(encoded, len(values))
+        )
+        self.assertEqual(b"", varint.encode_many([]))
+        self.assertEqual(([], 0), varint.decode_many(b"", 0))
+
+    def test_many_single_byte(self):
+        values = list(range(0xFD)) * 3
+        encoded = varint.encode_many(values)
+        self.assertEqual(bytes(values), encoded)
+        self.assertEqual(
+            (values, len(values) + 2),
+            varint.decode_many(b"\x00\x00" + encoded, len(values), 2),
+        )
+
+    def test_encode_many_large(self):
+        # large enough to take the NumPy path when it is installed
+        values = [value for value, _ in VECTORS] * 100
+        expected = b"".join(map(varint.encode, values))
+        self.assertEqual(expected, varint.encode_many(values))
+        with mock.patch.object(varint, "np", None):
+            self.assertEqual(expected, varint.encode_many(values))
+
+        with self.assertRaises(ValueError):
+            varint.encode_many(values + [-1])
+        with self.assertRaises(TypeError):
+            varint.encode_many(values + [b"\x01"])
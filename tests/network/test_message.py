@@ -103,6 +103,59 @@ class NetworkMessageTestCase(unittest.TestCase):
             self.assertEqual(m.type, message.MessageType.INV)
             self.assertEqual(m.payload.type, inventory.InventoryType.BLOCK)
 
+    def test_deserialization_from_chunks(self):
+        # see test_create_compressed_inv_message() how it was obtained
+        compressed = binascii.unhexlify(b"012711820000003F2C0400010067500000000000")
+        ping = message.Message(message.MessageType.PING).to_array()
+        stream = compressed + ping + compressed
+
+        parser = serialization.StreamDeserializer(message.Message)
+        self.assertEqual([], parser.feed(stream[:4]))
+        # the frame header announces the payload length
+        self.assertEqual(len(compressed) - 4, parser.needed)
+        messages = parser.feed(stream[4:-1])
+        self.assertEqual(
+            [message.MessageType.INV, message.MessageType.PING],
+            [m.type for m in messages],
+        )
+        self.assertEqual(1, parser.needed)
+        (m,) = parser.feed(stream[-1:])
+        self.assertEqual(inventory.InventoryType.BLOCK, m.payload.type)
+        self.assertEqual(0, parser.buffered)
+
+    def test_deserialization_from_chunks_skips_malformed_frame(self):
+        ping = message.Message(message.MessageType.PING).to_array()
+        # INV payload announcing 1 hash without providing it
+        bad = b"\x00\x27\x02\x2c\x01"
+        errors = []
+        parser = serialization.StreamDeserializer(
+            message.Message,
+            frame_size=message.Message.read_frame_size,
+            on_error=errors.append,
+        )
+        self.assertEqual([], parser.feed(bad[:3]))
+        # the frame header announces the payload length
+        self.assertEqual(2, parser.needed)
+        messages = parser.feed(bad[3:] + ping + bad + ping)
+        self.assertEqual(2, len(messages))
+        self.assertEqual(2, len(errors))
+        self.assertIsInstance(errors[0], ValueError)
+        self.assertEqual(0, parser.buffered)
+
+        # without an error handler the stream is malformed
+        parser = serialization.StreamDeserializer(
+            message.Message, frame_size=message.Message.read_frame_size
+        )
+        with self.assertRaises(ValueError):
+            parser.feed(bad + ping)
+        self.assertEqual(0, parser.buffered)
+
+    def test_deserialization_with_truncated_payload(self):
+        # INV payload announcing 1 hash without providing it
+        with self.assertRaises(ValueError) as context:
+            message.Message.deserialize_from_bytes(b"\x00\x27\x02\x2c\x01")
+        self.assertNotIsInstance(context.exception, serialization.InsufficientDataError)
+
     def test_deserialization_with_unsupported_payload_type(self):
         hashes = [UInt256.zero()]
         inv_payload = inventory.InventoryPayload(inventory.InventoryType.BLOCK, hashes)
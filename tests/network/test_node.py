@@ -9,6 +9,7 @@ from epicchain.network.payloads import (
     address,
     block,
     empty,
+    filter,
     inventory,
     ping,
     transaction,
@@ -16,7 +17,7 @@ from epicchain.network.payloads import (
 from copy import deepcopy
 from epicchain import network_logger
 from epicchain.settings import settings
-from epicchain.core import types
+from epicchain.core import types, cryptography as crypto
 from unittest import mock, IsolatedAsyncioTestCase
 from tests import helpers as test_helpers
 import platform
@@ -396,6 +397,125 @@ class EpicChainNodeTestCase(IsolatedAsyncioTestCase):
         self.assertIsInstance(m.payload, inventory.InventoryPayload)
         self.assertEqual(tx.hash(), m.payload.hashes[0])
 
+    async def test_bloom_filter(self):
+        # taken from the Transaction testcase in `test_payloads.py`
+        raw_tx = bytes.fromhex(
+            "007B000000C8010000000000001503000000000000010000000154A64CAC1B1073E662933EF3E30B007CD98D67D7000002010201000155"
+        )
+        tx = transaction.Transaction.deserialize_from_bytes(raw_tx)
+        b = block.Block._serializable_init()
+        b.transactions = [tx]
+        b.rebuild_merkle_root()
+
+        n = node.EpicChainNode(object(), object())
+        n.send_message = mock.AsyncMock()
+
+        bf = crypto.BloomFilter(m=64, k=3, ntweak=1)
+        n.handler_filterload(
+            message.Message(
+                msg_type=message.MessageType.FILTERLOAD,
+                payload=filter.FilterLoadPayload(bf),
+            )
+        )
+        await n.send_block(b)
+        m = n.send_message.call_args[0][0]  # type: message.Message
+        self.assertEqual(message.MessageType.MERKLEBLOCK, m.type)
+        self.assertEqual(b"\x00", m.payload.flags)
+
+        # matching on the signer account
+        n.handler_filteradd(
+            message.Message(
+                msg_type=message.MessageType.FILTERADD,
+                payload=filter.FilterAddPayload(tx.signers[0].account.to_array()),
+            )
+        )
+        await n.send_block(b)
+        m = n.send_message.call_args[0][0]  # type: message.Message
+        self.assertEqual(message.MessageType.MERKLEBLOCK, m.type)
+        self.assertEqual(b"\x01", m.payload.flags)
+        self.assertEqual(b.header, m.payload.header)
+
+        n.handler_filterclear(message.Message(msg_type=message.MessageType.FILTERCLEAR))
+        self.assertIsNone(n.bloom_filter)
+        await n.send_block(b)
+        m = n.send_message.call_args[0][0]  # type: message.Message
+        self.assertEqual(message.MessageType.BLOCK, m.type)
+
+    def test_bloom_filter_invalid(self):
+        n = node.EpicChainNode(object(), object())
+        payload = filter.FilterLoadPayload(crypto.BloomFilter(m=64, k=3, ntweak=1))
+        load = message.Message(msg_type=message.MessageType.FILTERLOAD, payload=payload)
+
+        payload.filter = b""
+        n.handler_filterload(load)
+        self.assertIsNone(n.bloom_filter)
+
+        payload.filter = b"\x00" * (filter.FilterLoadPayload.MAX_FILTER_SIZE + 1)
+        n.handler_filterload(load)
+        self.assertIsNone(n.bloom_filter)
+
+        payload.filter = b"\x00" * 8
+        payload.K = filter.FilterLoadPayload.MAX_K + 1
+        n.handler_filterload(load)
+        self.assertIsNone(n.bloom_filter)
+
+        payload.K = 3
+        n.handler_filterload(load)
+        self.assertIsNotNone(n.bloom_filter)
+
+    def test_bloom_filter_matches_tx_hash(self):
+        raw_tx = bytes.fromhex(
+            "007B000000C8010000000000001503000000000000010000000154A64CAC1B1073E662933EF3E30B007CD98D67D7000002010201000155"
+        )
+        tx = transaction.Transaction.deserialize_from_bytes(raw_tx)
+        b = block.Block._serializable_init()
+        b.transactions = [tx]
+        b.rebuild_merkle_root()
+        bf = crypto.BloomFilter(m=64, k=3, ntweak=1)
+        bf.add(tx.hash().to_array())
+
+        payload = block.MerkleBlockPayload.from_filter(b, bf)
+        self.assertEqual(b"\x01", payload.flags)
+        # survives the network round trip
+        m = message.Message(msg_type=message.MessageType.MERKLEBLOCK, payload=payload)
+        m2 = message.Message.deserialize_from_bytes(m.to_array())
+        self.assertIsInstance(m2.payload, block.MerkleBlockPayload)
+        self.assertEqual(payload.flags, m2.payload.flags)
+
+    def test_merkleblock_multiple_transactions(self):
+        raw_tx = bytes.fromhex(
+            "007B000000C8010000000000001503000000000000010000000154A64CAC1B1073E662933EF3E30B007CD98D67D7000002010201000155"
+        )
+        bf = crypto.BloomFilter(m=64, k=3, ntweak=1)
+        # tx counts that are not a power of two pad the Merkle tree with duplicates
+        for tx_count in (3, 5):
+            txs = []
+            for i in range(tx_count):
+                tx = transaction.Transaction.deserialize_from_bytes(raw_tx)
+                tx.nonce = i
+                txs.append(tx)
+            b = block.Block._serializable_init()
+            b.transactions = txs
+            b.rebuild_merkle_root()
+            bf.add(txs[1].hash().to_array())
+
+            payload = block.MerkleBlockPayload.from_filter(b, bf)
+            self.assertEqual(tx_count, payload.tx_count)
+            self.assertEqual([tx.hash() for tx in txs], payload.hashes)
+
+            m = message.Message(
+                msg_type=message.MessageType.MERKLEBLOCK, payload=payload
+            )
+            m2 = message.Message.deserialize_from_bytes(m.to_array())
+            self.assertIsInstance(m2.payload, block.MerkleBlockPayload)
+            self.assertEqual(tx_count, m2.payload.tx_count)
+            self.assertEqual(payload.hashes, m2.payload.hashes)
+            self.assertEqual(payload.flags, m2.payload.flags)
+            self.assertEqual(b"\x02", m2.payload.flags)
+            self.assertEqual(
+                b.header.merkle_root, crypto.MerkleTree.compute_root(m2.payload.hashes)
+            )
+
     async def test_processing_messages(self):
         m_addr = message.Message(
             msg_type=message.MessageType.ADDR, payload=address.AddrPayload([])
@@ -478,6 +598,57 @@ class EpicChainNodeTestCase(IsolatedAsyncioTestCase):
         r.close()
         w.close()
 
+    def _node_reading(self, *chunks):
+        reader = mock.Mock(spec=asyncio.StreamReader)
+        reader.read = mock.AsyncMock(side_effect=list(chunks))
+        return node.EpicChainNode(reader, object())
+
+    async def test_read_message_split_across_chunks(self):
+        data = self.m_version.to_array()
+        n = self._node_reading(data[:3], data[3:10], data[10:])
+        m = await n.read_message(timeout=1)
+        self.assertEqual(message.MessageType.VERSION, m.type)
+        self.assertEqual("epicchain-MOCK-CLIENT", m.payload.user_agent)
+        self.assertEqual(3, n.reader.read.call_count)
+
+    async def test_read_message_multiple_in_chunk(self):
+        n = self._node_reading(
+            self.m_version.to_array() + self.m_verack.to_array(), b""
+        )
+        m = await n.read_message(timeout=1)
+        self.assertEqual(message.MessageType.VERSION, m.type)
+        m = await n.read_message(timeout=1)
+        self.assertEqual(message.MessageType.VERACK, m.type)
+        self.assertEqual(1, n.reader.read.call_count)
+        self.assertIsNone(await n.read_message(timeout=1))
+        self.assertTrue(n.disconnecting)
+
+    async def test_read_message_malformed(self):
+        # INV payload announcing 1 hash without providing it
+        bad_payload = b"\x00\x27\x02\x2c\x01"
+        n = self._node_reading(
+            self.m_version.to_array() + bad_payload + self.m_verack.to_array()
+        )
+        with self.assertLogs(network_logger, "DEBUG") as log_context:
+            m = await n.read_message(timeout=1)
+            self.assertEqual(message.MessageType.VERSION, m.type)
+            m = await n.read_message(timeout=1)
+            self.assertEqual(message.MessageType.VERACK, m.type)
+        self.assertIn("Failed to deserialize message", log_context.output[0])
+        self.assertFalse(n.disconnecting)
+
+        # a frame exceeding the maximum payload size cannot be skipped
+        bad_frame = b"\x00\x27\xfe" + (
+            message.Message.PAYLOAD_MAX_SIZE + 1
+        ).to_bytes(4, "little")
+        n = self._node_reading(self.m_version.to_array() + bad_frame)
+        m = await n.read_message(timeout=1)
+        self.assertEqual(message.MessageType.VERSION, m.type)
+        with self.assertLogs(network_logger, "DEBUG"):
+            self.assertIsNone(await n.read_message(timeout=1))
+        self.assertTrue(n.disconnecting)
+        self.assertEqual(1, n.reader.read.call_count)
+
     def test_utility_function(self):
         with self.assertRaises(ValueError) as context:
             node.encode_base62(-100)
@@ -2,6 +2,7 @@ import unittest
 import binascii
 import enum
 from copy import deepcopy
+from unittest.mock import patch
 from bitarray import bitarray
 from epicchain.network import capabilities
 from epicchain.network.payloads import (
@@ -241,6 +242,23 @@ class BlockTestCase(unittest.TestCase):
         expected_len = 168
         self.assertEqual(expected_len, len(self.block))
 
+        b = block.Block.deserialize_from_bytes(self.block.to_array())
+        with patch.object(transaction.Transaction, "_compute_size") as compute_size:
+            self.assertEqual(expected_len, len(b))
+            compute_size.assert_not_called()
+        b.transactions = []
+        self.assertEqual(expected_len - len(self.tx), len(b))
+
+        # changing the header witness or replacing a transaction in place discards the cached size as well
+        b = block.Block.deserialize_from_bytes(self.block.to_array())
+        b.header.witness.invocation_script = b"\x01\x02"
+        self.assertEqual(expected_len + 2, len(b))
+        b = block.Block.deserialize_from_bytes(self.block.to_array())
+        tx = deepcopy(self.tx)
+        tx.script = b"\x01\x02"
+        b.transactions[0] = tx
+        self.assertEqual(expected_len + 1, len(b))
+
     def test_equals(self):
         self.assertFalse(None == self.block)
         self.assertFalse(self.block == object())
@@ -298,6 +316,23 @@ class BlockTestCase(unittest.TestCase):
             "Deserialization error - merkle root mismatch", str(context.exception)
         )
 
+    def test_rebuild_merkle_root_from_accumulator(self):
+        block_copy = deepcopy(self.block)
+        block_copy.header.merkle_root = types.UInt256.zero()
+        accumulator = crypto.MerkleAccumulator()
+        for tx in block_copy.transactions:
+            accumulator.append(tx.hash())
+        block_copy.rebuild_merkle_root(accumulator)
+        self.assertEqual(self.block.header.merkle_root, block_copy.header.merkle_root)
+
+        accumulator.append(types.UInt256.zero())
+        with self.assertRaises(ValueError) as context:
+            block_copy.rebuild_merkle_root(accumulator)
+        self.assertIn(
+            "Accumulator holds 2 hashes, block has 1 transactions",
+            str(context.exception),
+        )
+
     def test_inventory_type(self):
         self.assertEqual(inventory.InventoryType.BLOCK, self.block.inventory_type)
 
@@ -319,6 +354,17 @@ class BlockTestCase(unittest.TestCase):
         self.assertEqual(trimmed_block.header, deserialized_trimmed_block.header)
         self.assertEqual(trimmed_block.hashes, deserialized_trimmed_block.hashes)
         self.assertEqual(1, len(deserialized_trimmed_block.hashes))
+        self.assertIsInstance(deserialized_trimmed_block.hashes, types.UInt256Array)
+
+        # the hash count is limited to 0xFFFF
+        data = (
+            trimmed_block.header.to_array() + b"\xfe" + (0x10000).to_bytes(4, "little")
+        )
+        with self.assertRaises(ValueError) as context:
+            block.TrimmedBlock.deserialize_from_bytes(data)
+        self.assertIn(
+            "Item count 65536 exceeds the maximum of 65535", str(context.exception)
+        )
 
 
 class SignerTestCase(unittest.TestCase):
@@ -653,6 +699,21 @@ class HeaderTestCase(unittest.TestCase):
         )
         self.assertEqual(expected_data, self.header.to_array())
 
+    def test_hash_cached(self):
+        header = block.Header.deserialize_from_bytes(self.header.to_array())
+        h = header.hash()
+        with patch.object(header, "_compute_hash") as compute_hash:
+            self.assertIs(h, header.hash())
+            compute_hash.assert_not_called()
+
+        # assigning an unsigned field discards the cached hash, the witness is not part of it
+        header.witness = verification.Witness(b"", b"")
+        self.assertIs(h, header.hash())
+        header.index = 124
+        self.assertNotEqual(h, header.hash())
+        header.index = 123
+        self.assertEqual(h, header.hash())
+
     def test_deserialization(self):
         # if the serialization() test for this class passes, we can use that as a reference to test deserialization against
         deserialized_header = block.Header.deserialize_from_bytes(
@@ -826,6 +887,13 @@ class InventoryPayloadTestCase(unittest.TestCase):
         )
         self.assertEqual(expected_data, self.inv.to_array())
 
+    def test_hashes_array(self):
+        inv = inventory.InventoryPayload(
+            inventory.InventoryType.BLOCK, types.UInt256Array([self.u1, self.u2])
+        )
+        self.assertEqual(len(self.inv), len(inv))
+        self.assertEqual(self.inv.to_array(), inv.to_array())
+
     def test_deserialization(self):
         # if the serialization() test for this class passes, we can use that as a reference to test deserialization against
         deserialized_inv_payload = inventory.InventoryPayload.deserialize_from_bytes(
@@ -834,6 +902,7 @@ class InventoryPayloadTestCase(unittest.TestCase):
         self.assertEqual(self.inv.type, deserialized_inv_payload.type)
         self.assertEqual(len(self.inv.hashes), len(deserialized_inv_payload.hashes))
         self.assertEqual(self.inv.hashes[0], deserialized_inv_payload.hashes[0])
+        self.assertIsInstance(deserialized_inv_payload.hashes, types.UInt256Array)
 
 
 class MerkleBlockPayloadTestCase(unittest.TestCase):
@@ -1143,6 +1212,95 @@ class TransactionTestCase(unittest.TestCase):
         self.assertEqual(expected_len, len(self.tx))
         self.assertEqual(expected_hash, self.tx.hash())
 
+    def test_len_cached_after_deserialization(self):
+        tx = transaction.Transaction.deserialize_from_bytes(self.tx.to_array())
+        with patch.object(tx, "_compute_size") as compute_size:
+            self.assertEqual(55, len(tx))
+            compute_size.assert_not_called()
+
+        # replacing or growing a sized attribute discards the cached size
+        tx.script = b"\x01\x02\x03"
+        self.assertEqual(56, len(tx))
+        tx.witnesses.append(
+            verification.Witness(invocation_script=b"", verification_script=b"\x55")
+        )
+        self.assertEqual(59, len(tx))
+
+        # a new script can be allocated at the address of a freed one, which must not revive the cached size
+        for i in range(1000):
+            tx = transaction.Transaction.deserialize_from_bytes(self.tx.to_array())
+            tx.script = b""
+            tx.script = bytes(bytearray(i % 3 + 4))
+            self.assertEqual(53 + len(tx.script), len(tx))
+
+        # so does changing or replacing a nested object
+        tx = transaction.Transaction.deserialize_from_bytes(self.tx.to_array())
+        tx.witnesses[0].invocation_script = b"\x01"
+        self.assertEqual(56, len(tx))
+        tx.witnesses[0] = verification.Witness(
+            invocation_script=b"", verification_script=b"\x55\x55"
+        )
+        self.assertEqual(56, len(tx))
+        tx.signers[0] = verification.Signer(
+            types.UInt160.zero(), verification.WitnessScope.CUSTOM_CONTRACTS
+        )
+        self.assertEqual(57, len(tx))
+
+    def test_hash_cached(self):
+        tx = transaction.Transaction.deserialize_from_bytes(self.tx.to_array())
+        h = tx.hash()
+        with patch.object(tx, "_compute_hash") as compute_hash:
+            self.assertIs(h, tx.hash())
+            # equality and set membership use the cached hash as well
+            self.assertEqual(tx, tx)
+            self.assertEqual(1, len({tx, tx}))
+            compute_hash.assert_not_called()
+
+        # witnesses are not part of the hash
+        tx.witnesses = []
+        self.assertIs(h, tx.hash())
+
+        # replacing or growing an unsigned field discards the cached hash
+        tx.nonce = 124
+        h2 = tx.hash()
+        self.assertNotEqual(h, h2)
+        tx.signers.append(
+            verification.Signer(types.UInt160.zero(), verification.WitnessScope.NONE)
+        )
+        h3 = tx.hash()
+        self.assertNotEqual(h2, h3)
+
+        # so does assigning a field of a signer
+        tx.signers[1].scope = verification.WitnessScope.CUSTOM_CONTRACTS
+        h4 = tx.hash()
+        self.assertNotEqual(h3, h4)
+        tx.signers[1].allowed_contracts.append(types.UInt160.zero())
+        self.assertNotEqual(h4, tx.hash())
+
+    def test_hash_cached_replaced_elements(self):
+        tx = transaction.Transaction.deserialize_from_bytes(self.tx.to_array())
+        h = tx.hash()
+        signer = verification.Signer(
+            types.UInt160(b"\x01" * 20), verification.WitnessScope.GLOBAL
+        )
+        tx.signers[0] = signer
+        expected = transaction.Transaction.deserialize_from_bytes(tx.to_array())
+        self.assertNotEqual(h, tx.hash())
+        self.assertEqual(expected.hash(), tx.hash())
+
+        tx.attributes.append(transaction.HighPriorityAttribute())
+        h = tx.hash()
+        tx.attributes[0] = transaction.OracleResponse(
+            1, transaction.OracleResponseCode.SUCCESS, b"\x01"
+        )
+        expected = transaction.Transaction.deserialize_from_bytes(tx.to_array())
+        self.assertNotEqual(h, tx.hash())
+        self.assertEqual(expected.hash(), tx.hash())
+
+        h = tx.hash()
+        tx.attributes[0].result = b"\x02"
+        self.assertNotEqual(h, tx.hash())
+
     def test_serialization(self):
         # captured from C#, see setUpClass() for the capture code
         expected_data = binascii.unhexlify(
@@ -106,6 +106,47 @@ class ScriptBuilderTestCase(unittest.TestCase):
             "Input number exceeds maximum data size of 32 bytes", str(context.exception)
         )
 
+    def test_emit_push_number_boundaries(self):
+        # the operand width is the minimal two's complement size, sign extended to the opcode width
+        cases = [
+            (17, "0011"),
+            (-2, "00fe"),
+            (127, "007f"),
+            (128, "018000"),
+            (-128, "0080"),
+            (-129, "017fff"),
+            (-32769, "02ff7fffff"),
+            (2**31, "030000008000000000"),
+            (-(2**255), "05" + "00" * 31 + "80"),
+            (2**255 - 1, "05" + "ff" * 31 + "7f"),
+        ]
+        for value, expected in cases:
+            self.assertEqual(
+                expected, vm.ScriptBuilder().emit_push(value).to_array().hex()
+            )
+            self.assertEqual(
+                expected,
+                vm.ScriptBuilder().emit_push(types.BigInteger(value)).to_array().hex(),
+            )
+
+        with self.assertRaises(ValueError):
+            vm.ScriptBuilder().emit_push(2**255)
+        with self.assertRaises(ValueError):
+            vm.ScriptBuilder().emit_push(-(2**255) - 1)
+
+    def test_emit_push_subclasses(self):
+        class MyStr(str):
+            pass
+
+        class MyInt(int):
+            pass
+
+        sb = vm.ScriptBuilder()
+        sb.emit_push(MyStr("a"))
+        sb.emit_push(MyInt(300))
+        sb.emit_push((1, 2))
+        self.assertEqual("0c0161012c01121112c0", sb.to_array().hex())
+
     def test_emit_push_bytes(self):
         sb = vm.ScriptBuilder()
         sb.emit_push(b"\x01")
@@ -259,6 +300,44 @@ class ScriptBuilderTestCase(unittest.TestCase):
         expected = "0c14cf76e28bd0062c4a478ee35561011319f3cfa4d211c0150c0962616c616e63654f660c14f563ea40bc283d4d0e05c48ea305b3f2a07340ef41627d5b52"
         self.assertEqual(expected, sb.to_array().hex())
 
+    def test_emit_contract_call_template_cache(self):
+        vm.clear_contract_call_cache()
+        sh = types.UInt160.from_string("0x" + "ab" * 20)
+
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call_with_args(sh, "transfer", [1, 2])
+        sb.emit_contract_call_with_args(sh, "transfer", [3, 4])
+        info = vm.contract_call_cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.hits)
+
+        # the arguments are spliced in front of the shared template
+        expected = vm.ScriptBuilder()
+        for args in ([1, 2], [3, 4]):
+            for arg in reversed(args):
+                expected.emit_push(arg)
+            expected.emit_push(len(args))
+            expected.emit(vm.OpCode.PACK)
+            expected.emit_push(callflags.CallFlags.ALL)
+            expected.emit_push("transfer")
+            expected.emit_push(sh)
+            expected.emit_syscall(vm.Syscalls.SYSTEM_CONTRACT_CALL)
+        self.assertEqual(expected.to_array(), sb.to_array())
+
+        # arity, call flags and packing are part of the template
+        sb.emit_contract_call_with_args(sh, "transfer", [1, 2, 3])
+        sb.emit_contract_call_with_args(
+            sh, "transfer", [1, 2], callflags.CallFlags.READ_ONLY
+        )
+        sb.emit_contract_call_with_args(sh, "transfer", 1)
+        self.assertEqual(4, vm.contract_call_cache_info().misses)
+        # shares the suffix of the call with a single unpacked argument
+        sb.emit_contract_call(sh, "transfer")
+        self.assertEqual(4, vm.contract_call_cache_info().misses)
+
+        vm.clear_contract_call_cache()
+        self.assertEqual(0, vm.contract_call_cache_info().currsize)
+
 
 class SyscallsTestCase(unittest.TestCase):
     def test_find_by_name(self):
@@ -276,6 +355,21 @@ class SyscallsTestCase(unittest.TestCase):
     def test_all(self):
         self.assertEqual(36, len(list(vm.Syscalls.all())))
 
+    def test_mappings(self):
+        by_number = vm.Syscalls.by_number()
+        by_name = vm.Syscalls.by_name()
+        self.assertEqual(36, len(by_number))
+        self.assertEqual(36, len(by_name))
+        for syscall in vm.Syscalls.all():
+            self.assertIs(syscall, by_number[syscall.number])
+            self.assertIs(syscall, by_name[syscall.name])
+            self.assertIs(syscall, vm.Syscalls.get_by_number(syscall.number))
+            self.assertIs(syscall, vm.Syscalls.get_by_name(syscall.name))
+
+        # read-only
+        with self.assertRaises(TypeError):
+            by_name["fake"] = vm.Syscalls.SYSTEM_CONTRACT_CALL  # type: ignore
+
     def test_equality(self):
         # allow to compare against ints (should match the syscall number)
         burn_xpp_number = 3163314883
@@ -306,3 +400,99 @@ class SyscallsTestCase(unittest.TestCase):
         )
 
         self.assertNotEqual(vm.Syscalls.SYSTEM_RUNTIME_BURN_XPP, None)
+
+
+class InstructionTestCase(unittest.TestCase):
+    def test_iter_instructions(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_push(-300)
+        sb.emit_push(b"\x01\x02")
+        sb.emit_syscall(vm.Syscalls.SYSTEM_RUNTIME_GET_TIME)
+        sb.emit(vm.OpCode.RET)
+        script = sb.to_array()
+
+        instructions = list(vm.iter_instructions(script))
+        self.assertEqual(
+            [
+                vm.OpCode.PUSHINT16,
+                vm.OpCode.PUSHDATA1,
+                vm.OpCode.SYSCALL,
+                vm.OpCode.RET,
+            ],
+            [i.opcode for i in instructions],
+        )
+        self.assertEqual([0, 3, 7, 12], [i.offset for i in instructions])
+        self.assertEqual([3, 4, 5, 1], [i.size for i in instructions])
+        self.assertEqual(b"\x01\x02", instructions[1].operand)
+        self.assertIsInstance(instructions[1].operand, memoryview)
+        self.assertEqual(vm.Syscalls.SYSTEM_RUNTIME_GET_TIME, instructions[2].syscall)
+        self.assertIsNone(instructions[3].syscall)
+
+        # start decoding at an offset
+        instructions = list(vm.iter_instructions(script, 7))
+        self.assertEqual(2, len(instructions))
+        self.assertEqual(7, instructions[0].offset)
+
+    def test_iter_instructions_invalid(self):
+        with self.assertRaises(ValueError) as context:
+            list(vm.iter_instructions(b"\x10\xff"))
+        self.assertEqual("Invalid opcode 0xff at 1", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            list(vm.iter_instructions(vm.OpCode.PUSHDATA1 + b"\x05\x01"))
+        self.assertEqual(
+            "Operand of PUSHDATA1 at 0 exceeds the script", str(context.exception)
+        )
+
+        # length prefix itself is truncated
+        with self.assertRaises(ValueError):
+            list(vm.iter_instructions(vm.OpCode.PUSHDATA2 + b"\x05"))
+
+        # decoding is lazy, valid instructions before the fault are produced
+        instructions = vm.iter_instructions(b"\x10\xff")
+        self.assertEqual(vm.OpCode.PUSH0, next(instructions).opcode)
+
+    def test_jump_targets(self):
+        script = (
+            vm.OpCode.TRY
+            + b"\x07\x00"
+            + vm.OpCode.JMP
+            + b"\x04"
+            + vm.OpCode.JMP_L
+            + (-5).to_bytes(4, "little", signed=True)
+            + vm.OpCode.ENDTRY
+            + b"\x02"
+            + vm.OpCode.RET
+        )
+        instructions = list(vm.iter_instructions(script))
+        self.assertEqual((7, None), instructions[0].try_targets)
+        self.assertIsNone(instructions[0].jump_target)
+        self.assertEqual(7, instructions[1].jump_target)
+        self.assertEqual(0, instructions[2].jump_target)
+        self.assertEqual(12, instructions[3].jump_target)
+        self.assertEqual((None, None), instructions[1].try_targets)
+        self.assertIsNone(instructions[4].jump_target)
+
+    def test_disassemble(self):
+        sb = vm.ScriptBuilder()
+        sb.emit_contract_call(types.UInt160.zero(), "symbol")
+        expected = (
+            "0000 NEWARRAY0\n"
+            "0001 PUSH15\n"
+            "0002 PUSHDATA1 73796d626f6c\n"
+            "0010 PUSHDATA1 0000000000000000000000000000000000000000\n"
+            "0032 SYSCALL System.Contract.Call"
+        )
+        self.assertEqual(expected, vm.disassemble(sb.to_array()))
+
+        script = (
+            vm.OpCode.TRY
+            + b"\x00\x05"
+            + vm.OpCode.PUSHINT8
+            + b"\xff"
+            + vm.OpCode.SYSCALL
+            + b"\x01\x02\x03\x04"
+        )
+        expected = "0000 TRY -, 5\n0003 PUSHINT8 -1\n0005 SYSCALL 01020304"
+        self.assertEqual(expected, vm.disassemble(script))
+        self.assertEqual("", vm.disassemble(b""))
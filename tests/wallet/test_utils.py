@@ -0,0 +1,76 @@
+import unittest
+
+from epicchain.core import types, cryptography, hashing
+from epicchain.contracts import utils as contractutils
+from epicchain.wallet import utils
+
+
+class AddressConversionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        utils.clear_address_caches()
+
+    def test_round_trip(self):
+        script_hash = types.UInt160.from_string(
+            "18f13748e08d53c9a164227e1a3e8d8d9e78193e"
+        )
+        address = "NRaKbRA5JAEJtfUgJJZzmeDnKvP3pJwKp1"
+        for _ in range(2):
+            self.assertEqual(address, utils.script_hash_to_address(script_hash))
+            self.assertEqual(script_hash, utils.address_to_script_hash(address))
+
+        info = utils.address_cache_info()
+        self.assertEqual(1, info["script_hash_to_address"].hits)
+        self.assertEqual(1, info["script_hash_to_address"].misses)
+        self.assertEqual(1, info["address_to_script_hash"].hits)
+        self.assertEqual(1, info["address_to_script_hash"].misses)
+
+    def test_address_version(self):
+        script_hash = types.UInt160.zero()
+        self.assertNotEqual(
+            utils.script_hash_to_address(script_hash),
+            utils.script_hash_to_address(script_hash, address_version=0x17),
+        )
+
+    def test_invalid_address_not_cached(self):
+        address = utils.script_hash_to_address(types.UInt160.zero(), 0x17)
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                utils.address_to_script_hash(address)
+        self.assertEqual(
+            0, utils.address_cache_info()["address_to_script_hash"].currsize
+        )
+
+
+class PublicKeyConversionTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        utils.clear_address_caches()
+        self.public_keys = [
+            cryptography.KeyPair(bytes([i]) * 32).public_key for i in range(1, 4)
+        ]
+
+    def test_public_key_to_script_hash(self):
+        public_key = self.public_keys[0]
+        expected = types.UInt160(
+            hashing.hash160(contractutils.create_signature_redeemscript(public_key))
+        )
+        for _ in range(2):
+            self.assertEqual(expected, utils.public_key_to_script_hash(public_key))
+
+        info = utils.address_cache_info()["public_key_to_script_hash"]
+        self.assertEqual(1, info.hits)
+        self.assertEqual(1, info.misses)
+
+    def test_bulk_conversion(self):
+        script_hashes = utils.public_keys_to_script_hashes(iter(self.public_keys))
+        self.assertEqual(
+            list(map(utils.public_key_to_script_hash, self.public_keys)), script_hashes
+        )
+        self.assertEqual(
+            list(map(utils.script_hash_to_address, script_hashes)),
+            utils.public_keys_to_addresses(self.public_keys),
+        )
+        self.assertEqual(
+            [utils.script_hash_to_address(script_hashes[0], 0x17)],
+            utils.public_keys_to_addresses(self.public_keys[:1], address_version=0x17),
+        )
+        self.assertEqual([], utils.public_keys_to_script_hashes([]))